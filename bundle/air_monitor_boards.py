@@ -0,0 +1,147 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# air_monitor_boards.py
+# 2026-10-18 v1.0.0
+
+# Board profile registry. Each supported board is a data record; the
+# monitor looks up its board by name, imports only that board's button
+# panel module, and sizes its fonts and display buffers from the record.
+# Supporting a new board means adding a record here.
+
+from collections import namedtuple
+
+BoardProfile = namedtuple(
+    "BoardProfile",
+    (
+        "match",  # Substring of os.uname().machine; first match wins
+        "panel",  # Button panel module with a Buttons class
+        "width",  # Display size, pixels
+        "height",
+        "fonts",  # Small and large font names in the fonts folder
+        "i2c_freq",  # I2C bus frequency for the SCD-30, Hz
+        "trend_points",  # CO2 trend chart data points
+        "speaker",  # True if the board has a speaker
+        "battery_pin",  # Battery monitor analog pin name; None if none
+        "neopixels",  # Number of NeoPixels; 0 if none
+    ),
+)
+
+SMALL_FONTS = ("OpenSans-9", "OpenSans-16")
+LARGE_FONTS = ("OpenSans-12", "Helvetica-Bold-36")
+
+# More specific names first. The SCD-30 needs a slow I2C bus; the CLUE
+# an extra slow one.
+BOARD_PROFILES = [
+    BoardProfile(
+        "Pygamer",
+        "air_monitor_buttons.buttons_pybadge",
+        160,
+        128,
+        SMALL_FONTS,
+        95000,
+        40,
+        True,
+        "A6",
+        5,
+    ),
+    BoardProfile(
+        "Pybadge",
+        "air_monitor_buttons.buttons_pybadge",
+        160,
+        128,
+        SMALL_FONTS,
+        95000,
+        40,
+        True,
+        "A6",
+        5,
+    ),
+    BoardProfile(
+        "EdgeBadge",
+        "air_monitor_buttons.buttons_pybadge",
+        160,
+        128,
+        SMALL_FONTS,
+        95000,
+        40,
+        True,
+        "A6",
+        5,
+    ),
+    BoardProfile(
+        "PyPortal Titano",
+        "air_monitor_buttons.buttons_pyportal",
+        480,
+        320,
+        LARGE_FONTS,
+        95000,
+        40,
+        True,
+        None,
+        1,
+    ),
+    BoardProfile(
+        "PyPortal",
+        "air_monitor_buttons.buttons_pyportal",
+        320,
+        240,
+        LARGE_FONTS,
+        95000,
+        40,
+        True,
+        None,
+        1,
+    ),
+    BoardProfile(
+        "CLUE",
+        "air_monitor_buttons.buttons_clue",
+        240,
+        240,
+        LARGE_FONTS,
+        25000,
+        40,
+        False,
+        None,
+        1,
+    ),
+    BoardProfile(
+        "FunHouse",
+        "air_monitor_buttons.buttons_funhouse",
+        240,
+        240,
+        LARGE_FONTS,
+        95000,
+        40,
+        False,
+        None,
+        0,
+    ),
+]
+
+
+def register_profile(profile):
+    """Add a profile ahead of the built-in ones, replacing any profile with
+    the same match name; used by the host computer's simulated board.
+    :param BoardProfile profile: The board's profile."""
+    for registered in BOARD_PROFILES:
+        if registered.match == profile.match:
+            BOARD_PROFILES.remove(registered)
+            break
+    BOARD_PROFILES.insert(0, profile)
+    return
+
+
+def find_profile(board_type):
+    """Returns the profile of the named board, or None if the board is not
+    supported.
+    :param str board_type: Board name, e.g. os.uname().machine."""
+    for profile in BOARD_PROFILES:
+        if profile.match in board_type:
+            return profile
+    return None
+
+
+def load_panel(profile):
+    """Import the profile's button panel module and return it."""
+    return __import__(profile.panel, None, None, ("Buttons",))
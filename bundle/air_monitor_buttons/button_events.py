@@ -0,0 +1,143 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# button_events.py
+# 2026-10-18 v1.0.0
+
+# Non-blocking button event decoder shared by the air monitor button panels.
+# Has no hardware imports so it can be exercised on a host computer with the
+# FakePin backend.
+
+import time
+
+PRESS = "press"
+HOLD = "hold"
+RELEASE = "release"
+
+
+class ButtonEvent:
+    def __init__(self, name, kind, duration=0.0):
+        """A button event.
+        :param str name: Button name, e.g. "calibrate".
+        :param str kind: PRESS, HOLD, or RELEASE.
+        :param float duration: Seconds the button has been held."""
+        self.name = name
+        self.kind = kind
+        self.duration = duration
+        return
+
+    def __repr__(self):
+        return "ButtonEvent(%r, %r, %.2f)" % (self.name, self.kind, self.duration)
+
+
+class ButtonEvents:
+    def __init__(self, hold_time=1.0, debounce=0.02, queue_size=8):
+        """Debouncing state machine that turns raw button states into PRESS,
+        HOLD, and RELEASE events held in a polled queue. Never sleeps.
+        :param float hold_time: Seconds before a HOLD event is issued.
+        :param float debounce: Seconds a raw state must be stable.
+        :param int queue_size: Maximum queued events; oldest are dropped."""
+        self._hold_time = hold_time
+        self._debounce = debounce
+        self._queue_size = queue_size
+        self._queue = []
+
+        self._raw = None  # Last raw reading
+        self._raw_since = 0.0
+        self._pressed = None  # Debounced button name
+        self._pressed_since = 0.0
+        self._hold_sent = False
+        return
+
+    @property
+    def hold_time(self):
+        """Seconds before a HOLD event is issued."""
+        return self._hold_time
+
+    @hold_time.setter
+    def hold_time(self, hold_time):
+        self._hold_time = hold_time
+
+    @property
+    def pressed(self):
+        """Name of the currently pressed (debounced) button or None."""
+        return self._pressed
+
+    def update(self, raw, now=None):
+        """Feed the current raw button state and return a list of the
+        events it produced. Events are also appended to the queue.
+        :param raw: Name of the button currently down, or None.
+        :param float now: Current time in seconds; time.monotonic() when
+        omitted."""
+        if now is None:
+            now = time.monotonic()
+        events = []
+        if raw != self._raw:
+            self._raw = raw
+            self._raw_since = now
+
+        if self._raw != self._pressed and now - self._raw_since >= self._debounce:
+            if self._pressed is not None:
+                events.append(
+                    ButtonEvent(self._pressed, RELEASE, now - self._pressed_since)
+                )
+            self._pressed = self._raw
+            self._pressed_since = now
+            self._hold_sent = False
+            if self._pressed is not None:
+                events.append(ButtonEvent(self._pressed, PRESS))
+
+        if (
+            self._pressed is not None
+            and not self._hold_sent
+            and now - self._pressed_since >= self._hold_time
+        ):
+            self._hold_sent = True
+            events.append(ButtonEvent(self._pressed, HOLD, now - self._pressed_since))
+
+        for event in events:
+            if len(self._queue) >= self._queue_size:
+                self._queue.pop(0)
+            self._queue.append(event)
+        return events
+
+    def get(self):
+        """Remove and return the oldest queued event, or None."""
+        if self._queue:
+            return self._queue.pop(0)
+        return None
+
+    def clear(self):
+        """Discard all queued events."""
+        self._queue = []
+        return
+
+
+def read_pins(pins):
+    """Return the name of the first active pin, or None.
+    :param pins: Sequence of (name, pin, active_value) tuples; pin is any
+    object with a boolean value attribute (DigitalInOut or FakePin)."""
+    for name, pin, active_value in pins:
+        if pin.value == active_value:
+            return name
+    return None
+
+
+class FakePin:
+    def __init__(self, active_value=False):
+        """Host-side stand-in for a DigitalInOut button input.
+        :param bool active_value: Pin value while pressed; False for pull-up
+        buttons."""
+        self._active_value = active_value
+        self.value = not active_value
+        return
+
+    def press(self):
+        """Simulate pressing the button."""
+        self.value = self._active_value
+        return
+
+    def release(self):
+        """Simulate releasing the button."""
+        self.value = not self._active_value
+        return
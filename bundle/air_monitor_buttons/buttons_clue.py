@@ -2,12 +2,16 @@
 # SPDX-License-Identifier: MIT
 
 # buttons_clue.py
-# 2021-09-14 v1.0.1
+# 2026-10-18 v1.1.0
+
+# v1.1.0: non-blocking press/hold/release events (button_events)
 
 import board
-import time
 from digitalio import DigitalInOut, Pull, Direction
 from simpleio import tone
+from air_monitor_buttons.button_events import ButtonEvents, read_pins
+from air_monitor_buttons.button_events import PRESS, HOLD, RELEASE
+
 
 class Buttons:
     def __init__(self):
@@ -15,6 +19,7 @@ class Buttons:
         CLUE device."""
 
         self._timeout = 1
+        self._events = ButtonEvents(hold_time=self._timeout)
         self._WIDTH = board.DISPLAY.width
         self._HEIGHT = board.DISPLAY.height
 
@@ -28,6 +33,11 @@ class Buttons:
         self._BUTTON_LANGUAGE = DigitalInOut(board.BUTTON_A)  # A
         self._BUTTON_LANGUAGE.direction = Direction.INPUT
         self._BUTTON_LANGUAGE.pull = Pull.UP
+        self._pins = (
+            ("calibrate", self._BUTTON_CALIBRATE, False),
+            ("language", self._BUTTON_LANGUAGE, False),
+            ("temperature", self._BUTTON_TEMPERATURE, False),
+        )
 
         self._button_group = False
         return
@@ -49,37 +59,40 @@ class Buttons:
             "Invalid button timeout duration value. Must be between 0 and 10 seconds."
             return
         self._timeout = hold_time
+        self._events.hold_time = hold_time
         return
 
+    @property
+    def events(self):
+        """Button event queue (ButtonEvents)."""
+        return self._events
+
+    def poll(self):
+        """Sample the buttons without blocking, update button feedback, and
+        return the list of new events. Events are also queued."""
+        events = self._events.update(self._read_raw())
+        for event in events:
+            self._feedback(event)
+        return events
+
     def read_buttons(self):
-        self._button_pressed = None
-        self._hold_time = 0
+        """Non-blocking. Returns the button name and hold time when a button
+        is released, otherwise None and 0."""
+        self.poll()
+        event = self._events.get()
+        while event:
+            if event.kind == RELEASE:
+                return event.name, event.duration
+            event = self._events.get()
+        return None, 0
 
-        if not self._BUTTON_CALIBRATE.value:
-            tone(board.A0, 1319, 0.030)  # E6
-            self._button_pressed = "calibrate"
-            print(self._button_pressed)
-            while not self._BUTTON_CALIBRATE.value:
-                time.sleep(0.1)
-                self._hold_time += 0.1
-                if self._hold_time >= self._timeout:
-                    tone(board.A0, 1175, 0.030)  # D6
-        if not self._BUTTON_LANGUAGE.value:
-            tone(board.A0, 1319, 0.030)  # E6
-            self._button_pressed = "language"
-            print(self._button_pressed)
-            while not self._BUTTON_LANGUAGE.value:
-                time.sleep(0.1)
-                self._hold_time += 0.1
-                if self._hold_time >= self._timeout:
-                    tone(board.A0, 1175, 0.030)  # D6
-        if not self._BUTTON_TEMPERATURE.value:
+    def _read_raw(self):
+        return read_pins(self._pins)
+
+    def _feedback(self, event):
+        if event.kind == PRESS:
             tone(board.A0, 1319, 0.030)  # E6
-            self._button_pressed = "temperature"
-            print(self._button_pressed)
-            while not self._BUTTON_TEMPERATURE.value:
-                time.sleep(0.1)
-                self._hold_time += 0.1
-                if self._hold_time >= self._timeout:
-                    tone(board.A0, 1175, 0.030)  # D6
-        return self._button_pressed, self._hold_time
+            print(event.name)
+        elif event.kind == HOLD:
+            tone(board.A0, 1175, 0.030)  # D6
+        return
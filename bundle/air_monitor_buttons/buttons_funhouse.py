@@ -2,13 +2,16 @@
 # SPDX-License-Identifier: MIT
 
 # buttons_funhome.py
-# 2021-09-15 v1.0.1
+# 2026-10-18 v1.1.0
+
+# v1.1.0: non-blocking press/hold/release events (button_events)
 
 import board
-import time
 from digitalio import DigitalInOut, Pull, Direction
 import displayio
 from adafruit_display_shapes.rect import Rect
+from air_monitor_buttons.button_events import ButtonEvents, read_pins
+from air_monitor_buttons.button_events import PRESS, HOLD, RELEASE
 
 
 class Buttons:
@@ -17,6 +20,7 @@ class Buttons:
         FunHouse device. Builds displayio button group."""
 
         self._timeout = 1
+        self._events = ButtonEvents(hold_time=self._timeout)
         self._WIDTH = board.DISPLAY.width
         self._HEIGHT = board.DISPLAY.height
 
@@ -30,6 +34,11 @@ class Buttons:
         self._BUTTON_LANGUAGE = DigitalInOut(board.BUTTON_UP)  # Down
         self._BUTTON_LANGUAGE.direction = Direction.INPUT
         self._BUTTON_LANGUAGE.pull = Pull.DOWN
+        self._pins = (
+            ("calibrate", self._BUTTON_CALIBRATE, True),
+            ("language", self._BUTTON_LANGUAGE, True),
+            ("temperature", self._BUTTON_TEMPERATURE, True),
+        )
 
         # Build displayio button group
         self._button_group = displayio.Group()
@@ -87,37 +96,42 @@ class Buttons:
             "Invalid button timeout duration value. Must be between 0 and 10 seconds."
             return
         self._timeout = hold_time
+        self._events.hold_time = hold_time
         return
 
+    @property
+    def events(self):
+        """Button event queue (ButtonEvents)."""
+        return self._events
+
+    def poll(self):
+        """Sample the buttons without blocking, update button feedback, and
+        return the list of new events. Events are also queued."""
+        events = self._events.update(self._read_raw())
+        for event in events:
+            self._feedback(event)
+        return events
+
     def read_buttons(self):
-        self._button_pressed = None
-        self._hold_time = 0
-
-        if self._BUTTON_CALIBRATE.value:
-            self._button_pressed = "calibrate"
-            self.calibrate_button.outline = 0x0000FF
-            while self._BUTTON_CALIBRATE.value:
-                time.sleep(0.1)
-                self._hold_time += 0.1
-                if self._hold_time >= self._timeout:
-                    self.calibrate_button.outline = 0x00FF00
-        if self._BUTTON_LANGUAGE.value:
-            self._button_pressed = "language"
-            self.language_button.outline = 0x0000FF
-            while self._BUTTON_LANGUAGE.value:
-                time.sleep(0.1)
-                self._hold_time += 0.1
-                if self._hold_time >= self._timeout:
-                    self.language_button.outline = 0x00FF00
-        if self._BUTTON_TEMPERATURE.value:
-            self._button_pressed = "temperature"
-            self.temperature_button.outline = 0x0000FF
-            while self._BUTTON_TEMPERATURE.value:
-                time.sleep(0.1)
-                self._hold_time += 0.1
-                if self._hold_time >= self._timeout:
-                    self.temperature_button.outline = 0x00FF00
-        self.calibrate_button.outline = None
-        self.language_button.outline = None
-        self.temperature_button.outline = None
-        return self._button_pressed, self._hold_time
+        """Non-blocking. Returns the button name and hold time when a button
+        is released, otherwise None and 0."""
+        self.poll()
+        event = self._events.get()
+        while event:
+            if event.kind == RELEASE:
+                return event.name, event.duration
+            event = self._events.get()
+        return None, 0
+
+    def _read_raw(self):
+        return read_pins(self._pins)
+
+    def _feedback(self, event):
+        button = getattr(self, event.name + "_button")
+        if event.kind == PRESS:
+            button.outline = 0x0000FF
+        elif event.kind == HOLD:
+            button.outline = 0x00FF00
+        else:
+            button.outline = None
+        return
@@ -2,16 +2,18 @@
 # SPDX-License-Identifier: MIT
 
 # buttons_pybadge.py
-# 2021-09-14 v1.0.1
+# 2026-10-18 v1.1.0
+
+# v1.1.0: non-blocking press/hold/release events (button_events)
 
 import board
-import time
 from digitalio import DigitalInOut
 from analogio import AnalogIn
 import displayio
 from adafruit_display_shapes.rect import Rect
 from gamepadshift import GamePadShift
 from simpleio import tone
+from air_monitor_buttons.button_events import ButtonEvents, PRESS, HOLD, RELEASE
 
 # from keypad import ShiftRegisterKeys  # CircuitPython v7.0.0
 # https://circuitpython.readthedocs.io/en/latest/shared-bindings/keypad/index.html#module-keypad
@@ -23,6 +25,7 @@ class Buttons:
         PyBadge/PyGamer/EdgeBadge device. Builds displayio button group."""
 
         self._timeout = 1
+        self._events = ButtonEvents(hold_time=self._timeout)
         self._WIDTH = board.DISPLAY.width
         self._HEIGHT = board.DISPLAY.height
 
@@ -93,32 +96,50 @@ class Buttons:
             "Invalid button timeout duration value. Must be between 0 and 10 seconds."
             return
         self._timeout = hold_time
+        self._events.hold_time = hold_time
         return
 
+    @property
+    def events(self):
+        """Button event queue (ButtonEvents)."""
+        return self._events
+
+    def poll(self):
+        """Sample the buttons without blocking, update button feedback, and
+        return the list of new events. Events are also queued."""
+        events = self._events.update(self._read_raw())
+        for event in events:
+            self._feedback(event)
+        return events
+
     def read_buttons(self):
-        self._button_pressed = None
-        self._hold_time = 0
-        self._buttons = self._panel.get_pressed()
-        if self._buttons:
+        """Non-blocking. Returns the button name and hold time when a button
+        is released, otherwise None and 0."""
+        self.poll()
+        event = self._events.get()
+        while event:
+            if event.kind == RELEASE:
+                return event.name, event.duration
+            event = self._events.get()
+        return None, 0
+
+    def _read_raw(self):
+        buttons = self._panel.get_pressed()
+        if buttons & self._BUTTON_CALIBRATE:
+            return "calibrate"
+        if buttons & self._BUTTON_LANGUAGE:
+            return "language"
+        if buttons & self._BUTTON_TEMPERATURE:
+            return "temperature"
+        return None
+
+    def _feedback(self, event):
+        button = getattr(self, event.name + "_button")
+        if event.kind == PRESS:
             tone(board.A0, 1319, 0.030)  # E6
-            if self._buttons & self._BUTTON_CALIBRATE:
-                self._button_pressed = "calibrate"
-                self.calibrate_button.outline = 0x0000FF
-            if self._buttons & self._BUTTON_LANGUAGE:
-                self._button_pressed = "language"
-                self.language_button.outline = 0x0000FF
-            if self._buttons & self._BUTTON_TEMPERATURE:
-                self._button_pressed = "temperature"
-                self.temperature_button.outline = 0x0000FF
-            self._timeout_beep = False
-            while self._buttons:
-                self._buttons = self._panel.get_pressed()
-                time.sleep(0.1)
-                self._hold_time += 0.1
-                if self._hold_time >= self._timeout and not self._timeout_beep:
-                    tone(board.A0, 1175, 0.030)  # D6
-                    self._timeout_beep = True
-            self.calibrate_button.outline = None
-            self.language_button.outline = None
-            self.temperature_button.outline = None
-        return self._button_pressed, self._hold_time
+            button.outline = 0x0000FF
+        elif event.kind == HOLD:
+            tone(board.A0, 1175, 0.030)  # D6
+        else:
+            button.outline = None
+        return
@@ -2,10 +2,11 @@
 # SPDX-License-Identifier: MIT
 
 # buttons_pyportal.py
-# 2021-09-14 v1.0.1
+# 2026-10-18 v1.1.0
+
+# v1.1.0: non-blocking press/hold/release events (button_events)
 
 import board
-import time
 
 # from digitalio import DigitalInOut
 # from analogio import AnalogIn
@@ -13,6 +14,7 @@ import displayio
 from adafruit_button import Button
 import adafruit_touchscreen
 from simpleio import tone
+from air_monitor_buttons.button_events import ButtonEvents, PRESS, HOLD, RELEASE
 
 
 class Buttons:
@@ -21,6 +23,7 @@ class Buttons:
         Builds displayio button group."""
 
         self._timeout = 1
+        self._events = ButtonEvents(hold_time=self._timeout)
         self._WIDTH = board.DISPLAY.width
         self._HEIGHT = board.DISPLAY.height
 
@@ -103,24 +106,48 @@ class Buttons:
             "Invalid button timeout duration value. Must be between 0 and 10 seconds."
             return
         self._timeout = hold_time
+        self._events.hold_time = hold_time
         return
 
+    @property
+    def events(self):
+        """Button event queue (ButtonEvents)."""
+        return self._events
+
+    def poll(self):
+        """Sample the buttons without blocking, update button feedback, and
+        return the list of new events. Events are also queued."""
+        events = self._events.update(self._read_raw())
+        for event in events:
+            self._feedback(event)
+        return events
+
     def read_buttons(self):
-        self._button_pressed = None
-        self._hold_time = 0
-        self._touch = self._ts.touch_point
-        if self._touch:
-            for self._button in self._buttons:
-                if self._button.contains(self._touch):
-                    self._button.selected = True
-                    tone(board.A0, 1319, 0.030)  # E6
-                    self._button_pressed = self._button.name
-                    self._timeout_beep = False
-                    while self._ts.touch_point:
-                        time.sleep(0.1)
-                        self._hold_time += 0.1
-                        if self._hold_time >= self._timeout and not self._timeout_beep:
-                            tone(board.A0, 1175, 0.030)  # D6
-                            self._timeout_beep = True
-                    self._button.selected = False
-        return self._button_pressed, self._hold_time
+        """Non-blocking. Returns the button name and hold time when a button
+        is released, otherwise None and 0."""
+        self.poll()
+        event = self._events.get()
+        while event:
+            if event.kind == RELEASE:
+                return event.name, event.duration
+            event = self._events.get()
+        return None, 0
+
+    def _read_raw(self):
+        touch = self._ts.touch_point
+        if touch:
+            for button in self._buttons:
+                if button.contains(touch):
+                    return button.name
+        return None
+
+    def _feedback(self, event):
+        button = getattr(self, event.name + "_button")
+        if event.kind == PRESS:
+            button.selected = True
+            tone(board.A0, 1319, 0.030)  # E6
+        elif event.kind == HOLD:
+            tone(board.A0, 1175, 0.030)  # D6
+        else:
+            button.selected = False
+        return
@@ -0,0 +1,180 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# air_monitor_datalog.py
+# 2026-10-18 v1.0.0
+
+# Sensor datalogger: fixed-size packed records in a preallocated circular
+# file. A small header holds the head index and record count, so each write
+# is O(1) and the file never grows. On CircuitPython the filesystem must be
+# made writable from boot.py, e.g. storage.remount("/", readonly=False).
+
+import struct
+
+MAGIC = b"AQLG"
+VERSION = 1
+HEADER_FORMAT = "<4sHHIII"  # magic, version, record size, capacity, head, count
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+# seconds, CO2 ppm, RH 0.01 %, temperature 0.01 degC, battery millivolts
+RECORD_FORMAT = "<IHHhH"
+RECORD_SIZE = struct.calcsize(RECORD_FORMAT)
+
+
+class Datalog:
+    def __init__(self, path, capacity=8640, sync_interval=10):
+        """Open or create a circular datalog file.
+        :param str path: Datalog file path.
+        :param int capacity: Number of records when creating a new file;
+        8640 is one day of 10-second samples. An existing file keeps its
+        own capacity.
+        :param int sync_interval: Records between header updates and
+        flushes. Higher values mean fewer flash writes; up to this many
+        records may be lost on power failure."""
+        self._path = path
+        self._sync_interval = sync_interval
+        self._unsynced = 0
+        self._record = bytearray(RECORD_SIZE)
+
+        try:
+            self._file = open(path, "r+b")
+        except OSError:
+            self._create(capacity)
+            return
+        header = self._file.read(HEADER_SIZE)
+        if len(header) < HEADER_SIZE:
+            self._file.close()
+            raise ValueError("Truncated datalog file: " + path)
+        header = struct.unpack(HEADER_FORMAT, header)
+        if header[0] != MAGIC or header[1] != VERSION or header[2] != RECORD_SIZE:
+            self._file.close()
+            raise ValueError("Incompatible datalog file: " + path)
+        self._capacity, self._head, self._count = header[3:]
+        return
+
+    def _create(self, capacity):
+        self._capacity = capacity
+        self._head = 0
+        self._count = 0
+        self._file = open(self._path, "w+b")
+        self._file.write(self._header())
+        # Preallocate in small chunks to limit RAM use
+        chunk = bytes(RECORD_SIZE * 64)
+        for _ in range(capacity // 64):
+            self._file.write(chunk)
+        self._file.write(bytes(RECORD_SIZE * (capacity % 64)))
+        self._file.flush()
+        return
+
+    def _header(self):
+        return struct.pack(
+            HEADER_FORMAT,
+            MAGIC,
+            VERSION,
+            RECORD_SIZE,
+            self._capacity,
+            self._head,
+            self._count,
+        )
+
+    @property
+    def capacity(self):
+        """Maximum number of records held."""
+        return self._capacity
+
+    @property
+    def count(self):
+        """Number of records held."""
+        return self._count
+
+    def append(self, timestamp, co2, humidity, temperature, battery_volts=0.0):
+        """Write one record over the oldest.
+        :param timestamp: Seconds, e.g. time.time().
+        :param co2: CO2 concentration, ppm.
+        :param humidity: Relative humidity, percent.
+        :param temperature: Temperature, degrees Celsius.
+        :param battery_volts: Battery voltage; 0 when not monitored."""
+        struct.pack_into(
+            RECORD_FORMAT,
+            self._record,
+            0,
+            int(timestamp),
+            min(max(int(co2), 0), 0xFFFF),
+            min(max(int(humidity * 100), 0), 0xFFFF),
+            min(max(int(temperature * 100), -0x8000), 0x7FFF),
+            min(max(int(battery_volts * 1000), 0), 0xFFFF),
+        )
+        self._file.seek(HEADER_SIZE + self._head * RECORD_SIZE)
+        self._file.write(self._record)
+        self._head = (self._head + 1) % self._capacity
+        self._count = min(self._count + 1, self._capacity)
+
+        self._unsynced += 1
+        if self._unsynced >= self._sync_interval:
+            self.sync()
+        return
+
+    def sync(self):
+        """Write the header and flush buffered records to the file."""
+        self._file.seek(0)
+        self._file.write(self._header())
+        self._file.flush()
+        self._unsynced = 0
+        return
+
+    def close(self):
+        """Sync and close the datalog file."""
+        self.sync()
+        self._file.close()
+        return
+
+
+def read_datalog(path):
+    """Host computer reader. Memory-maps a datalog file and returns a NumPy
+    structured array of the records in file (ring) order without copying,
+    plus the head index and record count. The oldest record is at head when
+    the log is full, otherwise at index 0; use chronological() for an
+    ordered, scaled copy."""
+    import numpy as np
+
+    with open(path, "rb") as log:
+        header = struct.unpack(HEADER_FORMAT, log.read(HEADER_SIZE))
+    if header[0] != MAGIC or header[1] != VERSION or header[2] != RECORD_SIZE:
+        raise ValueError("Incompatible datalog file: " + path)
+    capacity, head, count = header[3:]
+    records = np.memmap(
+        path, dtype=record_dtype(), mode="r", offset=HEADER_SIZE, shape=(capacity,)
+    )
+    return records, head, count
+
+
+def record_dtype():
+    """NumPy dtype matching RECORD_FORMAT."""
+    import numpy as np
+
+    return np.dtype(
+        [
+            ("timestamp", "<u4"),
+            ("co2", "<u2"),
+            ("humidity", "<u2"),
+            ("temperature", "<i2"),
+            ("battery", "<u2"),
+        ]
+    )
+
+
+def chronological(records, head, count):
+    """Returns a dict of oldest-first NumPy arrays in engineering units:
+    timestamp (s), co2 (ppm), humidity (%), temperature (degC), battery (V)."""
+    import numpy as np
+
+    if count < len(records):
+        ordered = records[:count]
+    else:
+        ordered = np.concatenate((records[head:], records[:head]))
+    return {
+        "timestamp": ordered["timestamp"].astype(np.int64),
+        "co2": ordered["co2"].astype(np.float64),
+        "humidity": ordered["humidity"] / 100.0,
+        "temperature": ordered["temperature"] / 100.0,
+        "battery": ordered["battery"] / 1000.0,
+    }
@@ -0,0 +1,129 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# background.py
+# 2026-10-18 v1.1.0
+
+# Static screen layer: rectangles and text drawn into a few bitmaps
+# instead of one displayio object each. The display composites one
+# TileGrid per region for everything that does not change between sensor
+# readings; redraw it only when its content changes (language or
+# temperature unit toggled, a sensor detected). Only the regions that hold
+# static content (e.g. the scale strips and the caption rows) have
+# bitmaps, so a large display does not pay for a full-screen bitmap. The
+# bitmaps are allocated once; clear() and redrawing reuse them.
+
+import displayio
+from air_monitor_display.fixed_label import text_box
+
+try:
+    from bitmaptools import fill_region  # CircuitPython v7.0.0
+except ImportError:
+    fill_region = None
+
+
+class Background:
+    def __init__(self, regions, colors=16):
+        """Instantiate a transparent background layer.
+        :param regions: (x, y, width, height) screen rectangles that may
+        hold static content; drawing outside them is clipped away.
+        :param int colors: Palette size, including transparent; 16 (4 bits
+        per pixel) by default."""
+        self._palette = displayio.Palette(colors)
+        self._palette.make_transparent(0)
+        self._colors = [None]  # Color of each palette index in use
+        self._group = displayio.Group()
+        self._regions = []  # (x, y, bitmap) of each region
+        for x, y, width, height in regions:
+            bitmap = displayio.Bitmap(width, height, colors)
+            tile_grid = displayio.TileGrid(bitmap, pixel_shader=self._palette)
+            tile_grid.x, tile_grid.y = x, y
+            self._group.append(tile_grid)
+            self._regions.append((x, y, bitmap))
+        return
+
+    @property
+    def group(self):
+        """Background group; append to the bottom of the display group."""
+        return self._group
+
+    @property
+    def size(self):
+        """Bitmap pixels allocated for all regions."""
+        return sum(bitmap.width * bitmap.height for _, _, bitmap in self._regions)
+
+    def clear(self):
+        """Make the whole layer transparent and free the palette."""
+        for _, _, bitmap in self._regions:
+            bitmap.fill(0)
+        self._colors = [None]
+        return
+
+    def rect(self, x, y, width, height, fill=None, outline=None, stroke=1):
+        """Draw a rectangle like adafruit_display_shapes Rect; the outline is
+        drawn inside the rectangle's bounds."""
+        if outline is not None:
+            self._fill(x, y, width, height, self._index(outline))
+            x, y = x + stroke, y + stroke
+            width, height = width - 2 * stroke, height - 2 * stroke
+        if fill is not None:
+            self._fill(x, y, width, height, self._index(fill))
+        return
+
+    def text(self, font, text, color, anchor_point=(0, 0), anchored_position=(0, 0)):
+        """Draw text positioned like an adafruit_display_text label."""
+        baseline, height = text_box(font, (text,))
+        glyphs = [font.get_glyph(ord(c)) for c in text]
+        width = sum(glyph.shift_x for glyph in glyphs if glyph)
+        left = anchored_position[0] - round(anchor_point[0] * width)
+        top = anchored_position[1] - round(anchor_point[1] * height)
+        index = self._index(color)
+        for region_x, region_y, bitmap in self._regions:
+            if (
+                top >= region_y + bitmap.height
+                or top + height <= region_y
+                or left >= region_x + bitmap.width
+                or left + width <= region_x
+            ):
+                continue  # The text's box misses this region
+            x = left - region_x
+            for glyph in glyphs:
+                if glyph is None:
+                    continue
+                x1 = glyph.tile_index * glyph.width
+                glyph_x = x + glyph.dx
+                y = top - region_y + baseline - glyph.height - glyph.dy
+                for row in range(glyph.height):
+                    if 0 <= y + row < bitmap.height:
+                        for column in range(glyph.width):
+                            if glyph.bitmap[x1 + column, row] and (
+                                0 <= glyph_x + column < bitmap.width
+                            ):
+                                bitmap[glyph_x + column, y + row] = index
+                x += glyph.shift_x
+        return
+
+    def _index(self, color):
+        if color in self._colors:
+            return self._colors.index(color)
+        if len(self._colors) == len(self._palette):
+            raise ValueError("Background palette is full")
+        self._colors.append(color)
+        self._palette[len(self._colors) - 1] = color
+        return len(self._colors) - 1
+
+    def _fill(self, x, y, width, height, index):
+        for region_x, region_y, bitmap in self._regions:
+            # Clip to the region's bitmap
+            x1, y1 = max(x - region_x, 0), max(y - region_y, 0)
+            x2 = min(x + width - region_x, bitmap.width)
+            y2 = min(y + height - region_y, bitmap.height)
+            if x2 <= x1 or y2 <= y1:
+                continue
+            if fill_region:
+                fill_region(bitmap, x1, y1, x2, y2, index)
+                continue
+            for row in range(y1, y2):
+                for column in range(x1, x2):
+                    bitmap[column, row] = index
+        return
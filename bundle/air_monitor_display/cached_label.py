@@ -0,0 +1,74 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# cached_label.py
+# 2026-10-18 v1.0.0
+
+# Text label wrapper that skips assignments of unchanged text or color.
+# Setting a label's text rebuilds its glyph tiles and marks its area for
+# refresh even when the string is the same, which most sensor frames are.
+
+import time
+
+
+class CachedLabel:
+    # Totals for all cached labels since the last reset_stats()
+    relayouts = 0
+    skipped = 0
+    _since = time.monotonic()
+
+    def __init__(self, label):
+        """Wrap a displayio text label so that assigning an unchanged text
+        or color value does not re-layout glyphs or mark the display area
+        dirty. Append the wrapped label (the label property) to a group.
+        :param label: adafruit_display_text label."""
+        self._label = label
+        self._text = label.text
+        self._color = label.color
+        return
+
+    @property
+    def label(self):
+        """The wrapped label."""
+        return self._label
+
+    @property
+    def text(self):
+        """Label text; only re-laid out when changed."""
+        return self._text
+
+    @text.setter
+    def text(self, text):
+        if text == self._text:
+            CachedLabel.skipped += 1
+            return
+        self._text = text
+        self._label.text = text
+        CachedLabel.relayouts += 1
+
+    @property
+    def color(self):
+        """Label color; only updated when changed."""
+        return self._color
+
+    @color.setter
+    def color(self, color):
+        if color == self._color:
+            return
+        self._color = color
+        self._label.color = color
+
+    @classmethod
+    def stats(cls):
+        """Returns total relayouts, skipped relayouts, and skipped relayouts
+        per hour since the last reset."""
+        hours = max(time.monotonic() - cls._since, 1) / 3600
+        return cls.relayouts, cls.skipped, cls.skipped / hours
+
+    @classmethod
+    def reset_stats(cls):
+        """Clear the relayout counters."""
+        cls.relayouts = 0
+        cls.skipped = 0
+        cls._since = time.monotonic()
+        return
@@ -0,0 +1,165 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# digit_readout.py
+# 2026-10-18 v1.0.0
+
+# Numeric readout drawn from a digit sprite sheet. The digits 0 to 9, a
+# minus sign, and a blank are rasterized from a font into one bitmap at
+# instantiation; a TileGrid shows one sprite per character cell. Setting
+# a value extracts its digits arithmetically and writes only the tile
+# indices that changed, so an update allocates no string and looks up no
+# glyphs.
+
+import displayio
+from air_monitor_display.fixed_label import text_box, draw_glyph
+
+SPRITES = "0123456789- "  # Sprite sheet order; a digit is its own index
+MINUS = 10
+BLANK = 11
+
+
+class DigitReadout(displayio.Group):
+    def __init__(self, font, digits, value=None, color=0xFFFFFF):
+        """Instantiate an integer readout. Set anchor_point and
+        anchored_position as with adafruit_display_text labels; a value
+        with fewer digits than the readout is aligned within it by the
+        anchor point's x value (0 left, 0.5 center, 1 right).
+        :param font: bitmap_font or GlyphFont font.
+        :param int digits: Character cells, including a minus sign for
+        negative values. Values too wide for the readout show dashes.
+        :param int value: Initial value; None shows dashes.
+        :param int color: Digit color."""
+        super().__init__()
+        if hasattr(font, "load_glyphs"):
+            font.load_glyphs({ord(c) for c in SPRITES})
+        baseline, tile_height = text_box(font, (SPRITES,))
+        glyphs = [font.get_glyph(ord(c)) for c in SPRITES]
+        self._tile_width = max(glyph.shift_x for glyph in glyphs if glyph)
+        sheet = displayio.Bitmap(self._tile_width * len(SPRITES), tile_height, 2)
+        for index, glyph in enumerate(glyphs):
+            if glyph is not None:
+                # Center proportional glyphs in their cells
+                x = (self._tile_width - glyph.shift_x) // 2 + glyph.dx
+                x += index * self._tile_width
+                draw_glyph(sheet, glyph, x, baseline - glyph.height - glyph.dy)
+
+        self._palette = displayio.Palette(2)
+        self._palette[0] = 0x000000
+        self._palette.make_transparent(0)
+        self._palette[1] = color
+        self._color = color
+        self._digits = digits
+        self._grid = displayio.TileGrid(
+            sheet,
+            pixel_shader=self._palette,
+            width=digits,
+            height=1,
+            tile_width=self._tile_width,
+            tile_height=tile_height,
+            default_tile=BLANK,
+        )
+        self.append(self._grid)
+        self._tiles = bytearray([BLANK] * digits)  # Shown tile indices
+        self._cells = bytearray(digits)  # Scratch; characters right to left
+
+        self._anchor_point = (0, 0)
+        self._anchored_position = (0, 0)
+        self._value = value
+        self._show(value)
+        return
+
+    @property
+    def width(self):
+        """Readout width in pixels."""
+        return self._tile_width * self._digits
+
+    @property
+    def height(self):
+        """Readout height in pixels; the tallest sprite."""
+        return self._grid.tile_height
+
+    @property
+    def value(self):
+        """Displayed integer; None for dashes."""
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        if value == self._value:
+            return
+        self._value = value
+        self._show(value)
+
+    @property
+    def color(self):
+        """Digit color."""
+        return self._color
+
+    @color.setter
+    def color(self, color):
+        if color == self._color:
+            return
+        self._color = color
+        self._palette[1] = color
+
+    @property
+    def anchor_point(self):
+        """Anchor point (x, y) as fractions of the readout width and height."""
+        return self._anchor_point
+
+    @anchor_point.setter
+    def anchor_point(self, point):
+        self._anchor_point = point
+        self._place()
+        self._show(self._value)  # Realign within the cells
+
+    @property
+    def anchored_position(self):
+        """Screen position (x, y) of the anchor point."""
+        return self._anchored_position
+
+    @anchored_position.setter
+    def anchored_position(self, position):
+        self._anchored_position = position
+        self._place()
+
+    def _show(self, value):
+        # Characters right to left into the scratch cells, then the tiles
+        cells = self._cells
+        count = 0
+        if value is not None:
+            magnitude = abs(value)
+            while count < self._digits:
+                cells[count] = magnitude % 10
+                magnitude //= 10
+                count += 1
+                if magnitude == 0:
+                    break
+            if value < 0 and count < self._digits:
+                cells[count] = MINUS
+                count += 1
+            elif magnitude or value < 0:
+                count = 0  # Does not fit
+        if count == 0:
+            for count in range(1, self._digits + 1):
+                cells[count - 1] = MINUS
+        offset = (self._digits - count) * self._anchor_point[0]
+        start = int(offset)
+        shift = round((offset - start) * self._tile_width)  # Part of a cell
+        if shift != self._grid.x:
+            self._grid.x = shift
+        for column in range(self._digits):
+            if start <= column < start + count:
+                tile = cells[start + count - 1 - column]
+            else:
+                tile = BLANK
+            if tile != self._tiles[column]:
+                self._tiles[column] = tile
+                self._grid[column] = tile
+        return
+
+    def _place(self):
+        self.x = self._anchored_position[0] - round(self._anchor_point[0] * self.width)
+        self.y = self._anchored_position[1] - round(self._anchor_point[1] * self.height)
+        return
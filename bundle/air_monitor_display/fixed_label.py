@@ -0,0 +1,198 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# fixed_label.py
+# 2026-10-18 v1.0.0
+
+# Single-bitmap text label with a bitmap allocated once. Like
+# adafruit_display_text.bitmap_label, glyphs are copied into one bitmap
+# instead of one TileGrid per glyph, but the bitmap is sized at
+# instantiation for the widest of the strings the label will show (every
+# translation, the longest value), so changing the text only clears and
+# redraws pixels; no bitmap or tile is allocated after startup.
+
+import displayio
+
+try:
+    from bitmaptools import blit  # CircuitPython 9
+except ImportError:
+    blit = None
+
+
+def text_box(font, texts):
+    """Returns the baseline row and height of a box holding any of texts,
+    laid out like an adafruit_display_text label: from the highest to the
+    lowest glyph pixel, extended to the line's center (half the font ascent
+    above the baseline)."""
+    if hasattr(font, "ascent"):
+        ascent = font.ascent
+    else:
+        _, height, _, y_offset = font.get_bounding_box()
+        ascent = height + y_offset
+    top = bottom = -(ascent // 2)  # Relative to the baseline
+    for text in texts:
+        for character in text:
+            glyph = font.get_glyph(ord(character))
+            if glyph is not None:
+                top = min(top, -glyph.height - glyph.dy)
+                bottom = max(bottom, -glyph.dy)
+    return -top, bottom - top
+
+
+def draw_glyph(bitmap, glyph, x, y):
+    """Set the pixels of a font glyph in a two-color bitmap, with the glyph
+    bitmap's upper-left corner at (x, y); clipped to the bitmap. Copies
+    with bitmaptools.blit or, before CircuitPython 9, Bitmap.blit; pixel by
+    pixel only where neither exists (Blinka)."""
+    left, top = max(-x, 0), max(-y, 0)
+    right = min(glyph.width, bitmap.width - x)
+    bottom = min(glyph.height, bitmap.height - y)
+    if right <= left or bottom <= top:
+        return
+    x1 = glyph.tile_index * glyph.width  # Glyph's tile in its font bitmap
+    if blit:
+        blit(
+            bitmap,
+            glyph.bitmap,
+            x + left,
+            y + top,
+            x1=x1 + left,
+            y1=top,
+            x2=x1 + right,
+            y2=bottom,
+            skip_source_index=0,  # Keep overlapping neighbor glyphs
+        )
+        return
+    if hasattr(bitmap, "blit"):  # CircuitPython 7 and 8
+        bitmap.blit(
+            x + left,
+            y + top,
+            glyph.bitmap,
+            x1=x1 + left,
+            y1=top,
+            x2=x1 + right,
+            y2=bottom,
+            skip_index=0,
+        )
+        return
+    for row in range(top, bottom):
+        for column in range(left, right):
+            if glyph.bitmap[x1 + column, row]:
+                bitmap[x + column, y + row] = 1
+    return
+
+
+class FixedLabel(displayio.Group):
+    def __init__(self, font, texts, text="", color=0xFFFFFF):
+        """Instantiate a label sized for the widest of texts. Set
+        anchor_point and anchored_position as with adafruit_display_text
+        labels; text narrower than the bitmap is aligned within it by the
+        anchor point's x value (0 left, 0.5 center, 1 right).
+        :param font: bitmap_font or GlyphFont font.
+        :param texts: Every string the label will show; longer text is
+        clipped.
+        :param str text: Initial text.
+        :param int color: Text color; None for transparent."""
+        super().__init__()
+        self._font = font
+        if hasattr(font, "load_glyphs"):
+            font.load_glyphs({ord(c) for c in "".join(texts) + text})
+        self._baseline, height = text_box(font, tuple(texts) + (text,))
+
+        width = max([self._text_width(t) for t in texts] + [1])
+        self._bitmap = displayio.Bitmap(width, max(height, 1), 2)
+        self._palette = displayio.Palette(2)
+        self._palette[0] = 0x000000
+        self._palette.make_transparent(0)
+        self._color = None
+        self.color = color
+        self.append(displayio.TileGrid(self._bitmap, pixel_shader=self._palette))
+
+        self._anchor_point = (0, 0)
+        self._anchored_position = (0, 0)
+        self._text = None
+        self.text = text
+        return
+
+    @property
+    def width(self):
+        """Bitmap width in pixels; the widest text."""
+        return self._bitmap.width
+
+    @property
+    def height(self):
+        """Bitmap height in pixels; the tallest text."""
+        return self._bitmap.height
+
+    @property
+    def text(self):
+        """Label text."""
+        return self._text
+
+    @text.setter
+    def text(self, text):
+        if text == self._text:
+            return
+        self._text = text
+        self._bitmap.fill(0)
+        x = int((self.width - self._text_width(text)) * self._anchor_point[0])
+        for character in text:
+            glyph = self._font.get_glyph(ord(character))
+            if glyph is None:
+                continue
+            draw_glyph(
+                self._bitmap,
+                glyph,
+                x + glyph.dx,
+                self._baseline - glyph.height - glyph.dy,
+            )
+            x += glyph.shift_x
+
+    @property
+    def color(self):
+        """Text color; None for transparent."""
+        return self._color
+
+    @color.setter
+    def color(self, color):
+        self._color = color
+        if color is None:
+            self._palette.make_transparent(1)
+        else:
+            self._palette[1] = color
+            self._palette.make_opaque(1)
+
+    @property
+    def anchor_point(self):
+        """Anchor point (x, y) as fractions of the label width and height."""
+        return self._anchor_point
+
+    @anchor_point.setter
+    def anchor_point(self, point):
+        self._anchor_point = point
+        self._place()
+        text, self._text = self._text, None
+        self.text = text  # Realign within the bitmap
+
+    @property
+    def anchored_position(self):
+        """Screen position (x, y) of the anchor point."""
+        return self._anchored_position
+
+    @anchored_position.setter
+    def anchored_position(self, position):
+        self._anchored_position = position
+        self._place()
+
+    def _place(self):
+        self.x = self._anchored_position[0] - round(self._anchor_point[0] * self.width)
+        self.y = self._anchored_position[1] - round(self._anchor_point[1] * self.height)
+        return
+
+    def _text_width(self, text):
+        width = 0
+        for character in text:
+            glyph = self._font.get_glyph(ord(character))
+            if glyph is not None:
+                width += glyph.shift_x
+        return width
@@ -0,0 +1,119 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# glyph_font.py
+# 2026-10-18 v1.0.0
+
+# Loader for pre-indexed binary glyph files built from the BDF fonts by
+# tools/build_font_cache.py. A glyph file holds only the characters the UI
+# and translation tables use; all of them are read into the glyph cache at
+# once, so no font file parsing happens after boot. Works anywhere a
+# bitmap_font font is accepted, e.g. adafruit_display_text labels.
+#
+# File layout, little-endian:
+#   header  "<4sHHhhhhhh"  magic, version, glyph count, bounding box width,
+#                          height, x offset, y offset, ascent, descent
+#   index   "<HBBbbb"      per glyph: code point, width, height, dx, dy,
+#                          shift_x; in the same order as the bitmaps
+#   bitmaps                per glyph: height rows of width pixels, 1 bit per
+#                          pixel, most significant bit first, each row
+#                          padded to a whole byte
+
+import struct
+from fontio import Glyph
+
+try:
+    from bitmaptools import readinto as _bitmap_readinto
+except ImportError:
+    _bitmap_readinto = None
+
+MAGIC = b"AQGF"
+VERSION = 1
+HEADER_FORMAT = "<4sHHhhhhhh"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+INDEX_FORMAT = "<HBBbbb"
+INDEX_SIZE = struct.calcsize(INDEX_FORMAT)
+
+
+class GlyphFont:
+    def __init__(self, path, bitmap_class=None):
+        """Load every glyph of a binary glyph file into the glyph cache.
+        :param str path: Glyph file path, e.g. "/fonts/OpenSans-12.aqgf".
+        :param bitmap_class: Bitmap class for the glyphs; displayio.Bitmap
+        when omitted."""
+        if bitmap_class is None:
+            import displayio
+
+            bitmap_class = displayio.Bitmap
+        self._glyphs = {}
+
+        with open(path, "rb") as font_file:
+            header = struct.unpack(HEADER_FORMAT, font_file.read(HEADER_SIZE))
+            if header[0] != MAGIC or header[1] != VERSION:
+                raise ValueError("Incompatible glyph file: " + path)
+            count = header[2]
+            self._bounding_box = header[3:7]
+            self._ascent, self._descent = header[7:9]
+
+            index = font_file.read(INDEX_SIZE * count)
+            for i in range(count):
+                code_point, width, height, dx, dy, shift_x = struct.unpack_from(
+                    INDEX_FORMAT, index, i * INDEX_SIZE
+                )
+                bitmap = bitmap_class(max(width, 1), max(height, 1), 2)
+                self._read_bitmap(font_file, bitmap, width, height)
+                self._glyphs[code_point] = Glyph(
+                    bitmap, 0, width, height, dx, dy, shift_x, 0
+                )
+        return
+
+    @staticmethod
+    def _read_bitmap(font_file, bitmap, width, height):
+        if width == 0 or height == 0:
+            return
+        if _bitmap_readinto:
+            _bitmap_readinto(
+                bitmap,
+                font_file,
+                bits_per_pixel=1,
+                element_size=1,
+                reverse_pixels_in_element=True,
+            )
+            return
+        row = bytearray((width + 7) // 8)
+        start = 0
+        for _ in range(height):
+            font_file.readinto(row)
+            for x in range(width):
+                if row[x // 8] & (128 >> (x % 8)):
+                    bitmap[start + x] = 1
+            start += width
+        return
+
+    @property
+    def ascent(self):
+        """Font ascent in pixels."""
+        return self._ascent
+
+    @property
+    def descent(self):
+        """Font descent in pixels."""
+        return self._descent
+
+    @property
+    def glyph_count(self):
+        """Number of cached glyphs."""
+        return len(self._glyphs)
+
+    def get_bounding_box(self):
+        """Returns the font bounding box (width, height, x offset, y offset)."""
+        return self._bounding_box
+
+    def load_glyphs(self, code_points):
+        """All glyphs are loaded at instantiation; nothing to do."""
+        return
+
+    def get_glyph(self, code_point):
+        """Returns the cached Glyph for a code point, or None if the glyph
+        is not in the file."""
+        return self._glyphs.get(code_point)
@@ -0,0 +1,98 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# refresh_scheduler.py
+# 2026-10-18 v1.0.0
+
+# Frame-coalescing display refresh. With auto_refresh on, the display can
+# refresh between any two displayio property changes and show a partially
+# updated screen. After start() the display only refreshes from
+# refresh(): code that changes the screen calls invalidate(), and the
+# next refresh() (one per frame at most target_fps) sends every change
+# made since the last frame in a single display.refresh(). The achieved
+# frame rate and refresh time are kept for the periodic report.
+
+import time
+
+try:
+    _ticks_ns = time.monotonic_ns
+except AttributeError:  # Boards without long integer support
+
+    def _ticks_ns():
+        return int(time.monotonic() * 1000000000)
+
+
+class RefreshScheduler:
+    def __init__(self, display, target_fps=10, monotonic=time.monotonic):
+        """Coalesce screen changes into rate-limited display refreshes. The
+        display keeps auto-refreshing until start().
+        :param display: displayio display (board.DISPLAY).
+        :param int target_fps: Maximum refreshes per second.
+        :param monotonic: Clock function, seconds; paces the frames."""
+        self._display = display
+        self._target_fps = target_fps
+        self._frame_time = 1 / target_fps
+        self._monotonic = monotonic
+        self._pending = True
+        self._next_frame = monotonic()
+        self.reset_stats()
+        return
+
+    @property
+    def pending(self):
+        """True when the screen has changed since the last refresh."""
+        return self._pending
+
+    def start(self):
+        """Turn off the display's auto-refresh; refresh() takes over."""
+        self._display.auto_refresh = False
+        self._pending = True
+        return
+
+    def invalidate(self):
+        """Note that the screen changed; it is sent at the next frame."""
+        self._pending = True
+        return
+
+    def refresh(self):
+        """Refresh the display if the screen changed and a frame is due;
+        never waits for the frame time. Returns True if refreshed."""
+        now = self._monotonic()
+        if not self._pending or now < self._next_frame:
+            return False
+        start = _ticks_ns()
+        refreshed = self._display.refresh(
+            target_frames_per_second=self._target_fps, minimum_frames_per_second=0
+        )
+        elapsed = _ticks_ns() - start
+        self._next_frame = now + self._frame_time
+        if refreshed is False:  # Skipped by the display; keep the changes
+            self.skipped += 1
+            return False
+        self._pending = False
+        self.frames += 1
+        self._refresh_ns += elapsed
+        self._max_refresh_ns = max(self._max_refresh_ns, elapsed)
+        return True
+
+    def stats(self):
+        """Returns frames refreshed, frames per second, average refresh
+        milliseconds, and maximum refresh milliseconds since the last
+        reset."""
+        seconds = max(self._monotonic() - self._since, 1e-3)
+        average = self._refresh_ns / self.frames / 1000000 if self.frames else 0
+        return (
+            self.frames,
+            self.frames / seconds,
+            average,
+            self._max_refresh_ns / 1000000,
+        )
+
+    def reset_stats(self):
+        """Clear the frame counters."""
+        self.frames = 0
+        self.skipped = 0
+        self._refresh_ns = 0
+        self._max_refresh_ns = 0
+        self._since = self._monotonic()
+        return
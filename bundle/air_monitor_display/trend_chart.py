@@ -0,0 +1,137 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# trend_chart.py
+# 2026-10-18 v1.1.0
+
+# v1.1.0: draw bars into one shared 1-bit bitmap instead of one Rect per bar
+
+import displayio
+from array import array
+
+try:
+    from bitmaptools import fill_region  # CircuitPython v7.0.0
+except ImportError:
+    fill_region = None
+
+
+class TrendChart:
+    def __init__(self, width, height, points, color=0x508080):
+        """Instantiate a scrolling bar chart of normalized (0.0 to 1.0)
+        values. Values are held in an array ring buffer so adding a sample
+        is O(1). Bars are drawn into a single two-color bitmap; redraw only
+        writes the pixels between a bar's old and new height. The newest
+        value is drawn at the right edge of the chart area.
+        :param int width: Chart area width in pixels.
+        :param int height: Chart area height in pixels.
+        :param int points: Requested number of data points (bars), up to
+        the chart width.
+        :param int color: Bar fill color."""
+
+        self._height = height
+        self._bar_width = max(1, int(width / points))
+        self._points = len(range(0, width, self._bar_width))
+
+        self._values = array("f", [0.0] * self._points)
+        self._head = 0  # Next slot to be written; the oldest value
+        # Last drawn bar top row; bar 0 is the newest (rightmost)
+        self._bar_top = array("h", [height] * self._points)
+        self._dirty_area = None
+
+        self._bitmap = displayio.Bitmap(self._points * self._bar_width, height, 2)
+        self._palette = displayio.Palette(2)
+        self._palette[0] = 0x000000
+        self._palette.make_transparent(0)
+        self._palette[1] = color
+
+        self._group = displayio.Group()
+        self._group.append(
+            displayio.TileGrid(
+                self._bitmap,
+                pixel_shader=self._palette,
+                x=width - ((self._points - 1) * self._bar_width),
+                y=0,
+            )
+        )
+        return
+
+    @property
+    def group(self):
+        """Displayio chart group."""
+        return self._group
+
+    @property
+    def points(self):
+        """Number of data points (bars) in the chart."""
+        return self._points
+
+    @property
+    def latest(self):
+        """Most recently added value."""
+        return self._values[(self._head - 1) % self._points]
+
+    @property
+    def dirty_area(self):
+        """Bitmap area (x1, y1, x2, y2) changed by the last draw; None if
+        nothing changed. Coordinates are exclusive of x2 and y2."""
+        return self._dirty_area
+
+    @property
+    def color(self):
+        """Bar fill color."""
+        return self._palette[1]
+
+    @color.setter
+    def color(self, color):
+        self._palette[1] = color
+
+    def add(self, value):
+        """Add a normalized value, replacing the oldest, and redraw."""
+        self._values[self._head] = value
+        self._head = (self._head + 1) % self._points
+        self.draw()
+        return
+
+    def draw(self):
+        """Write only the pixels of bars whose height changed since the
+        last draw."""
+        self._dirty_area = None
+        for i in range(self._points):
+            value = self._values[(self._head - 1 - i) % self._points]
+            top = min(
+                max(self._height - int(value * self._height) + 1, 0), self._height
+            )
+            old_top = self._bar_top[i]
+            if top == old_top:
+                continue
+            self._bar_top[i] = top
+            x1 = (self._points - 1 - i) * self._bar_width
+            x2 = x1 + self._bar_width
+            if top < old_top:  # Bar grew; fill the new rows
+                self._fill(x1, top, x2, old_top, 1)
+                self._mark_dirty(x1, top, x2, old_top)
+            else:  # Bar shrank; clear the vacated rows
+                self._fill(x1, old_top, x2, top, 0)
+                self._mark_dirty(x1, old_top, x2, top)
+        return
+
+    def _fill(self, x1, y1, x2, y2, value):
+        if fill_region:
+            fill_region(self._bitmap, x1, y1, x2, y2, value)
+            return
+        for y in range(y1, y2):
+            for x in range(x1, x2):
+                self._bitmap[x, y] = value
+        return
+
+    def _mark_dirty(self, x1, y1, x2, y2):
+        if self._dirty_area is None:
+            self._dirty_area = (x1, y1, x2, y2)
+        else:
+            self._dirty_area = (
+                min(self._dirty_area[0], x1),
+                min(self._dirty_area[1], y1),
+                max(self._dirty_area[2], x2),
+                max(self._dirty_area[3], y2),
+            )
+        return
@@ -0,0 +1,89 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# device.py
+# 2026-10-18 v1.0.0
+
+# Air monitor hardware abstraction layer: CircuitPython device backend.
+# See simulated.py for the host computer backend with the same interface.
+
+import os
+import time
+import board
+import busio
+import binascii
+import microcontroller
+import neopixel
+import adafruit_scd30
+from air_monitor_hal.scd30_batch import BatchSCD30
+from analogio import AnalogIn
+from digitalio import DigitalInOut
+from simpleio import tone as _tone
+
+board_type = os.uname().machine
+device_id = binascii.hexlify(microcontroller.cpu.uid).decode()  # Unique per chip
+display = board.DISPLAY
+monotonic = time.monotonic
+sleep = time.sleep
+
+_speaker_enable = None
+
+
+def font_path(name):
+    """Return the path of a font file in the fonts folder."""
+    return "/fonts/" + name
+
+
+def i2c(frequency):
+    """Instantiate the STEMMA I2C bus."""
+    return busio.I2C(board.SCL, board.SDA, frequency=frequency)
+
+
+def scd30(i2c_bus):
+    """Instantiate the SCD-30 CO2 sensor with batched measurement reads;
+    raises if not connected."""
+    return BatchSCD30(adafruit_scd30.SCD30(i2c_bus))
+
+
+def pm25(i2c_bus, interface="i2c"):
+    """Instantiate a PM2.5 particulate sensor: "i2c" for a PMSA003I on the
+    I2C bus or "uart" for a PM25 on the board TX and RX pins; raises if not
+    connected. UART reads wait for nothing: read() returns None until a
+    whole frame is buffered (see pm25_uart.py)."""
+    if interface == "uart":
+        from air_monitor_hal.pm25_uart import BufferedPM25
+
+        uart = busio.UART(
+            board.TX, board.RX, baudrate=9600, timeout=0.25, receiver_buffer_size=64
+        )
+        return BufferedPM25(uart)
+    from adafruit_pm25.i2c import PM25_I2C
+
+    return PM25_I2C(i2c_bus)
+
+
+def analog_in(pin_name):
+    """Instantiate an analog input by board pin name, e.g. "A6"."""
+    return AnalogIn(getattr(board, pin_name))
+
+
+def enable_speaker():
+    """Turn on speaker output if the board has a speaker enable pin."""
+    global _speaker_enable
+    if hasattr(board, "SPEAKER_ENABLE"):
+        _speaker_enable = DigitalInOut(board.SPEAKER_ENABLE)
+        _speaker_enable.switch_to_output(value=True)
+    return
+
+
+def tone(freq=440, duration=0.01):
+    """Play a tone through the integral speaker."""
+    _tone(board.A0, freq, duration)
+    return
+
+
+def neopixels(count):
+    """Instantiate the board NeoPixels; None if the board has none."""
+    if hasattr(board, "NEOPIXEL"):
+        return neopixel.NeoPixel(board.NEOPIXEL, count, pixel_order=neopixel.GRB)
+    return None
@@ -0,0 +1,47 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# pm25_uart.py
+# 2026-10-18 v1.0.0
+
+# Non-blocking PM2.5 UART reads. adafruit_pm25 PM25_UART.read() reads the
+# UART byte by byte until a whole 32-byte frame has arrived, waiting up to
+# the UART timeout for each read, so called from an asyncio task a slow or
+# silent sensor would hold up every other task. BufferedPM25 only calls it
+# once two frames' worth of bytes are already buffered, which holds one
+# whole frame wherever it starts; the read then never waits.
+
+import time
+from adafruit_pm25.uart import PM25_UART
+
+FRAME_SIZE = 32  # Bytes per PMS5003 data frame
+
+
+class BufferedPM25:
+    def __init__(self, uart, timeout=10.0):
+        """Wrap a PM25_UART sensor with reads that never wait on the UART.
+        :param uart: busio.UART connected to the sensor; its receiver
+        buffer must hold at least two frames (64 bytes, the default).
+        :param float timeout: Seconds without a whole frame before read()
+        reports the sensor missing."""
+        self._uart = uart
+        self._pm25 = PM25_UART(uart)
+        self._timeout = timeout
+        self._last = time.monotonic()
+        return
+
+    def read(self):
+        """Returns the adafruit_pm25 data dictionary of a buffered frame, or
+        None if a whole frame has not arrived yet. Raises RuntimeError for a
+        corrupt frame or when no frame has arrived within the timeout."""
+        now = time.monotonic()
+        if self._uart.in_waiting < 2 * FRAME_SIZE:
+            if now - self._last > self._timeout:
+                self._last = now
+                raise RuntimeError("No PM2.5 data for %.0f s" % self._timeout)
+            return None
+        self._last = now
+        try:
+            return self._pm25.read()
+        finally:
+            self._uart.reset_input_buffer()  # The next read gets a new frame
@@ -0,0 +1,403 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# simulated.py
+# 2026-10-18 v1.0.0
+
+# Air monitor hardware abstraction layer: CPython host backend.
+# Provides a scriptable SCD-30 (synthetic CO2 curve or replayed CSV log),
+# a headless display, and no-op speaker and NeoPixels. Sensor timing follows
+# a simulated clock that the caller advances, so many monitor-hours can be
+# run per minute. Display objects need the Blinka displayio packages.
+
+import os
+import math
+import random
+from air_monitor_buttons.button_events import ButtonEvents, FakePin, read_pins
+from air_monitor_buttons.button_events import RELEASE
+from air_monitor_boards import find_profile, register_profile
+
+board_type = "Simulated"
+device_id = "simulated"
+
+
+class SimulatedClock:
+    def __init__(self, start=0.0):
+        """Simulated monotonic clock, advanced explicitly by the caller."""
+        self.now = start
+        return
+
+    def monotonic(self):
+        """Current simulated time in seconds."""
+        return self.now
+
+    def advance(self, seconds):
+        """Move simulated time forward."""
+        self.now += seconds
+        return
+
+
+clock = SimulatedClock()
+monotonic = clock.monotonic
+
+
+def sleep(seconds):
+    """Advance the simulated clock instead of waiting."""
+    clock.advance(seconds)
+    return
+
+
+def synthetic_co2(seed=None, occupants=4, room_m3=50, ach=1.0, noise=10):
+    """Return a sensor source producing an office-day CO2 curve: ambient
+    outdoor CO2 overnight, rising toward a ventilation-limited level while
+    the room is occupied (08:00-17:00), plus sensor noise.
+    :param int occupants: People in the room while occupied.
+    :param float room_m3: Room volume, cubic meters.
+    :param float ach: Ventilation air changes per hour.
+    :param float noise: CO2 sensor noise standard deviation, ppm."""
+    rng = random.Random(seed)
+    ambient = 420
+    # Steady-state rise from about 0.005 L/s CO2 per person
+    rise = occupants * 0.005 * 3600 / 1000 / (room_m3 * ach) * 1e6
+    state = {"t": 0.0, "co2": float(ambient)}
+
+    def source(t):
+        hour = (t / 3600) % 24
+        target = ambient + (rise if 8 <= hour < 17 else 0)
+        dt = max(t - state["t"], 0)
+        state["co2"] = target + (state["co2"] - target) * math.exp(-ach * dt / 3600)
+        state["t"] = t
+        co2 = state["co2"] + rng.gauss(0, noise)
+        temp = 21 + 2 * math.sin((hour - 9) * math.pi / 12) + rng.gauss(0, 0.1)
+        rh = 45 - 5 * math.sin((hour - 9) * math.pi / 12) + rng.gauss(0, 0.5)
+        return co2, rh, temp
+
+    return source
+
+
+def replay_csv(path, loop=True):
+    """Return a sensor source that replays a CSV log with columns
+    seconds, co2, relative_humidity, temperature (a header row is skipped).
+    Each reading is held until the next logged timestamp."""
+    rows = []
+    with open(path) as log:
+        for line in log:
+            fields = line.strip().split(",")
+            try:
+                rows.append(tuple(float(field) for field in fields[:4]))
+            except ValueError:
+                continue  # Header or malformed line
+    start = rows[0][0]
+    span = rows[-1][0] - start
+    state = {"i": 0}
+
+    def source(t):
+        if loop and span > 0:
+            t = t % span
+        i = state["i"]
+        if i and rows[i][0] - start > t:
+            i = 0  # Looped back to the start of the log
+        while i + 1 < len(rows) and rows[i + 1][0] - start <= t:
+            i += 1
+        state["i"] = i
+        return rows[i][1], rows[i][2], rows[i][3]
+
+    return source
+
+
+def synthetic_pm25(seed=None, background=6.0):
+    """Return a PM2.5 source: a background concentration with a cooking
+    plume each evening (18:00-19:00) that decays over about an hour, plus
+    sensor noise. Returns whole ug/m^3 like the PMSA003I.
+    :param float background: Background PM2.5, ug/m^3."""
+    rng = random.Random(seed)
+
+    def source(t):
+        hour = (t / 3600) % 24
+        plume = 0.0
+        if hour >= 18:
+            plume = 80 * min(hour - 18, 1) * math.exp(-max(hour - 19, 0))
+        return max(round(background + plume + rng.gauss(0, 1.5)), 0)
+
+    return source
+
+
+sensor_source = synthetic_co2()
+sensor_connected = True  # Set False to simulate unplugging the SCD-30
+pm_source = synthetic_pm25()
+pm_connected = True  # Set False to simulate unplugging the PM2.5 sensor
+
+
+def _check_connected():
+    if not sensor_connected:
+        raise OSError(19, "No such device")  # As busio.I2C reports
+
+
+class FakeSCD30:
+    def __init__(self, i2c_bus=None, source=None):
+        """Scriptable SCD-30 with the adafruit_scd30 properties used by the
+        monitor. A new measurement becomes available every
+        measurement_interval seconds of simulated time. While the module's
+        sensor_connected is False, instantiation and I2C access raise the
+        errors the driver would.
+        :param source: Function of simulated time returning
+        (co2, relative_humidity, temperature); defaults to sensor_source."""
+        if not sensor_connected:
+            raise ValueError("No I2C device at address: 0x61")
+        self._source = source or sensor_source
+        self._interval = 2
+        self._next = clock.now
+        self._frc = 400
+        self.CO2 = self.relative_humidity = self.temperature = 0.0
+        self.data_reads = 0  # Number of data_available polls
+        self.data_loads = 0  # read_measurement calls
+        self.interval_writes = 0  # measurement_interval changes
+        return
+
+    @property
+    def measurement_interval(self):
+        """Sets the interval between readings in seconds (2 to 1800). A
+        shorter interval applies to the measurement in progress."""
+        return self._interval
+
+    @measurement_interval.setter
+    def measurement_interval(self, value):
+        _check_connected()
+        if value < 2 or value > 1800:
+            raise AttributeError("measurement_interval must be from 2-1800 seconds")
+        self._interval = value
+        self._next = min(self._next, clock.now + value)
+        self.interval_writes += 1
+
+    @property
+    def forced_recalibration_reference(self):
+        """Forced recalibration reference value, ppm."""
+        return self._frc
+
+    @forced_recalibration_reference.setter
+    def forced_recalibration_reference(self, value):
+        _check_connected()
+        self._frc = value
+
+    def reset(self):
+        """Restart measurements. As on the hardware, the first new
+        measurement is available one measurement interval later."""
+        _check_connected()
+        self._next = clock.now + self._interval
+        return
+
+    @property
+    def data_available(self):
+        """True when a new measurement is ready; loads it as the driver
+        does so CO2, relative_humidity and temperature are current.
+        One I2C transaction."""
+        _check_connected()
+        self.data_reads += 1
+        if clock.now < self._next:
+            return False
+        self.CO2, self.relative_humidity, self.temperature = self._source(clock.now)
+        self._next = clock.now + self._interval
+        return True
+
+    def read_measurement(self):
+        """Returns the latest CO2 (ppm), temperature (degrees Celsius), and
+        relative humidity (percent) as the batched reader does; one I2C
+        transaction."""
+        _check_connected()
+        self.data_loads += 1
+        return self.CO2, self.temperature, self.relative_humidity
+
+    @property
+    def i2c_transactions(self):
+        """I2C transactions the driver would have made: one per
+        data_available poll, measurement read, and interval change."""
+        return self.data_reads + self.data_loads + self.interval_writes
+
+
+class FakePM25:
+    def __init__(self, source=None):
+        """PM2.5 sensor stand-in with the adafruit_pm25 read() method.
+        :param source: Function of simulated time returning PM2.5 in
+        ug/m^3; defaults to pm_source."""
+        if not pm_connected:
+            raise ValueError("No I2C device at address: 0x12")
+        self._source = source or pm_source
+        self.reads = 0
+        return
+
+    def read(self):
+        """Returns a dictionary of particulate concentrations; PM1.0 and
+        PM10 are derived from PM2.5."""
+        if not pm_connected:
+            raise RuntimeError("Unable to read from PM2.5 sensor")
+        self.reads += 1
+        pm25 = self._source(clock.now)
+        data = {}
+        for kind in ("standard", "env"):
+            data["pm10 " + kind] = int(pm25 * 0.7)
+            data["pm25 " + kind] = pm25
+            data["pm100 " + kind] = int(pm25 * 1.3)
+        return data
+
+
+class HeadlessDisplay:
+    def __init__(self, width=320, height=240):
+        """Display stand-in that holds the root group and counts refreshes."""
+        self.width = width
+        self.height = height
+        self.brightness = 1.0
+        self.auto_refresh = True
+        self.root_group = None
+        self.refreshes = 0
+        return
+
+    def show(self, group):
+        """Set the root displayio group."""
+        self.root_group = group
+        return
+
+    def refresh(self, target_frames_per_second=None, minimum_frames_per_second=0):
+        """Count a refresh; always succeeds."""
+        self.refreshes += 1
+        return True
+
+
+class NoOpPixels(list):
+    def __init__(self, count):
+        """NeoPixel stand-in."""
+        super().__init__([0] * count)
+        self.brightness = 1.0
+        return
+
+    def fill(self, color):
+        for i in range(len(self)):
+            self[i] = color
+        return
+
+
+class FakeAnalogIn:
+    def __init__(self, volts=4.0):
+        """Battery monitor stand-in (PyBadge 1/2 divider, 3.3 V reference)."""
+        self.value = int(volts / 6.6 * 0xFFF0)
+        return
+
+
+class Buttons:
+    def __init__(self):
+        """Air monitor buttons backed by FakePin objects. Script a button
+        with pins["calibrate"].press() and .release()."""
+        self._timeout = 1
+        self._events = ButtonEvents(hold_time=self._timeout)
+        self.pins = {
+            "calibrate": FakePin(),
+            "language": FakePin(),
+            "temperature": FakePin(),
+        }
+        self._pins = tuple((name, pin, False) for name, pin in self.pins.items())
+        self._button_group = False
+        return
+
+    @property
+    def button_display_group(self):
+        """Displayio button group."""
+        return self._button_group
+
+    @property
+    def timeout(self):
+        """Button timeout duration setting."""
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, hold_time=1.0):
+        self._timeout = hold_time
+        self._events.hold_time = hold_time
+
+    @property
+    def events(self):
+        """Button event queue (ButtonEvents)."""
+        return self._events
+
+    def poll(self):
+        """Sample the fake pins and return the list of new events."""
+        return self._events.update(read_pins(self._pins), clock.now)
+
+    def read_buttons(self):
+        """Non-blocking. Returns the button name and hold time when a button
+        is released, otherwise None and 0."""
+        self.poll()
+        event = self._events.get()
+        while event:
+            if event.kind == RELEASE:
+                return event.name, event.duration
+            event = self._events.get()
+        return None, 0
+
+
+tones = 0  # Number of tones "played"
+
+
+def simulate_board(name="PyPortal", width=None, height=None):
+    """Imitate a supported board: register a board_type profile with the
+    named board's fonts, I2C frequency, speaker, battery pin, and NeoPixels,
+    this module as its button panel, and the display size; then size the
+    headless display to match. Returns the profile.
+    :param str name: Supported board to imitate, e.g. "Pybadge".
+    :param int width: Display width; defaults to the board's.
+    :param int height: Display height; defaults to the board's."""
+    global display
+    profile = find_profile(name)
+    if profile is None:
+        raise ValueError("No board profile for " + name)
+    profile = profile._replace(
+        match=board_type,
+        panel=__name__,
+        width=width or profile.width,
+        height=height or profile.height,
+    )
+    register_profile(profile)
+    display = HeadlessDisplay(profile.width, profile.height)
+    return profile
+
+
+simulate_board()
+
+
+def font_path(name):
+    """Return the path of a font file in the bundle fonts folder."""
+    return os.path.join(os.path.dirname(os.path.dirname(__file__)), "fonts", name)
+
+
+def i2c(frequency):
+    """Simulated I2C bus; only the frequency is kept."""
+    return {"frequency": frequency}
+
+
+def scd30(i2c_bus):
+    """Instantiate the simulated SCD-30."""
+    return FakeSCD30(i2c_bus)
+
+
+def pm25(i2c_bus, interface="i2c"):
+    """Instantiate the simulated PM2.5 sensor."""
+    return FakePM25()
+
+
+def analog_in(pin_name):
+    """Instantiate a simulated analog input reading 4.0 volts."""
+    return FakeAnalogIn()
+
+
+def enable_speaker():
+    return
+
+
+def tone(freq=440, duration=0.01):
+    """Count the tone without playing or waiting."""
+    global tones
+    tones += 1
+    return
+
+
+def neopixels(count):
+    """Instantiate simulated NeoPixels."""
+    return NoOpPixels(count)
@@ -0,0 +1,105 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# air_monitor_particulates.py
+# 2026-10-18 v1.0.0
+
+# Particulate (PM2.5) sensor acquisition and AQI for the air monitor.
+# poll() takes at most one sensor read, so it can share the I2C bus and
+# the scheduler with the SCD-30 without holding up the other tasks. A
+# missing or failing sensor is retried with the same doubling backoff as
+# the SCD-30 lifecycle. Readings feed a PMAverager; the AQI is calculated
+# from the NowCast, or from the average so far until the NowCast has
+# enough hours of data.
+
+import time
+from air_monitor_sensor import SENSOR_ERRORS
+from cedargrove_unit_converter.air_quality.aqi_air_quality import PM25_BREAKPOINTS
+from cedargrove_unit_converter.air_quality.pm_averaging import PMAverager
+
+
+class PMMonitor:
+    def __init__(
+        self,
+        connect,
+        breakpoints=PM25_BREAKPOINTS,
+        backoff=1.0,
+        max_backoff=60.0,
+        monotonic=time.monotonic,
+    ):
+        """Read a PM2.5 sensor and track its AQI.
+        :param connect: Function with no arguments that instantiates an
+        adafruit_pm25 sensor and raises one of SENSOR_ERRORS if it is not
+        connected. Its read() may return None when no new reading has
+        arrived yet (see air_monitor_hal.pm25_uart).
+        :param tuple breakpoints: AQI breakpoint table, PM25_BREAKPOINTS
+        (default).
+        :param float backoff: Delay after the first error, seconds.
+        :param float max_backoff: Longest delay between retries, seconds.
+        :param monotonic: Clock function, seconds."""
+        self._connect = connect
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+        self._monotonic = monotonic
+        self._breakpoints = breakpoints
+        self._averager = PMAverager(breakpoints)
+
+        self._sensor = None
+        self._errors = 0  # Consecutive errors
+        self._retry_at = monotonic()
+        self.pm25 = None  # Latest PM2.5 concentration, ug/m^3
+        self.pm100 = None  # Latest PM10 concentration, ug/m^3
+        self.valid = False
+        self.aqi = -1
+        self.color = 0x0000FF
+        self.category = "INVALID"
+        return
+
+    @property
+    def present(self):
+        """True when the sensor is connected and reading."""
+        return self._sensor is not None and self._errors == 0
+
+    @property
+    def errors(self):
+        """Number of consecutive errors."""
+        return self._errors
+
+    def poll(self):
+        """Read the sensor once; returns True when pm25, pm100, and the AQI
+        attributes were updated."""
+        now = self._monotonic()
+        if now < self._retry_at:
+            return False
+        try:
+            if self._sensor is None:
+                self._sensor = self._connect()
+            data = self._sensor.read()
+        except SENSOR_ERRORS as error:
+            self._fault(error, now)
+            return False
+        if data is None:  # No new reading yet
+            return False
+        self._errors = 0
+        self.pm25 = data["pm25 standard"]
+        self.pm100 = data["pm100 standard"]
+        self._averager.update(self.pm25, now)
+        self.valid, self.aqi, self.color, self.category = self._averager.aqi()
+        if not self.valid:  # Not enough hours for the NowCast yet
+            aqi = self._averager.aqi(use_nowcast=False)
+            self.valid, self.aqi, self.color, self.category = aqi
+        if not self.valid and self._averager.average_24h == 0:
+            # Clean air reads exactly zero, which the AQI table rejects
+            good = self._breakpoints[0]
+            self.valid, self.aqi, self.color, self.category = True, 0, good[4], good[5]
+        return True
+
+    def _fault(self, error, now):
+        if self._errors == 0:
+            print("--- PM2.5 SENSOR: %s ---" % error)
+        self._errors += 1
+        doublings = min(self._errors - 1, 16)  # Keep to a small integer
+        self._retry_at = now + min(self._backoff * 2**doublings, self._max_backoff)
+        if self._errors > 3:
+            self._sensor = None  # Unplugged or replaced; detect it again
+        return
@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# air_monitor_profiler.py
+# 2026-10-18 v1.0.0
+
+# Opt-in stage timing for the air monitor. A Profiler times consecutive
+# stages (boot phases or the steps of a loop) with time.monotonic_ns and
+# accumulates a count, total, and maximum per stage. When disabled, each
+# call returns after one attribute test. Reports are printed and optionally
+# appended to a log file as lines that tools/profile_report.py aggregates:
+#   PROFILE,<device>,<board>,<section>,<stage>,<count>,<total us>,<max us>
+
+import time
+
+try:
+    _ticks_ns = time.monotonic_ns
+except AttributeError:  # Boards without long integer support
+
+    def _ticks_ns():
+        return int(time.monotonic() * 1000000000)
+
+
+class Profiler:
+    def __init__(self, section, enabled=True, log_path=None):
+        """Time named stages; each lap() ends a stage that began at the
+        previous lap() or restart(). Timing starts at instantiation.
+        :param str section: Report section name, e.g. "boot" or "loop".
+        :param bool enabled: Record timings. Can be changed later.
+        :param str log_path: File to append reports to; None to only print."""
+        self.section = section
+        self.enabled = enabled
+        self.log_path = log_path
+        self.device = ""  # Unique device ID for reports, e.g. the CPU UID
+        self.board = ""  # Board type for reports
+        self._stages = []  # Stage names in first-seen order
+        self._stats = {}  # Stage name: [count, total ns, max ns]
+        self._last = _ticks_ns()
+        return
+
+    def restart(self):
+        """Begin timing a new stage without recording the previous one."""
+        if not self.enabled:
+            return
+        self._last = _ticks_ns()
+        return
+
+    def lap(self, stage):
+        """Record the time since the previous lap() or restart() as a run of
+        the named stage."""
+        if not self.enabled:
+            return
+        now = _ticks_ns()
+        elapsed = now - self._last
+        self._last = now
+        stats = self._stats.get(stage)
+        if stats is None:
+            stats = self._stats[stage] = [0, 0, 0]
+            self._stages.append(stage)
+        stats[0] += 1
+        stats[1] += elapsed
+        if elapsed > stats[2]:
+            stats[2] = elapsed
+        return
+
+    def report(self):
+        """Print the recorded stages (and append them to the log file), then
+        clear the statistics."""
+        if not self.enabled or not self._stages:
+            return
+        lines = []
+        for stage in self._stages:
+            count, total, longest = self._stats[stage]
+            lines.append(
+                "PROFILE,%s,%s,%s,%s,%d,%d,%d"
+                % (
+                    self.device,
+                    self.board,
+                    self.section,
+                    stage,
+                    count,
+                    total // 1000,
+                    longest // 1000,
+                )
+            )
+        for line in lines:
+            print(line)
+        if self.log_path:
+            try:
+                with open(self.log_path, "a") as log:
+                    for line in lines:
+                        log.write(line + "\n")
+            except OSError:
+                print("--- PROFILE LOG NOT WRITABLE ---")
+                self.log_path = None
+        self.reset()
+        return
+
+    def reset(self):
+        """Clear the recorded statistics."""
+        self._stages = []
+        self._stats = {}
+        self._last = _ticks_ns()
+        return
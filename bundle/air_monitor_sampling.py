@@ -0,0 +1,96 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# air_monitor_sampling.py
+# 2026-10-18 v1.0.0
+
+# Adaptive SCD-30 measurement interval. Each reading the controller picks
+# the longest interval that still samples CO2 several times before it can
+# cross the alarm threshold (rising into or falling out of alarm), and
+# shortens the interval in proportion to the distance from the threshold
+# when close to it. Stable readings lengthen the interval gradually; urgency
+# shortens it at once. The interval is reprogrammed into the sensor only
+# when it changes, so a steady room costs few I2C transactions per hour.
+# See tools/evaluate_sampling.py.
+
+SCD30_MIN_INTERVAL = 2  # seconds
+SCD30_MAX_INTERVAL = 1800
+
+
+class AdaptiveSampler:
+    def __init__(
+        self,
+        alarm_ppm,
+        min_interval=2,
+        max_interval=60,
+        band=1000,
+        window=60,
+        samples_to_alarm=4,
+        growth=1.5,
+    ):
+        """Choose the sensor measurement interval from recent CO2 readings.
+        :param int alarm_ppm: CO2 alarm threshold, ppm.
+        :param int min_interval: Shortest interval, seconds (2 or more).
+        :param int max_interval: Longest interval, seconds (1800 or less).
+        :param int band: Within this many ppm of the alarm threshold, the
+        longest interval shrinks in proportion to the distance.
+        :param float window: Minimum seconds between the readings used to
+        estimate the CO2 slope; filters out sensor noise.
+        :param int samples_to_alarm: Readings wanted before CO2 is
+        predicted to cross the alarm threshold.
+        :param float growth: Maximum interval increase per reading."""
+        self._alarm = alarm_ppm
+        self._min = max(int(min_interval), SCD30_MIN_INTERVAL)
+        self._max = min(int(max_interval), SCD30_MAX_INTERVAL)
+        self._band = band
+        self._window = window
+        self._samples_to_alarm = samples_to_alarm
+        self._growth = growth
+
+        self._interval = self._min
+        self._slope = 0.0
+        self._ref = None  # (time, ppm) of the newest slope reference
+        self._old_ref = None  # Reference at least one window before _ref
+        return
+
+    @property
+    def interval(self):
+        """Current measurement interval, seconds."""
+        return self._interval
+
+    @interval.setter
+    def interval(self, seconds):
+        self._interval = min(max(int(seconds), self._min), self._max)
+
+    @property
+    def slope(self):
+        """Estimated CO2 slope, ppm per minute."""
+        return self._slope
+
+    def update(self, co2, now):
+        """Add a reading and return the measurement interval to use next.
+        :param co2: CO2 concentration, ppm.
+        :param float now: Reading time, seconds (time.monotonic())."""
+        if self._ref is None:
+            self._ref = self._old_ref = (now, co2)
+        if now - self._ref[0] >= self._window:
+            self._old_ref = self._ref
+            self._ref = (now, co2)
+        if now > self._old_ref[0]:
+            self._slope = (co2 - self._old_ref[1]) * 60 / (now - self._old_ref[0])
+
+        # Distance to the alarm threshold and the rate CO2 is approaching it
+        # from below (alarm onset) or above (alarm clearing)
+        distance = abs(self._alarm - co2)
+        approach = self._slope if co2 < self._alarm else -self._slope
+        target = self._max
+        if distance < self._band:
+            target = self._min + (self._max - self._min) * distance / self._band
+        if approach > 0:
+            minutes_to_threshold = distance / approach
+            target = min(target, minutes_to_threshold * 60 / self._samples_to_alarm)
+
+        if target > self._interval:
+            target = min(target, self._interval * self._growth)
+        self.interval = target
+        return self._interval
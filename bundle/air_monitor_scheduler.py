@@ -0,0 +1,65 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# air_monitor_scheduler.py
+# 2026-10-18 v1.0.0
+
+# Periodic cooperative tasks for the air monitor. Uses asyncio on CPython
+# and the asyncio library on CircuitPython v7.0.0 or later.
+
+import time
+import asyncio
+
+
+class PeriodicTask:
+    def __init__(self, name, period, action):
+        """Run an async action at a fixed period and record how late each
+        run starts. Lateness is the time other tasks held the processor past
+        this task's scheduled start.
+        :param str name: Task name for reports.
+        :param float period: Seconds between scheduled starts.
+        :param action: Async function called with no arguments."""
+        self.name = name
+        self.period = period
+        self._action = action
+        self.runs = 0
+        self.max_latency = 0.0  # Worst start lateness, seconds
+        self.max_duration = 0.0  # Longest single run, seconds
+        return
+
+    async def run(self):
+        """Run the action forever. Pass to asyncio.create_task()."""
+        scheduled = time.monotonic()
+        while True:
+            start = time.monotonic()
+            self.max_latency = max(self.max_latency, start - scheduled)
+            await self._action()
+            self.max_duration = max(self.max_duration, time.monotonic() - start)
+            self.runs += 1
+
+            # Schedule from the previous start so the period doesn't drift;
+            # skip missed periods rather than running back-to-back
+            scheduled += self.period
+            now = time.monotonic()
+            if scheduled < now:
+                scheduled = now
+            await asyncio.sleep(scheduled - now)
+
+    def reset(self):
+        """Clear the recorded statistics."""
+        self.runs = 0
+        self.max_latency = 0.0
+        self.max_duration = 0.0
+        return
+
+
+def report(tasks):
+    """Print the worst-case start latency and run duration of each task,
+    in milliseconds, then reset the statistics."""
+    for task in tasks:
+        print(
+            "task %-8s runs %5d  max latency %7.1f ms  max run %7.1f ms"
+            % (task.name, task.runs, task.max_latency * 1000, task.max_duration * 1000)
+        )
+        task.reset()
+    return
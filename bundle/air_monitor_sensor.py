@@ -0,0 +1,182 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# air_monitor_sensor.py
+# 2026-10-18 v1.0.0
+
+# SCD-30 lifecycle state machine. poll() never blocks; it advances through
+#   ABSENT     no sensor; try to detect one after each backoff delay
+#   RESETTING  sensor found; reset it and program the measurement interval
+#   WARMING    waiting, up to one interval plus warmup_timeout, for the
+#              first measurement
+#   STREAMING  measurements arriving; a stall counts as an error
+#   FAULTED    I2C error or timeout; reset again after the backoff delay
+# Consecutive errors double the backoff delay up to max_backoff. A failed
+# reset drops the sensor object and returns to ABSENT, so an unplugged
+# sensor is detected again when it is plugged back in.
+
+import time
+
+ABSENT = "absent"
+RESETTING = "resetting"
+WARMING = "warming"
+STREAMING = "streaming"
+FAULTED = "faulted"
+
+# Raised by the I2C bus and the sensor driver: bus errors, CRC failures,
+# and no device at the sensor's address
+SENSOR_ERRORS = (OSError, RuntimeError, ValueError)
+
+
+class SensorLifecycle:
+    def __init__(
+        self,
+        connect,
+        interval=2,
+        warmup_timeout=10.0,
+        backoff=1.0,
+        max_backoff=60.0,
+        stall_periods=3,
+        monotonic=time.monotonic,
+    ):
+        """Detect, reset, and read a sensor without blocking.
+        :param connect: Function with no arguments that instantiates the
+        sensor and raises one of SENSOR_ERRORS if it is not connected. The
+        sensor needs data_available, read_measurement() returning (CO2,
+        temperature, relative humidity), reset(), measurement_interval, and
+        forced_recalibration_reference; see air_monitor_hal.scd30_batch.
+        :param int interval: Measurement interval, seconds.
+        :param float warmup_timeout: Seconds to wait for the first
+        measurement beyond the one measurement interval it takes after a
+        reset.
+        :param float backoff: Delay after the first error, seconds.
+        :param float max_backoff: Longest delay between retries, seconds.
+        :param int stall_periods: Missed measurement intervals (plus the
+        warmup timeout) before a streaming sensor is considered stalled.
+        :param monotonic: Clock function, seconds."""
+        self._connect = connect
+        self._interval = interval
+        self._warmup_timeout = warmup_timeout
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+        self._stall_periods = stall_periods
+        self._monotonic = monotonic
+
+        self._state = ABSENT
+        self._sensor = None
+        self._errors = 0  # Consecutive errors
+        self._retry_at = monotonic()  # Detect at the first poll
+        self._deadline = 0.0  # Warmup or stall deadline
+        self.CO2 = self.relative_humidity = self.temperature = None
+        return
+
+    @property
+    def state(self):
+        """Lifecycle state: ABSENT, RESETTING, WARMING, STREAMING, or FAULTED."""
+        return self._state
+
+    @property
+    def sensor(self):
+        """Sensor driver object; None while ABSENT."""
+        return self._sensor
+
+    @property
+    def present(self):
+        """True when a sensor has been detected."""
+        return self._sensor is not None
+
+    @property
+    def errors(self):
+        """Number of consecutive errors."""
+        return self._errors
+
+    @property
+    def interval(self):
+        """Measurement interval, seconds; reprogrammed while streaming."""
+        return self._interval
+
+    @interval.setter
+    def interval(self, seconds):
+        if seconds == self._interval:
+            return
+        self._interval = seconds
+        if self._state in (WARMING, STREAMING):
+            try:
+                self._sensor.measurement_interval = seconds
+            except SENSOR_ERRORS as error:
+                self._fault(error)
+            else:
+                self._deadline = self._stall_deadline()
+
+    def poll(self):
+        """Advance the lifecycle; returns True when a new measurement has
+        been read into CO2, relative_humidity, and temperature."""
+        now = self._monotonic()
+        try:
+            if self._state == ABSENT:
+                if now >= self._retry_at:
+                    self._sensor = self._connect()
+                    self._state = RESETTING
+            if self._state == FAULTED and now >= self._retry_at:
+                self._state = RESETTING
+            if self._state == RESETTING:
+                self._reset()
+                self._state = WARMING
+                # The first measurement arrives one interval after a reset
+                self._deadline = now + self._interval + self._warmup_timeout
+            if self._state in (WARMING, STREAMING):
+                if self._sensor.data_available:
+                    (
+                        self.CO2,
+                        self.temperature,
+                        self.relative_humidity,
+                    ) = self._sensor.read_measurement()
+                    self._state = STREAMING
+                    self._errors = 0
+                    self._deadline = self._stall_deadline()
+                    return True
+                if now > self._deadline:
+                    self._fault(self._state + " timeout")
+        except SENSOR_ERRORS as error:
+            self._fault(error)
+        return False
+
+    def recalibrate(self, reference=400):
+        """Set the forced recalibration reference, ppm; returns False if the
+        sensor is not streaming or the write failed."""
+        if self._state != STREAMING:
+            return False
+        try:
+            self._sensor.forced_recalibration_reference = reference
+        except SENSOR_ERRORS as error:
+            self._fault(error)
+            return False
+        return True
+
+    def _reset(self):
+        try:
+            self._sensor.reset()
+            self._sensor.measurement_interval = self._interval
+        except SENSOR_ERRORS:
+            self._sensor = None  # Unplugged or replaced; detect it again
+            raise
+        return
+
+    def _stall_deadline(self):
+        return (
+            self._monotonic()
+            + self._interval * self._stall_periods
+            + self._warmup_timeout
+        )
+
+    def _fault(self, error):
+        self._errors += 1
+        doublings = min(self._errors - 1, 16)  # Keep to a small integer
+        delay = min(self._backoff * 2**doublings, self._max_backoff)
+        self._retry_at = self._monotonic() + delay
+        if self._state != ABSENT:
+            print(
+                "--- SENSOR %s: %s; retry in %.0f s ---" % (self._state, error, delay)
+            )
+            self._state = FAULTED if self._sensor is not None else ABSENT
+        return
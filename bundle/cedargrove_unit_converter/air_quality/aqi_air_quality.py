@@ -2,9 +2,18 @@
 # SPDX-License-Identifier: MIT
 
 # aqi_air_quality.py
-# 2021-09-07 version 1.0
+# 2026-10-18 version 1.1
 
 # EPA Air Quality Index (AQI) as derived from PM2.5 particulate concentration
+# v1.1: replace elif ladder with pluggable breakpoint tables; add
+#       concentration_to_aqi_batch for whole arrays of concentrations
+
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # CircuitPython; concentration_to_aqi_batch uses the scalar path
 
 RED = 0xFF0000
 YELLOW = 0xFFFF00
@@ -37,7 +46,52 @@ def map_range(x, in_min, in_max, out_min, out_max):
     return min(max(mapped, out_max), out_min)
 
 
-def concentration_to_aqi(pm25_value):
+# Breakpoint tables: (conc_low, conc_high, aqi_low, aqi_high, color, category)
+# A concentration above the previous band's conc_high and at or below this
+# band's conc_high is interpolated within this band. Concentrations above the
+# last band are OVERRANGE; zero or negative concentrations are INVALID.
+PM25_BREAKPOINTS = (  # PM2.5, ug/m^3; original EPA table
+    (0, 12, 0, 50, GREEN, "GOOD"),
+    (12, 35, 50, 100, YELLOW, "MODERATE"),
+    (35, 55, 100, 150, ORANGE, "SENSITIVE"),
+    (55, 150, 150, 200, RED, "UNHEALTHY"),
+    (150, 250, 200, 300, PURPLE, "V UNHEALTHY"),
+    (250, 350, 300, 400, MAROON, "HAZARDOUS"),
+    (350, 500, 400, 500, MAROON, "HAZARDOUS"),
+)
+
+PM25_2024_BREAKPOINTS = (  # PM2.5, ug/m^3; EPA 2024 revision
+    (0.0, 9.0, 0, 50, GREEN, "GOOD"),
+    (9.1, 35.4, 51, 100, YELLOW, "MODERATE"),
+    (35.5, 55.4, 101, 150, ORANGE, "SENSITIVE"),
+    (55.5, 125.4, 151, 200, RED, "UNHEALTHY"),
+    (125.5, 225.4, 201, 300, PURPLE, "V UNHEALTHY"),
+    (225.5, 325.4, 301, 500, MAROON, "HAZARDOUS"),
+)
+
+PM10_BREAKPOINTS = (  # PM10, ug/m^3
+    (0, 54, 0, 50, GREEN, "GOOD"),
+    (55, 154, 51, 100, YELLOW, "MODERATE"),
+    (155, 254, 101, 150, ORANGE, "SENSITIVE"),
+    (255, 354, 151, 200, RED, "UNHEALTHY"),
+    (355, 424, 201, 300, PURPLE, "V UNHEALTHY"),
+    (425, 504, 301, 400, MAROON, "HAZARDOUS"),
+    (505, 604, 401, 500, MAROON, "HAZARDOUS"),
+)
+
+AQI_CATEGORIES = (
+    "INVALID",
+    "GOOD",
+    "MODERATE",
+    "SENSITIVE",
+    "UNHEALTHY",
+    "V UNHEALTHY",
+    "HAZARDOUS",
+    "OVERRANGE",
+)
+
+
+def concentration_to_aqi(pm25_value, breakpoints=PM25_BREAKPOINTS):
     """Returns a data valid flag, calculated air quality index (AQI), color,
     and category.
     NOTE: The AQI returned by this function should ideally be measured
@@ -45,29 +99,65 @@ def concentration_to_aqi(pm25_value):
     averaging will result in higher AQI values than expected.
     :param float pm_sensor_reading: Particulate matter sensor value,
     2.5 particle size.
+    :param tuple breakpoints: Breakpoint table; PM25_BREAKPOINTS (default),
+    PM25_2024_BREAKPOINTS, or PM10_BREAKPOINTS.
     """
-    # Check sensor reading using EPA breakpoints
-    if pm25_value > 500:
-        return True, 500, MAROON, "OVERRANGE"
-    elif pm25_value > 350:
-        aqi_value = int(map_range(pm25_value, 350, 500, 400, 500))
-        return True, aqi_value, MAROON, "HAZARDOUS"
-    elif pm25_value > 250:
-        aqi_value = int(map_range(pm25_value, 250, 350, 300, 400))
-        return True, aqi_value, MAROON, "HAZARDOUS"
-    elif pm25_value > 150:
-        aqi_value = int(map_range(pm25_value, 150, 250, 200, 300))
-        return True, aqi_value, PURPLE, "V UNHEALTHY"
-    elif pm25_value > 55:
-        aqi_value = int(map_range(pm25_value, 55, 150, 150, 200))
-        return True, aqi_value, RED, "UNHEALTHY"
-    elif pm25_value > 35:
-        aqi_value = int(map_range(pm25_value, 35, 55, 100, 150))
-        return True, aqi_value, ORANGE, "SENSITIVE"
-    elif pm25_value > 12:
-        aqi_value = int(map_range(pm25_value, 12, 35, 50, 100))
-        return True, aqi_value, YELLOW, "MODERATE"
-    elif pm25_value > 0:
-        aqi_value = int(map_range(pm25_value, 0, 12, 0, 50))
-        return True, aqi_value, GREEN, "GOOD"
+    if pm25_value > breakpoints[-1][1]:
+        return True, breakpoints[-1][3], breakpoints[-1][4], "OVERRANGE"
+    if pm25_value > 0:
+        for c_low, c_high, aqi_low, aqi_high, color, category in breakpoints:
+            if pm25_value <= c_high:
+                aqi_value = int(map_range(pm25_value, c_low, c_high, aqi_low, aqi_high))
+                return True, aqi_value, color, category
     return False, -1, BLUE, "INVALID"
+
+
+def concentration_to_aqi_batch(pm_values, breakpoints=PM25_BREAKPOINTS):
+    """Converts a sequence of particulate concentrations to AQI in a single
+    pass. Returns parallel arrays of data valid flags, AQI values, colors,
+    and category indices into AQI_CATEGORIES. Uses NumPy when available;
+    otherwise falls back to concentration_to_aqi and returns array.array
+    objects. Both paths return identical values.
+    :param pm_values: NumPy array or buffer-protocol sequence of particulate
+    matter concentrations.
+    :param tuple breakpoints: Breakpoint table; PM25_BREAKPOINTS (default),
+    PM25_2024_BREAKPOINTS, or PM10_BREAKPOINTS.
+    """
+    if np is not None:
+        conc = np.asarray(pm_values, dtype=np.float64)
+        table = np.asarray([band[:4] for band in breakpoints], dtype=np.float64)
+        c_low, c_high, aqi_low, aqi_high = table.T
+        # Band 0 is INVALID, bands 1..n are the table rows, n + 1 is OVERRANGE
+        band = np.searchsorted(c_high, conc, side="left") + 1
+        band[~(conc > 0)] = 0
+        row = np.clip(band - 1, 0, len(breakpoints) - 1)
+        # Same operation order as map_range so both paths round identically
+        aqi = (conc - c_low[row]) / (c_high[row] - c_low[row])
+        aqi *= aqi_high[row] - aqi_low[row]
+        aqi += aqi_low[row]
+        aqi = np.clip(aqi, aqi_low[row], aqi_high[row])
+        aqi[band == 0] = -1
+        aqi[band > len(breakpoints)] = breakpoints[-1][3]
+        colors = np.asarray(
+            [BLUE] + [b[4] for b in breakpoints] + [breakpoints[-1][4]],
+            dtype=np.uint32,
+        )
+        categories = np.asarray(
+            [0]
+            + [AQI_CATEGORIES.index(b[5]) for b in breakpoints]
+            + [AQI_CATEGORIES.index("OVERRANGE")],
+            dtype=np.uint8,
+        )
+        return band > 0, aqi.astype(np.int32), colors[band], categories[band]
+
+    valid = array("B")
+    aqi = array("l")
+    colors = array("L")
+    categories = array("B")
+    for pm_value in pm_values:
+        flag, aqi_value, color, category = concentration_to_aqi(pm_value, breakpoints)
+        valid.append(flag)
+        aqi.append(aqi_value)
+        colors.append(color)
+        categories.append(AQI_CATEGORIES.index(category))
+    return valid, aqi, colors, categories
@@ -2,9 +2,17 @@
 # SPDX-License-Identifier: MIT
 
 # co2_air_quality.py
-# 2021-09-07 version 1.0
+# 2026-10-18 version 1.1
 
 # Indoor Air Quality as derived from CO2 concentration
+# v1.1: add breakpoint table and co2_ppm_to_quality_batch for sensor histories
+
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # CircuitPython; co2_ppm_to_quality_batch uses the scalar path
 
 RED = 0xFF0000
 YELLOW = 0xFFFF00
@@ -53,3 +61,41 @@ def co2_ppm_to_quality(ppm_value):
     elif ppm_value > 100:
         return True, ppm_value, GREEN, "GOOD"
     return False, ppm_value, BLUE, "INVALID"
+
+
+# Breakpoint table; a reading above CO2_BREAKPOINTS[i] and at or below
+# CO2_BREAKPOINTS[i + 1] falls in category CO2_CATEGORIES[i + 1]
+CO2_BREAKPOINTS = (100, 1000, 2000, 5000, 6000)
+CO2_CATEGORIES = ("INVALID", "GOOD", "POOR", "WARNING", "DANGER", "OVERRANGE")
+CO2_COLORS = (BLUE, GREEN, YELLOW, ORANGE, RED, RED)
+
+
+def co2_ppm_to_quality_batch(ppm_values):
+    """Classifies a sequence of CO2 readings in a single pass. Returns
+    parallel arrays of data valid flags, ppm values (clamped to 6000), colors,
+    and category indices into CO2_CATEGORIES. Uses NumPy when available;
+    otherwise falls back to co2_ppm_to_quality and returns array.array objects.
+    Both paths return identical values.
+    :param ppm_values: NumPy array or buffer-protocol sequence of CO2
+    concentrations, parts-per-million (PPM).
+    """
+    if np is not None:
+        ppm = np.asarray(ppm_values, dtype=np.float64)
+        # Count of breakpoints below each reading is the category index
+        index = np.searchsorted(CO2_BREAKPOINTS, ppm, side="left").astype(np.uint8)
+        index[np.isnan(ppm)] = 0  # NaN fails every comparison in the scalar path
+        ppm = np.minimum(ppm, CO2_BREAKPOINTS[-1])
+        colors = np.asarray(CO2_COLORS, dtype=np.uint32)[index]
+        return index > 0, ppm, colors, index
+
+    valid = array("B")
+    ppm = array("d")
+    colors = array("L")
+    index = array("B")
+    for ppm_value in ppm_values:
+        flag, value, color, label = co2_ppm_to_quality(ppm_value)
+        valid.append(flag)
+        ppm.append(value)
+        colors.append(color)
+        index.append(CO2_CATEGORIES.index(label))
+    return valid, ppm, colors, index
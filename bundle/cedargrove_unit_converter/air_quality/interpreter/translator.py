@@ -0,0 +1,66 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Studios
+# SPDX-License-Identifier: MIT
+
+# translator.py
+# 2026-10-18 version 1.0
+
+# Resolves a fixed list of English UI phrases to the selected alternate
+# language once, so display code can index a prebuilt tuple instead of
+# translating each phrase on every refresh.
+#
+# Languages are found by name, e.g. "DEUTSCH":
+#   1. english_to_deutsch.json in this folder; a JSON object mapping English
+#      phrases to translations (add a language with a data file only), or
+#   2. the english_to_deutsch.py module's ENG_DEUTSCH dictionary.
+# Phrases missing from a language's table are shown in English.
+
+import json
+
+PACKAGE = "cedargrove_unit_converter.air_quality.interpreter"
+
+
+def _folder():
+    # Folder containing this module; os.path is not available on CircuitPython
+    return __file__.rsplit("/", 1)[0]
+
+
+def load_table(language):
+    """Returns the English-to-language phrase dictionary for a language."""
+    name = "english_to_" + language.lower()
+    try:
+        with open(_folder() + "/" + name + ".json") as data_file:
+            return json.load(data_file)
+    except OSError:
+        pass  # No data file; use the language module
+    module = __import__(PACKAGE + "." + name, None, None, ["interpret"])
+    return getattr(module, "ENG_" + language.upper())
+
+
+class Translator:
+    def __init__(self, language, phrases):
+        """Translate a tuple of English phrases to the alternate language.
+        The phrase table is only needed while building the tuples.
+        :param str language: Alternate language name, e.g. "FRANCAIS".
+        :param tuple phrases: English UI phrases; a phrase's position is its
+        string ID."""
+        self._english = tuple(phrases)
+        table = load_table(language)
+        self._translated = tuple(table.get(phrase, phrase) for phrase in phrases)
+        return
+
+    @property
+    def english(self):
+        """Tuple of English phrases."""
+        return self._english
+
+    @property
+    def translated(self):
+        """Tuple of alternate language phrases."""
+        return self._translated
+
+    def phrases(self, translate):
+        """Returns the alternate language tuple if translate is True,
+        otherwise the English tuple. Index it with a phrase's string ID."""
+        if translate:
+            return self._translated
+        return self._english
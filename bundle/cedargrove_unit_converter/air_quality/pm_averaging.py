@@ -0,0 +1,181 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Studios
+# SPDX-License-Identifier: MIT
+
+# pm_averaging.py
+# 2026-10-18 version 1.0
+
+# Streaming particulate concentration averages for AQI calculation:
+# rolling 24-hour average and EPA NowCast (12-hour weighted average).
+# Memory is bounded (one float per hour of history) and each sample is O(1).
+
+import time
+from array import array
+from cedargrove_unit_converter.air_quality.aqi_air_quality import (
+    concentration_to_aqi,
+    PM25_BREAKPOINTS,
+)
+
+NAN = float("nan")
+
+
+class RollingAverage:
+    def __init__(self, size):
+        """Fixed-size ring buffer with a running sum. Missing values (NaN)
+        occupy a slot but are excluded from the average.
+        :param int size: Number of values in the averaging window."""
+        self._values = array("f", [NAN] * size)
+        self._size = size
+        self._head = 0  # Next slot to be written; also the oldest value
+        self._sum = 0.0
+        self._count = 0  # Number of non-missing values in the window
+        self._writes = 0
+        return
+
+    @property
+    def size(self):
+        """Averaging window length."""
+        return self._size
+
+    @property
+    def count(self):
+        """Number of valid values in the window."""
+        return self._count
+
+    @property
+    def total(self):
+        """Running sum of the valid values in the window."""
+        return self._sum
+
+    @property
+    def average(self):
+        """Average of the valid values in the window; NaN if empty."""
+        if self._count:
+            return self._sum / self._count
+        return NAN
+
+    def push(self, value):
+        """Add a value, evicting the oldest. Pass NaN to record a gap."""
+        old = self._values[self._head]
+        if old == old:  # Not NaN
+            self._sum -= old
+            self._count -= 1
+        self._values[self._head] = value
+        if value == value:
+            self._sum += value
+            self._count += 1
+        self._head = (self._head + 1) % self._size
+
+        # Periodically rebuild the running sum to stop float error creeping in
+        self._writes += 1
+        if self._writes >= self._size:
+            self._writes = 0
+            self._sum = 0.0
+            for old in self._values:
+                if old == old:
+                    self._sum += old
+        return
+
+    def recent(self, n):
+        """Return the n most recent values, newest first."""
+        return [self._values[(self._head - 1 - i) % self._size] for i in range(n)]
+
+
+def nowcast(hourly, minimum_weight=0.5, decimals=1):
+    """Calculates the EPA NowCast from hourly average concentrations.
+    Returns NaN if fewer than two of the three most recent hours are valid.
+    :param hourly: Sequence of hourly averages, newest first; NaN for a gap.
+    :param float minimum_weight: Weight factor floor; 0.5 for particulates.
+    :param int decimals: Decimal places retained (truncated).
+    """
+    if sum(1 for c in hourly[:3] if c == c) < 2:
+        return NAN
+    valid = [c for c in hourly if c == c]
+    c_max = max(valid)
+    if c_max <= 0:
+        return 0.0
+    weight = max(min(valid) / c_max, minimum_weight)
+
+    numerator = denominator = 0.0
+    factor = 1.0
+    for c in hourly:
+        if c == c:
+            numerator += factor * c
+            denominator += factor
+        factor *= weight
+    scale = 10**decimals
+    return int(numerator / denominator * scale) / scale
+
+
+class PMAverager:
+    def __init__(self, breakpoints=PM25_BREAKPOINTS):
+        """Streaming particulate averager. Samples are accumulated into
+        hourly averages which feed a rolling 24-hour average and the EPA
+        NowCast. Hours without samples are recorded as gaps.
+        :param tuple breakpoints: AQI breakpoint table, PM25_BREAKPOINTS
+        (default)."""
+        self._breakpoints = breakpoints
+        # Completed hours; the current partial hour makes up the 24th
+        self._hours = RollingAverage(23)
+        self._hour = None  # Index of the hour being accumulated
+        self._hour_sum = 0.0
+        self._hour_count = 0
+        return
+
+    def update(self, value, timestamp=None):
+        """Add a concentration sample.
+        :param float value: Particulate concentration.
+        :param float timestamp: Sample time in seconds; time.monotonic()
+        when omitted. Archive replay should pass the logged timestamp."""
+        if timestamp is None:
+            timestamp = time.monotonic()
+        hour = int(timestamp // 3600)
+        if self._hour is None:
+            self._hour = hour
+        elif hour != self._hour:
+            self._close_hour()
+            # Record empty hours as gaps; at most a full window is needed
+            for _ in range(min(hour - self._hour - 1, self._hours.size)):
+                self._hours.push(NAN)
+            self._hour = hour
+        self._hour_sum += value
+        self._hour_count += 1
+        return
+
+    def _close_hour(self):
+        if self._hour_count:
+            self._hours.push(self._hour_sum / self._hour_count)
+        else:
+            self._hours.push(NAN)
+        self._hour_sum = 0.0
+        self._hour_count = 0
+        return
+
+    def _hourly(self, n):
+        # Newest first, with the partially-accumulated current hour at the head
+        current = self._hour_sum / self._hour_count if self._hour_count else NAN
+        return [current] + self._hours.recent(n - 1)
+
+    @property
+    def average_24h(self):
+        """Average of the last 24 hourly averages (including the current
+        partial hour); NaN until a sample arrives."""
+        total = self._hours.total
+        count = self._hours.count
+        if self._hour_count:
+            total += self._hour_sum / self._hour_count
+            count += 1
+        if count:
+            return total / count
+        return NAN
+
+    @property
+    def nowcast(self):
+        """EPA NowCast concentration from the last 12 hours; NaN when
+        there is not enough recent data."""
+        return nowcast(self._hourly(12))
+
+    def aqi(self, use_nowcast=True):
+        """Returns a data valid flag, AQI, color, and category calculated
+        from the NowCast (default) or the rolling 24-hour average."""
+        value = self.nowcast if use_nowcast else self.average_24h
+        return concentration_to_aqi(value, self._breakpoints)
@@ -0,0 +1,108 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Studios
+# SPDX-License-Identifier: MIT
+
+# spectrum_palette.py
+# 2026-10-18 version 1.0
+
+# Precomputed lookup tables for the index_to_rgb spectrum helpers with gamma
+# applied. Tables are built once per (spectrum, entries, gamma) and cached.
+# On a device a table can be loaded into a displayio.Palette; on a host
+# computer it is available as NumPy uint32 or uint8 RGB arrays.
+
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # CircuitPython; bulk conversion uses the array path
+
+SPECTRA = ("iron", "visible", "stoplight", "grayscale")
+
+_cache = {}
+_array_cache = {}
+
+
+def _index_to_rgb(spectrum):
+    if spectrum not in SPECTRA:
+        raise ValueError("Unknown spectrum. Must be one of " + ", ".join(SPECTRA))
+    module = __import__(
+        "cedargrove_unit_converter.index_to_rgb." + spectrum + "_spectrum",
+        None,
+        None,
+        ["index_to_rgb"],
+    )
+    return module.index_to_rgb
+
+
+def spectrum_lut(spectrum="iron", entries=256, gamma=None):
+    """Returns a cached lookup table of 24-bit RGB values for evenly spaced
+    spectrum indices from 0.0 to 1.0.
+    :param str spectrum: "iron", "visible", "stoplight", or "grayscale".
+    :param int entries: Number of table entries, 2 or more.
+    :param float gamma: Gamma; None uses the spectrum's default.
+    :return: Returns an array of 24-bit RGB values
+    :rtype: array.array
+    """
+    key = (spectrum, entries, gamma)
+    if key not in _cache:
+        index_to_rgb = _index_to_rgb(spectrum)
+        lut = array("L")
+        for i in range(entries):
+            if gamma is None:
+                lut.append(index_to_rgb(i / (entries - 1)))
+            else:
+                lut.append(index_to_rgb(i / (entries - 1), gamma))
+        _cache[key] = lut
+    return _cache[key]
+
+
+def spectrum_palette(spectrum="iron", entries=256, gamma=None):
+    """Returns a displayio.Palette loaded with the spectrum lookup table.
+    Use as the pixel_shader of a TileGrid whose bitmap holds table indices."""
+    import displayio
+
+    lut = spectrum_lut(spectrum, entries, gamma)
+    palette = displayio.Palette(entries)
+    for i, color in enumerate(lut):
+        palette[i] = color
+    return palette
+
+
+def spectrum_array(spectrum="iron", entries=256, gamma=None, rgb888=False):
+    """Returns the spectrum lookup table as a NumPy array; uint32 24-bit RGB
+    values, or an (entries, 3) uint8 array when rgb888 is True. Host only."""
+    lut = _lut_array(spectrum, entries, gamma)
+    if rgb888:
+        return np.stack(
+            ((lut >> 16) & 0xFF, (lut >> 8) & 0xFF, lut & 0xFF), axis=-1
+        ).astype(np.uint8)
+    return lut.copy()
+
+
+def _lut_array(spectrum, entries, gamma):
+    key = (spectrum, entries, gamma)
+    if key not in _array_cache:
+        lut = spectrum_lut(spectrum, entries, gamma)
+        _array_cache[key] = np.array(lut, dtype=np.uint32)
+    return _array_cache[key]
+
+
+def table_index(index, entries=256):
+    """Returns the lookup table entry for a spectrum index from 0.0 to 1.0."""
+    return min(max(int(index * (entries - 1) + 0.5), 0), entries - 1)
+
+
+def indexes_to_rgb(indexes, spectrum="iron", entries=256, gamma=None):
+    """Converts a sequence of spectrum indices (0.0 to 1.0) to 24-bit RGB
+    values in one call using the cached lookup table. Indices are rounded to
+    the nearest table entry and clamped.
+    :param indexes: NumPy array (any shape) or sequence of spectrum indices.
+    :return: Returns a NumPy uint32 array of the same shape, or an
+    array.array when NumPy is not available
+    """
+    if np is not None:
+        lut = _lut_array(spectrum, entries, gamma)
+        position = np.asarray(indexes, dtype=np.float64) * (entries - 1) + 0.5
+        return lut[np.clip(position, 0, entries - 1).astype(np.intp)]
+    lut = spectrum_lut(spectrum, entries, gamma)
+    return array("L", (lut[table_index(index, entries)] for index in indexes))
@@ -27,6 +27,91 @@ A CircuitPython module for temperature conversion.
 * Author(s): Cedar Grove Studios
 """
 
+import math
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # CircuitPython; the array functions need NumPy
+
+# Dew point comfort messages: (low, high, category, message)
+DEW_POINT_MESSAGES = (
+    (-9999, 10, "Safe", ": A bit dry for some."),
+    (10, 12, "Safe", ": Very comfortable."),
+    (13, 16, "Safe", ": Comfortable."),
+    (16, 18, "Safe", ": Okay for most."),
+    (18, 21, "Caution", ": Somewhat uncomfortable for most people."),
+    (21, 24, "Caution", ": Very humid, quite uncomfortable."),
+    (24, 26, "Extreme Caution", ": Extremely uncomfortable, fairly oppresive."),
+    (
+        26,
+        9999,
+        "DANGER",
+        ": Severely high, potentially deadly for asthma sufferers.",
+    ),
+)
+
+# Heat index messages: (low, high, category, message, message continued)
+HEAT_INDEX_MESSAGES = (
+    (-99, 26, "Safe", ": Heat index is not a factor.", ""),
+    (
+        26,
+        32,
+        "Caution",
+        ": Fatigue is possible with prolonged exposure and activity. ",
+        "Continuing activity could result in heat cramps.",
+    ),
+    (
+        32,
+        41,
+        "Extreme Caution",
+        ": Heat cramps and heat exhaustion are possible. ",
+        "Continuing activity could result in heat stroke.",
+    ),
+    (
+        41,
+        54,
+        "DANGER",
+        ": Heat cramps and heat exhaustion are likely. ",
+        "Heat stroke is probable with continued activity.",
+    ),
+    (54, 99, "EXTREME DANGER", ": Heat stroke is imminent. ", ""),
+)
+
+# Rothfusz heat index regression (Fahrenheit) grouped by powers of dry-bulb
+# temperature t for Horner evaluation; each group is a polynomial in relative
+# humidity r: HI = (a0 + a1*r + a2*r^2) + t*(...) + t^2*(...)
+ROTHFUSZ_T0 = (-42.379, 10.14333127, -0.05481717)
+ROTHFUSZ_T1 = (2.04901523, -0.22475541, 0.00085282)
+ROTHFUSZ_T2 = (-0.00683783, 0.00122874, -0.00000199)
+
+
+def _rothfusz(t, r):
+    # Horner form: two multiplies per power instead of repeated t ** 2, r ** 2
+    a0 = ROTHFUSZ_T0[0] + r * (ROTHFUSZ_T0[1] + r * ROTHFUSZ_T0[2])
+    a1 = ROTHFUSZ_T1[0] + r * (ROTHFUSZ_T1[1] + r * ROTHFUSZ_T1[2])
+    a2 = ROTHFUSZ_T2[0] + r * (ROTHFUSZ_T2[1] + r * ROTHFUSZ_T2[2])
+    return a0 + t * (a1 + t * a2)
+
+
+def _round_tenths(value):
+    # As numpy.round(value, 1) does: scale, round half to even, unscale. The
+    # scalar and array heat index then agree on values at a rounding tie.
+    return round(value * 10) / 10
+
+
+# Wind chill risk messages (Environment Canada): (low, high, category, message)
+WIND_CHILL_MESSAGES = (
+    (-9999, -55, "EXTREME DANGER", ": Exposed skin can freeze in under 2 minutes."),
+    (-55, -48, "DANGER", ": Exposed skin can freeze in 2 to 5 minutes."),
+    (-48, -40, "Extreme Caution", ": Exposed skin can freeze in 5 to 10 minutes."),
+    (-40, -28, "Caution", ": Exposed skin can freeze in 10 to 30 minutes."),
+    (-28, -10, "Caution", ": Risk of hypothermia if outside for long periods."),
+    (-10, 9999, "Safe", ": Low risk of frostbite."),
+)
+
+
 # Celsius to Fahrenheit converter
 def celsius_to_fahrenheit(deg_c):
     return ((9 / 5) * deg_c) + 32
@@ -49,21 +134,7 @@ def kelvin_to_celsius(kelvins):
 
 # Dew Point converter (degrees Celsius)
 def dew_point(deg_c, humidity, verbose=False):
-    message_list = (
-        (-9999, 10, "Safe", ": A bit dry for some."),
-        (10, 12, "Safe", ": Very comfortable."),
-        (13, 16, "Safe", ": Comfortable."),
-        (16, 18, "Safe", ": Okay for most."),
-        (18, 21, "Caution", ": Somewhat uncomfortable for most people."),
-        (21, 24, "Caution", ": Very humid, quite uncomfortable."),
-        (24, 26, "Extreme Caution", ": Extremely uncomfortable, fairly oppresive."),
-        (
-            26,
-            9999,
-            "DANGER",
-            ": Severely high, potentially deadly for asthma sufferers.",
-        ),
-    )
+    message_list = DEW_POINT_MESSAGES
 
     dew_point_c = round(
         (
@@ -88,65 +159,25 @@ def dew_point(deg_c, humidity, verbose=False):
 # Heat/Comfort index (degrees Celsius)
 # (source: https://en.wikipedia.org/wiki/Heat_index)
 def heat_index(deg_c, humidity, verbose=False):
-    message_list = (
-        (-99, 26, "Safe", ": Heat index is not a factor.", ""),
-        (
-            26,
-            32,
-            "Caution",
-            ": Fatigue is possible with prolonged exposure and activity. ",
-            "Continuing activity could result in heat cramps.",
-        ),
-        (
-            32,
-            41,
-            "Extreme Caution",
-            ": Heat cramps and heat exhaustion are possible. ",
-            "Continuing activity could result in heat stroke.",
-        ),
-        (
-            41,
-            54,
-            "DANGER",
-            ": Heat cramps and heat exhaustion are likely. ",
-            "Heat stroke is probable with continued activity.",
-        ),
-        (54, 99, "EXTREME DANGER", ": Heat stroke is imminent. ", ""),
-    )
+    message_list = HEAT_INDEX_MESSAGES
 
     t = ((9 / 5) * deg_c) + 32  # Dry-bulb temperature in degrees Fahrenheit
     r = humidity  # Percentage value between 0 and 100
 
-    # Fahrenheit coefficients
-    c = (
-        0,
-        -42.379,
-        2.04901523,
-        10.14333127,
-        -0.22475541,
-        -0.00683783,
-        -0.05481717,
-        0.00122874,
-        0.00085282,
-        -0.00000199,
-    )
-
-    # Formula (Fahrenheit method, +/-1.3F: Rothfusz NWS-SR90-23, 1990)
-    # https://www.weather.gov/media/ffc/ta_htindx.PDF
-    h_index_f = round(
-        c[1]
-        + (c[2] * t)
-        + (c[3] * r)
-        + (c[4] * t * r)
-        + (c[5] * t ** 2)
-        + (c[6] * r ** 2)
-        + (c[7] * t ** 2 * r)
-        + (c[8] * t * r ** 2)
-        + (c[9] * t ** 2 * r ** 2),
-        1,
-    )
+    # NWS method: Steadman's simple formula, or when its average with the
+    # temperature is 80F or more, the regression (+/-1.3F: Rothfusz
+    # NWS-SR90-23, 1990) with low and high humidity adjustments
+    # https://www.wpc.ncep.noaa.gov/html/heatindex_equation.shtml
+    h_index_f = 0.5 * (t + 61.0 + ((t - 68.0) * 1.2) + (r * 0.094))
+    if (h_index_f + t) / 2 >= 80:
+        h_index_f = _rothfusz(t, r)
+        if r < 13 and 80 <= t <= 112:
+            h_index_f -= ((13 - r) / 4) * math.sqrt((17 - abs(t - 95)) / 17)
+        elif r > 85 and 80 <= t <= 87:
+            h_index_f += ((r - 85) / 10) * ((87 - t) / 5)
+    h_index_f = _round_tenths(h_index_f)
     # Convert to degrees Celsius
-    h_index_c = round((h_index_f - 32) * (5 / 9), 1)
+    h_index_c = _round_tenths((h_index_f - 32) * (5 / 9))
 
     if verbose:
         # Select range message from list
@@ -158,14 +189,147 @@ def heat_index(deg_c, humidity, verbose=False):
     return h_index_c
 
 
+# Message band index for each value; -1 where no band applies
+def _message_index(values, message_list):
+    lows = np.asarray([band[0] for band in message_list], dtype=np.float64)
+    highs = np.asarray([band[1] for band in message_list], dtype=np.float64)
+    index = np.searchsorted(lows, values, side="right") - 1
+    band = np.clip(index, 0, len(message_list) - 1)
+    return np.where((index >= 0) & (values < highs[band]), index, -1)
+
+
+# Dew Point converter for NumPy arrays (degrees Celsius)
+# Returns dew points, plus indices into DEW_POINT_MESSAGES when verbose
+def dew_point_array(deg_c, humidity, verbose=False):
+    deg_c = np.asarray(deg_c, dtype=np.float64)
+    humidity = np.asarray(humidity, dtype=np.float64)
+    dew_point_c = np.round(
+        np.power(humidity / 100.0, 0.125) * (112.0 + (0.9 * deg_c))
+        + (0.1 * deg_c)
+        - 112.0,
+        2,
+    )
+    dew_point_c = np.clip(dew_point_c, 0, 40)
+    if verbose:
+        return dew_point_c, _message_index(dew_point_c, DEW_POINT_MESSAGES)
+    return dew_point_c
+
+
+# Heat/Comfort index for NumPy arrays (degrees Celsius)
+# Returns heat indices, plus indices into HEAT_INDEX_MESSAGES when verbose
+def heat_index_array(deg_c, humidity, verbose=False):
+    t = ((9 / 5) * np.asarray(deg_c, dtype=np.float64)) + 32
+    r = np.asarray(humidity, dtype=np.float64)
+    simple = 0.5 * (t + 61.0 + ((t - 68.0) * 1.2) + (r * 0.094))
+    regression = _rothfusz(t, r)
+    low_rh = (r < 13) & (t >= 80) & (t <= 112)
+    regression[low_rh] -= ((13 - r[low_rh]) / 4) * np.sqrt(
+        (17 - np.abs(t[low_rh] - 95)) / 17
+    )
+    high_rh = (r > 85) & (t >= 80) & (t <= 87)
+    regression[high_rh] += ((r[high_rh] - 85) / 10) * ((87 - t[high_rh]) / 5)
+    h_index_f = np.where((simple + t) / 2 >= 80, regression, simple)
+    h_index_f = np.round(h_index_f, 1)
+    h_index_c = np.round((h_index_f - 32) * (5 / 9), 1)
+    if verbose:
+        return h_index_c, _message_index(h_index_c, HEAT_INDEX_MESSAGES)
+    return h_index_c
+
+
+# Wind chill index (degrees Celsius)
+# North American/UK formula; defined for temperatures at or below 10C and
+# wind above 4.8 km/h, otherwise the air temperature is returned
+# (source: https://en.wikipedia.org/wiki/Wind_chill)
 def wind_chill(deg_c, wind_vel_kmph, verbose=False):
-    # (source: https://en.wikipedia.org/wiki/Wind_chill)
-    pass
-    return
+    message_list = WIND_CHILL_MESSAGES
+
+    if deg_c <= 10 and wind_vel_kmph > 4.8:
+        v = pow(wind_vel_kmph, 0.16)
+        w_chill_c = round(
+            13.12 + (0.6215 * deg_c) - (11.37 * v) + (0.3965 * deg_c * v), 1
+        )
+    else:
+        w_chill_c = round(deg_c, 1)
 
+    if verbose:
+        # Select range message from list
+        for i in range(0, len(message_list)):
+            if message_list[i][0] <= w_chill_c < message_list[i][1]:
+                return w_chill_c, message_list[i][2] + message_list[i][3]
+    return w_chill_c
 
+
+# Australian apparent temperature (AT); thermal sensation (degrees Celsius)
+# Wind speed is measured at 10 meters; verbose messages use the heat index
+# bands (source: https://en.wikipedia.org/wiki/Wind_chill)
 def apparent_temperature(deg_c, humidity, wind_vel_kmph, verbose=False):
-    # Australian apparent temperature (AT); thermal sensation
-    # (source: https://en.wikipedia.org/wiki/Wind_chill)
-    pass
-    return
+    message_list = HEAT_INDEX_MESSAGES
+
+    # Water vapour pressure (hPa)
+    e = (humidity / 100) * 6.105 * math.exp((17.27 * deg_c) / (237.7 + deg_c))
+    wind_mps = wind_vel_kmph / 3.6
+    app_temp_c = round(deg_c + (0.33 * e) - (0.70 * wind_mps) - 4.00, 1)
+
+    if verbose:
+        # Select range message from list
+        for i in range(0, len(message_list)):
+            if message_list[i][0] <= app_temp_c < message_list[i][1]:
+                return app_temp_c, (
+                    message_list[i][2] + message_list[i][3] + message_list[i][4]
+                )
+    return app_temp_c
+
+
+class ComfortGrid:
+    def __init__(self, function, *axes):
+        """Precomputed lookup grid for a comfort index function of two or
+        three inputs, e.g. heat_index(deg_c, humidity) or
+        apparent_temperature(deg_c, humidity, wind_vel_kmph). Lookups use
+        (bi/tri)linear interpolation between grid points in constant time
+        with no polynomial math; inputs outside the grid are clamped.
+        :param function: Comfort index function returning a number.
+        :param axes: One (start, stop, step) tuple per function input,
+        spanning at least two points.
+        Example: ComfortGrid(heat_index, (20, 50, 1), (0, 100, 5))"""
+        self._axes = axes
+        self._sizes = [
+            int(round((stop - start) / step)) + 1 for start, stop, step in axes
+        ]
+        if min(self._sizes) < 2:
+            raise ValueError("Each axis needs at least two points.")
+        self._grid = array("f")
+        self._fill(function, [])
+        return
+
+    def _fill(self, function, values):
+        # Row-major order: the last axis varies fastest
+        start, stop, step = self._axes[len(values)]
+        for i in range(self._sizes[len(values)]):
+            if len(values) + 1 < len(self._axes):
+                self._fill(function, values + [start + (i * step)])
+            else:
+                self._grid.append(function(*(values + [start + (i * step)])))
+        return
+
+    def __call__(self, *values):
+        """Interpolated comfort index for the input values."""
+        cells = []
+        fractions = []
+        for value, (start, stop, step), size in zip(values, self._axes, self._sizes):
+            position = (min(max(value, start), stop) - start) / step
+            cell = min(int(position), size - 2)
+            cells.append(cell)
+            fractions.append(position - cell)
+
+        # Weighted sum of the 4 (or 8) surrounding grid points
+        result = 0.0
+        for corner in range(1 << len(values)):
+            weight = 1.0
+            offset = 0
+            for axis in range(len(values)):
+                bit = (corner >> (len(values) - 1 - axis)) & 1
+                weight *= fractions[axis] if bit else 1.0 - fractions[axis]
+                offset = (offset * self._sizes[axis]) + cells[axis] + bit
+            if weight:
+                result += weight * self._grid[offset]
+        return result
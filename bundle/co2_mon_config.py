@@ -2,10 +2,32 @@
 
 from air_mon_colors import *
 
-ALT_LANGUAGE = "FRANCAIS"  # DEUTSCH, FRANCAIS, or PIRATE
+ALT_LANGUAGE = "FRANCAIS"  # DEUTSCH, FRANCAIS, PIRATE, or an english_to_*.json file
 TRANSLATE = False  # Start-up with alternate language
 TEMP_UNIT = "F"  # "F" for Fahrenheit, "C" for Celsius
 BRIGHTNESS = 0.50  # 0.0 to 1.0; 0.75 is typical
-SENSOR_INTERVAL = 10  # Interval between measurements (2 to 1800 seconds)
+DISPLAY_FPS = 10  # Maximum display refreshes per second
+SENSOR_INTERVAL = 10  # Initial interval between measurements (2 to 1800 seconds)
+# The interval shortens toward SENSOR_INTERVAL_MIN as CO2 rises quickly or
+# nears CO2_ALARM and lengthens toward SENSOR_INTERVAL_MAX while readings are
+# stable. Set both to SENSOR_INTERVAL for a fixed interval.
+SENSOR_INTERVAL_MIN = 2
+SENSOR_INTERVAL_MAX = 60
 
 CO2_ALARM = [2500, RED, "Alarm"]  # CO2 concentration; parts-per-million (PPM)
+
+# Optional particulate sensor shown as an AQI gauge beside the CO2 chart:
+# "i2c" for a PMSA003I, "uart" for a PM25 on the TX and RX pins, or None
+PM_SENSOR = None
+PM_INTERVAL = 5  # Seconds between particulate readings
+
+# Circular binary datalog; None to disable. The filesystem must be made
+# writable in boot.py: storage.remount("/", readonly=False)
+DATALOG_FILE = None  # e.g. "/co2_datalog.bin"
+DATALOG_RECORDS = 8640  # Records kept; 8640 is one day of 10-second samples
+
+# Boot phase and sensor update stage timing; printed at boot and with the
+# periodic task report. PROFILE_LOG appends the reports to a file (needs a
+# writable filesystem); None to only print.
+PROFILE = False
+PROFILE_LOG = None  # e.g. "/profile.csv"
@@ -2,122 +2,239 @@
 # SPDX-License-Identifier: MIT
 
 # co2_monitor_code.py
-# 2021-09-20 v1.7.1
+# 2026-10-18 v1.23.7
 
 # add CircuitPython v7.0.0 compatibility for I2C baud
-
+# v1.8.0: ring-buffer trend chart with incremental redraw
+# v1.8.1: single-bitmap trend chart; CLUE trend_points restored to 40
+# v1.9.0: asyncio tasks replace the sequential main loop
+# v1.10.0: hardware access through air_monitor_hal (device or simulated)
+# v1.11.0: optional circular binary datalog (DATALOG_FILE)
+# v1.12.0: UI phrases translated once at startup (Translator)
+# v1.13.0: sensor value labels only re-laid out when text changes
+# v1.14.0: fonts loaded from prebuilt binary glyph files when available
+# v1.15.0: opt-in boot phase and sensor update profiling (PROFILE)
+# v1.16.0: adaptive sensor measurement interval (AdaptiveSampler)
+# v1.17.0: sensor lifecycle state machine; bounded warmup, hot-plug recovery
+# v1.18.0: optional PM2.5 sensor with AQI gauge and value (PM_SENSOR)
+# v1.19.0: single-bitmap labels allocated once for their widest text
+# v1.20.0: numeric values drawn from digit sprite sheets (DigitReadout)
+# v1.21.0: scales, title, and captions pre-rendered into one background layer
+# v1.22.0: auto_refresh off; one rate-limited display refresh per frame
+# v1.23.0: board profile registry (air_monitor_boards)
+# v1.23.1: boot warmup wait timed by the sensor lifecycle's clock
+# v1.23.2: an incompatible or corrupt datalog file no longer stops the boot
+# v1.23.3: sensor warmup waits one measurement interval plus the timeout
+# v1.23.4: screen layout and buffers sized from the board profile
+# v1.23.5: profile reports name the device by CPU UID and the board type
+# v1.23.6: background bitmaps only for the scale strips and caption rows
+# v1.23.7: button feedback schedules a display frame
+
+import sys
 import time
-import board
-import busio
-import os
+from air_monitor_profiler import Profiler
+
+boot_profile = Profiler("boot")  # Started first to time the imports
+import asyncio
 import displayio
-import neopixel
-import random
-from analogio import AnalogIn
-from digitalio import DigitalInOut
-from simpleio import tone
-from adafruit_display_text.label import Label
 from adafruit_bitmap_font import bitmap_font
 from adafruit_display_shapes.rect import Rect
-import adafruit_scd30
+from air_monitor_display.trend_chart import TrendChart
+from air_monitor_display.cached_label import CachedLabel
+from air_monitor_display.fixed_label import FixedLabel, text_box
+from air_monitor_display.digit_readout import DigitReadout
+from air_monitor_display.background import Background
+from air_monitor_display.refresh_scheduler import RefreshScheduler
+from air_monitor_display.glyph_font import GlyphFont
+from air_monitor_buttons.button_events import RELEASE
+from air_monitor_scheduler import PeriodicTask, report
+from air_monitor_boards import find_profile, load_panel
+from air_monitor_datalog import Datalog
+from air_monitor_sampling import AdaptiveSampler
+from air_monitor_sensor import SensorLifecycle, RESETTING, WARMING, STREAMING
+from air_monitor_particulates import PMMonitor
 from cedargrove_unit_converter.temperature import celsius_to_fahrenheit
 from cedargrove_unit_converter.air_quality.co2_air_quality import co2_ppm_to_quality
+from cedargrove_unit_converter.air_quality.co2_air_quality import CO2_CATEGORIES
+from cedargrove_unit_converter.air_quality.aqi_air_quality import PM25_BREAKPOINTS
+from cedargrove_unit_converter.air_quality.interpreter.translator import Translator
 
 from co2_mon_config import *
 
+boot_profile.enabled = PROFILE
+boot_profile.log_path = PROFILE_LOG
+boot_profile.lap("imports")
+loop_profile = Profiler("loop", PROFILE, PROFILE_LOG)
+pm_profile = Profiler("pm", PROFILE, PROFILE_LOG)
+
+if sys.implementation.name == "circuitpython":
+    import air_monitor_hal.device as hal
+else:  # Host computer; simulated sensor, display, and pins
+    import air_monitor_hal.simulated as hal
+
 SCREEN_TITLE = "Indoor Air Quality"
 
-# Import translator for alt language
-exec(
-    "from cedargrove_unit_converter.air_quality.interpreter.english_to_"
-    + ALT_LANGUAGE.lower()
-    + " import interpret"
+# CO2 quality scale bands: low ppm, high ppm, color
+CO2_SCALE = (
+    (0, 1000, GREEN),
+    (1000, 2000, YELLOW),
+    (2000, 5000, ORANGE),
+    (5000, 6000, RED),
 )
 
-board_type = os.uname().machine
+# UI phrase string IDs; index into ui_text
+(
+    TITLE,
+    WARMUP,
+    OVERRANGE,
+    CALIBRATE,
+    NO_SENSOR,
+    TEMPERATURE,
+    LANGUAGE,
+    ENGLISH,
+    ALARM,
+    LOW_BATTERY,
+    ALARM_LABEL,
+    QUALITY,  # First CO2 quality category; QUALITY + CO2_CATEGORIES index
+) = range(12)
+UI_PHRASES = (
+    SCREEN_TITLE,
+    "WARMUP",
+    "OVERRANGE",
+    "CALIBRATE",
+    "NO CO2 SENSOR",
+    "TEMPERATURE",
+    "LANGUAGE",
+    "ENGLISH",
+    "ALARM",
+    "LOW BATTERY",
+    CO2_ALARM[2],
+) + CO2_CATEGORIES
+
+# Translate the UI phrases to the alternate language once
+translator = Translator(ALT_LANGUAGE, UI_PHRASES)
+ui_text = translator.phrases(TRANSLATE)
+boot_profile.lap("translate")
+
+
+def all_phrases(*phrase_ids):
+    """Every language's text for the phrase IDs; used to size labels."""
+    return [
+        phrases[phrase_id]
+        for phrases in (translator.english, translator.translated)
+        for phrase_id in phrase_ids
+    ]
+
+
+board_type = hal.board_type
 print("Board:", board_type)
-if ("Pygamer" in board_type) or ("Pybadge" in board_type):
-    import air_monitor_buttons.buttons_pybadge as air_monitor_panel
-
-    has_speaker = True
-    has_battery_mon = True
-    battery_mon = AnalogIn(board.A6)
-    trend_points = 40
-    i2c_freq = 95000  # Slow I2C bus for SC-30 I2C communication
-elif "PyPortal" in board_type:
-    import air_monitor_buttons.buttons_pyportal as air_monitor_panel
-
-    has_speaker = True
-    has_battery_mon = False
-    trend_points = 40
-    i2c_freq = 95000  # Slow I2C bus for SC-30 I2C communication
-elif "CLUE" in board_type:
-    import air_monitor_buttons.buttons_clue as air_monitor_panel
-
-    has_speaker = False
-    has_battery_mon = False
-    trend_points = 30  # Adjusted for limited memory
-    i2c_freq = 25000  # Extra slow I2C bus for SC-30 I2C communication
-elif "FunHouse" in board_type:
-    import air_monitor_buttons.buttons_funhouse as air_monitor_panel
-    has_speaker = False
-    has_battery_mon = False
-    trend_points = 40
-    i2c_freq = 95000  # Slow I2C bus for SC-30 I2C communication
-else:
+board_profile = find_profile(board_type)
+if board_profile is None:
     print("--- Incompatible board ---")
+    raise RuntimeError("No board profile for " + board_type)
+air_monitor_panel = load_panel(board_profile)  # Only this board's panel module
+has_speaker = board_profile.speaker
+has_battery_mon = board_profile.battery_pin is not None
+if has_battery_mon:
+    battery_mon = hal.analog_in(board_profile.battery_pin)
+trend_points = board_profile.trend_points
+i2c_freq = board_profile.i2c_freq
 
 panel = air_monitor_panel.Buttons()
+for profiler in (boot_profile, loop_profile, pm_profile):
+    profiler.device = hal.device_id
+    profiler.board = board_type
+boot_profile.lap("board")
 
 # Instantiate I2C bus
-i2c = busio.I2C(board.SCL, board.SDA, frequency=i2c_freq)
-
-# Instantiate CO2 sensor
-try:
-    scd = adafruit_scd30.SCD30(i2c)
-    co2_sensor_exists = True
-except:
+i2c = hal.i2c(i2c_freq)
+
+# Instantiate the CO2 sensor lifecycle and detect the sensor; a missing or
+# failing sensor is retried with backoff while the monitor runs
+sampler = AdaptiveSampler(CO2_ALARM[0], SENSOR_INTERVAL_MIN, SENSOR_INTERVAL_MAX)
+sampler.interval = SENSOR_INTERVAL
+sensor_interval = sampler.interval
+co2_sensor = SensorLifecycle(
+    lambda: hal.scd30(i2c), sensor_interval, monotonic=hal.monotonic
+)
+co2_sensor.poll()
+if not co2_sensor.present:
     print("--- SCD30 SENSOR  ---")
     print("--- NOT CONNECTED ---")
-    co2_sensor_exists = False
 
+# Instantiate the optional particulate sensor; read by its own task
+pm_monitor = None
+if PM_SENSOR:
+    pm_monitor = PMMonitor(lambda: hal.pm25(i2c, PM_SENSOR), monotonic=hal.monotonic)
+    pm_monitor.poll()
+    if not pm_monitor.present:
+        print("--- PM2.5 SENSOR ---")
+        print("--- NOT CONNECTED ---")
+boot_profile.lap("sensor")
 
 # Instantiate display, fonts, speaker, and neopixels
-display = board.DISPLAY
+display = hal.display
 display.brightness = BRIGHTNESS
-WIDTH = display.width
-HEIGHT = display.height
-# Load the text font from the fonts folder
-if WIDTH > 160:
-    font_0 = bitmap_font.load_font("/fonts/OpenSans-12.bdf")
-    font_1 = bitmap_font.load_font("/fonts/Helvetica-Bold-36.bdf")
-else:
-    font_0 = bitmap_font.load_font("/fonts/OpenSans-9.bdf")
-    font_1 = bitmap_font.load_font("/fonts/OpenSans-16.bdf")
+# Lay out the screen and size its buffers for the board's display
+WIDTH = board_profile.width
+HEIGHT = board_profile.height
+if (display.width, display.height) != (WIDTH, HEIGHT):
+    print(
+        "--- DISPLAY %dx%d; PROFILE %dx%d ---"
+        % (display.width, display.height, WIDTH, HEIGHT)
+    )
+# Screen changes are sent in one refresh per frame once the tasks start
+frames = RefreshScheduler(display, DISPLAY_FPS, monotonic=hal.monotonic)
+AQI_GAUGE_WIDTH = 8 if pm_monitor else 0  # AQI gauge at the left edge
+
+
+def load_font(name):
+    """Load a font's prebuilt glyph file (see tools/build_font_cache.py) if
+    present, otherwise the BDF font file."""
+    try:
+        return GlyphFont(hal.font_path(name + ".aqgf"))
+    except OSError:
+        return bitmap_font.load_font(hal.font_path(name + ".bdf"))
+
+
+# Load the board's text fonts from the fonts folder
+font_0 = load_font(board_profile.fonts[0])
+font_1 = load_font(board_profile.fonts[1])
+boot_profile.lap("fonts")
 # Turn on speaker output
-if hasattr(board, "SPEAKER_ENABLE"):
-    speaker_enable = DigitalInOut(board.SPEAKER_ENABLE)
-    speaker_enable.switch_to_output(value=True)
+hal.enable_speaker()
 # Set NeoPixel brightness and clear all pixels
-if hasattr(board, "NEOPIXEL"):
+pixels = hal.neopixels(board_profile.neopixels) if board_profile.neopixels else None
+if pixels is not None:
     has_neopixel = True
-    pixels = neopixel.NeoPixel(board.NEOPIXEL, 5, pixel_order=neopixel.GRB)
     pixels.brightness = 0.05
     pixels.fill(0x000000)
 else:
     has_neopixel = False
 
 
+# Open the datalog; the filesystem must be writable (see boot.py)
+datalog = None
+if DATALOG_FILE:
+    try:
+        datalog = Datalog(DATALOG_FILE, DATALOG_RECORDS)
+    except OSError:
+        print("--- DATALOG NOT WRITABLE ---")
+    except ValueError:  # Another version's or a truncated file; left as is
+        print("--- DATALOG FILE INCOMPATIBLE ---")
+boot_profile.lap("peripherals")
+
+
 # ### Helpers ###
 def play_tone(freq=440, duration=0.01):
-    """ Play tones through the integral speaker. """
+    """Play tones through the integral speaker."""
     if has_speaker:
-        tone(board.A0, freq, duration)
+        hal.tone(freq, duration)
     return
 
 
 def flash_status(text="", duration=0.05):
-    """ Flash a status message once. """
+    """Flash a status message once."""
     status_label.color = WHITE
     status_label.text = text
     time.sleep(duration)
@@ -127,158 +244,200 @@ def flash_status(text="", duration=0.05):
     return
 
 
-def update_co2_image_frame(blocking=False, wait_time=3):
-    """Acquire SCD-30 data and update the display, returning sensor health flag.
-    When blocking = True, the function will wait until the sensor is ready, up
-    to 3 seconds (default). When blocking = False, the function will immediately
-    return if the sensor data is not available."""
+def read_battery_volts():
+    """Battery voltage; 0 if the board has no battery monitor."""
+    if has_battery_mon:
+        return round(battery_mon.value * 6.6 / 0xFFF0, 2)
+    return 0
+
+
+async def flash_status_async(text="", duration=0.05):
+    """Flash a status message once without blocking other tasks."""
+    status_label.color = WHITE
+    status_label.text = text
+    frames.invalidate()
+    await asyncio.sleep(duration)
+    status_label.color = BLACK
+    frames.invalidate()
+    await asyncio.sleep(duration)
+    status_label.text = ""
+    frames.invalidate()
+    return
+
+
+def update_co2_image_frame():
+    """Poll the SCD-30 lifecycle and update the display if a new measurement
+    is available, returning sensor health flag. Never blocks."""
+    global sensor_co2_latest, co2_readings
     sensor_data_valid = True  # Used for battery monitoring
-    if co2_sensor_exists:
-        t0 = time.monotonic()
-        while (
-            blocking
-            and (not scd.data_available)
-            and (t0 - time.monotonic() < wait_time)
-        ):
-            watchdog.fill = RED
-            flash_status(interpret(TRANSLATE, "WARMUP"), 0.5)
-
-        if scd.data_available:
-            watchdog.fill = YELLOW  # Data acquisition indicator: active
-            # Retrieve CO2 sensor data and round value
-            sensor_co2 = round(scd.CO2)
-            # Get the CO2 quality evaluation descriptor
-            (
-                sensor_data_valid,
-                sensor_co2,
-                co2_qual_label.color,
-                label,
-            ) = co2_ppm_to_quality(sensor_co2)
-            # Normalized to 0.0 to 1.0 (for plotting)
-            sensor_co2_norm = sensor_co2 / 6000
-            # Retrieve humidity data and round value
-            sensor_rh = round(scd.relative_humidity)
-            # Retrieve temperature data and round value
-            sensor_temp = round(scd.temperature)
-            if TEMP_UNIT == "F":  # Convert to Fahrenheit if required
-                sensor_temp = round(celsius_to_fahrenheit(sensor_temp))
-
-            if sensor_co2 < 6000:
-                # Plot quality co2_pointer on scale; adjust fill color for sensor value
-                co2_pointer.fill = GRAY
-                co2_pointer.y = HEIGHT - int(sensor_co2_norm * HEIGHT)
-                co2_pointer_shadow.y = co2_pointer.y
-            else:
-                # If quality is out-of-range, pin the co2_pointer and show a warning
-                co2_pointer.fill = CO2_ALARM[1]
-                co2_poointer_shadow.y = co2_pointer.y = 0
-                flash_status(interpret(TRANSLATE, "OVERRANGE"), 0.75)
-
-            # Update on-screen values
-            co2_qual_label.text = interpret(TRANSLATE, label)
-            co2_value.text = str(sensor_co2)
-            co2_humid_value.text = str(sensor_rh)
-            co2_temp_value.text = str(sensor_temp)
-            co2_alarm_value.text = str(CO2_ALARM[0])
-
-            # Draw the CO2 trend chart bars
-            for i in range(0, len(co2_trend_chart)):
-                co2_trend_group[len(co2_trend_chart) - i - 1].y = (
-                    HEIGHT - int(co2_trend_chart[i] * HEIGHT) + 1
-                )
-                co2_trend_group[len(co2_trend_chart) - i - 1].fill = GRAY
-            co2_trend_chart.pop(0)  # remove oldest point from trend
-            co2_trend_chart.append(sensor_co2_norm)  # add latest point
+    if co2_sensor.poll():
+        watchdog.fill = YELLOW  # Data acquisition indicator: active
+        loop_profile.restart()
+        if not co2_scale_shown:  # Sensor detected after startup
+            draw_background()
+        # Retrieve CO2 sensor data and round value
+        sensor_co2 = round(co2_sensor.CO2)
+        # Get the CO2 quality evaluation descriptor
+        (
+            sensor_data_valid,
+            sensor_co2,
+            co2_qual_label.color,
+            label,
+        ) = co2_ppm_to_quality(sensor_co2)
+        # Normalized to 0.0 to 1.0 (for plotting)
+        sensor_co2_norm = sensor_co2 / 6000
+        # Retrieve humidity data and round value
+        raw_rh = co2_sensor.relative_humidity
+        sensor_rh = round(raw_rh)
+        # Retrieve temperature data and round value
+        raw_temp = co2_sensor.temperature
+        sensor_temp = round(raw_temp)
+        loop_profile.lap("sensor read")
+        if datalog:
+            datalog.append(
+                time.time(), sensor_co2, raw_rh, raw_temp, read_battery_volts()
+            )
+            loop_profile.lap("datalog")
+        if TEMP_UNIT == "F":  # Convert to Fahrenheit if required
+            sensor_temp = round(celsius_to_fahrenheit(sensor_temp))
+
+        if sensor_co2 < 6000:
+            # Plot quality co2_pointer on scale; adjust fill color for sensor value
+            co2_pointer.fill = GRAY
+            co2_pointer.y = HEIGHT - int(sensor_co2_norm * HEIGHT)
+            co2_pointer_shadow.y = co2_pointer.y
+        else:
+            # If quality is out-of-range, pin the co2_pointer and show a warning
+            # (the alarm task flashes the OVERRANGE status)
+            co2_pointer.fill = CO2_ALARM[1]
+            co2_pointer_shadow.y = co2_pointer.y = 0
+        sensor_co2_latest = sensor_co2
+        co2_readings += 1
+        loop_profile.lap("pointer")
+
+        # Update on-screen values
+        co2_qual_label.text = ui_text[QUALITY + CO2_CATEGORIES.index(label)]
+        co2_value.value = sensor_co2
+        co2_humid_value.value = sensor_rh
+        co2_temp_value.value = sensor_temp
+        co2_alarm_value.value = CO2_ALARM[0]
+        loop_profile.lap("labels")
+
+        # Add latest point to the CO2 trend chart and redraw changed bars
+        co2_trend_chart.add(sensor_co2_norm)
+        loop_profile.lap("trend chart")
+        frames.invalidate()
     return sensor_data_valid
 
 
-play_tone(880, 0.1)  # A5
+def update_pm_frame():
+    """Read the particulate sensor and update the AQI gauge pointer and
+    value. Never blocks; a missing sensor is retried with backoff."""
+    if pm_monitor.poll():
+        pm_profile.restart()
+        if not aqi_scale_shown:  # Sensor detected after startup
+            draw_background()
+        if pm_monitor.valid:
+            aqi_pointer.y = HEIGHT - 2 - int(min(pm_monitor.aqi, 500) / 500 * HEIGHT)
+            aqi_value.text = "AQI %d" % pm_monitor.aqi
+            aqi_value.color = pm_monitor.color
+        pm_profile.lap("aqi display")
+        frames.invalidate()
+    elif not pm_monitor.present:
+        aqi_value.text = "AQI --"
+        aqi_value.color = GRAY
+        frames.invalidate()
+    return
 
-# ### Define the display groups ###
-image_group = displayio.Group()
-co2_trend_group = displayio.Group()
-reference_group = displayio.Group()
 
-# Define co2 trend chart group and points area
-co2_trend_chart = []
-point_width = int((WIDTH - 28) / trend_points)
-for i in range(0, WIDTH - 28, point_width):
-    point = Rect(
-        x=(WIDTH - 28) - i,
-        y=(HEIGHT - 6),
-        width=point_width,
-        height=HEIGHT * 2,
-        fill=None,
-        outline=None,
-        stroke=0,
-    )
-    co2_trend_chart.insert(0, HEIGHT)
-    co2_trend_group.append(point)
-image_group.append(co2_trend_group)
-
-# Define CO2 sensor quality scale
-if co2_sensor_exists:
-    co2_good_scale = Rect(
-        x=WIDTH - 22,
-        y=HEIGHT - int((1000 / 6000) * HEIGHT),
-        width=20,
-        height=int(((1000 - 0) / 6000) * HEIGHT) + 3,
-        fill=GREEN,
-        outline=BLACK,
-        stroke=1,
+def draw_background():
+    """Draw the static layer: the quality scales of the detected sensors,
+    the title, and the captions in the current language and temperature
+    unit. Called at startup and when any of those change."""
+    global co2_scale_shown, aqi_scale_shown
+    background.clear()
+    co2_scale_shown = co2_sensor.present
+    if co2_scale_shown:
+        for low, high, color in CO2_SCALE:
+            background.rect(
+                WIDTH - 22,
+                HEIGHT - int((high / 6000) * HEIGHT),
+                20,
+                int(((high - low) / 6000) * HEIGHT) + 3,
+                fill=color,
+                outline=BLACK,
+            )
+        alarm_y = HEIGHT - int((CO2_ALARM[0] / 6000) * HEIGHT)
+        background.rect(WIDTH - 25, alarm_y, 22, 4, fill=RED, outline=BLACK)
+        background.rect(WIDTH - 25, alarm_y, 22, 3, fill=CO2_ALARM[1], outline=BLACK)
+    aqi_scale_shown = pm_monitor is not None and pm_monitor.present
+    if aqi_scale_shown:  # AQI 0 to 500
+        for _, _, aqi_low, aqi_high, aqi_color, _ in PM25_BREAKPOINTS:
+            background.rect(
+                0,
+                HEIGHT - int((aqi_high / 500) * HEIGHT),
+                AQI_GAUGE_WIDTH - 2,
+                int(((aqi_high - aqi_low) / 500) * HEIGHT) + 1,
+                fill=aqi_color,
+            )
+    background.text(font_0, ui_text[TITLE], CYAN, (0.5, 0), ((WIDTH - 20) // 2, 0))
+    background.text(
+        font_0,
+        ui_text[ALARM_LABEL],
+        CO2_ALARM[1],
+        (0, 0),
+        (AQI_GAUGE_WIDTH + 5, HEIGHT - 14),
     )
-    reference_group.append(co2_good_scale)
-
-    co2_poor_scale = Rect(
-        x=WIDTH - 22,
-        y=HEIGHT - int((2000 / 6000) * HEIGHT),
-        width=20,
-        height=int(((2000 - 1000) / 6000) * HEIGHT) + 3,
-        fill=YELLOW,
-        outline=BLACK,
-        stroke=1,
+    background.text(
+        font_0, "°" + TEMP_UNIT, CYAN, (0.5, 0), ((WIDTH - 20) // 2, HEIGHT - 14)
     )
-    reference_group.append(co2_poor_scale)
-
-    co2_warning_scale = Rect(
-        x=WIDTH - 22,
-        y=HEIGHT - int((5000 / 6000) * HEIGHT),
-        width=20,
-        height=int(((5000 - 2000) / 6000) * HEIGHT) + 3,
-        fill=ORANGE,
-        outline=BLACK,
-        stroke=1,
+    background.text(font_0, "RH", CYAN, (1, 0), (WIDTH - 40, HEIGHT - 14))
+    background.text(
+        font_0, "PPM CO2", BLUE, (0.5, 0), ((WIDTH - 20) // 2, 4 + (HEIGHT // 2))
     )
-    reference_group.append(co2_warning_scale)
-
-    co2_danger_scale = Rect(
-        x=WIDTH - 22,
-        y=HEIGHT - int((6000 / 6000) * HEIGHT),
-        width=20,
-        height=int(((6000 - 5000) / 6000) * HEIGHT) + 3,
-        fill=RED,
-        outline=BLACK,
-        stroke=1,
-    )
-    reference_group.append(co2_danger_scale)
+    frames.invalidate()
+    return
 
-    co2_alarm_pointer_shadow = Rect(
-        x=WIDTH - 25, y=0, width=22, height=4, fill=RED, outline=BLACK, stroke=1
-    )
-    co2_alarm_pointer_shadow.y = HEIGHT - int((CO2_ALARM[0] / 6000) * HEIGHT)
-    reference_group.append(co2_alarm_pointer_shadow)
-
-    co2_alarm_pointer = Rect(
-        x=WIDTH - 25,
-        y=HEIGHT - int((CO2_ALARM[0] / 6000) * HEIGHT),
-        width=22,
-        height=3,
-        fill=CO2_ALARM[1],
-        outline=BLACK,
-        stroke=1,
+
+play_tone(880, 0.1)  # A5
+
+# ### Define the display groups ###
+image_group = displayio.Group()
+
+# Define co2 trend chart group and points area
+co2_trend_chart = TrendChart(
+    WIDTH - 28 - AQI_GAUGE_WIDTH, HEIGHT, trend_points, color=GRAY
+)
+co2_trend_chart.group.x = AQI_GAUGE_WIDTH
+image_group.append(co2_trend_chart.group)
+
+# Define the static layer: CO2 quality scale, AQI gauge, title, and
+# captions (see draw_background). Only the scale strips and the caption
+# rows get bitmaps.
+_, caption_height = text_box(
+    font_0, all_phrases(TITLE, ALARM_LABEL) + ["PPM CO2", "RH", "°CF"]
+)
+row_width = WIDTH - 25 - AQI_GAUGE_WIDTH
+regions = [
+    (WIDTH - 25, 0, 25, HEIGHT),  # CO2 scale and alarm marker
+    (AQI_GAUGE_WIDTH, 0, row_width, caption_height),  # Title
+    (AQI_GAUGE_WIDTH, 4 + (HEIGHT // 2), row_width, caption_height),  # PPM CO2
+    (AQI_GAUGE_WIDTH, HEIGHT - 14, row_width, 14),  # Bottom captions
+]
+if AQI_GAUGE_WIDTH:
+    regions.append((0, 0, AQI_GAUGE_WIDTH, HEIGHT))  # AQI gauge bands
+background = Background(regions)
+image_group.append(background.group)
+co2_scale_shown = False
+aqi_scale_shown = False
+draw_background()
+
+# Define AQI gauge pointer
+if pm_monitor:
+    aqi_pointer = Rect(
+        x=0, y=HEIGHT + 2, width=AQI_GAUGE_WIDTH, height=3, fill=WHITE, outline=BLACK
     )
-    reference_group.append(co2_alarm_pointer)
-    image_group.append(reference_group)
+    image_group.append(aqi_pointer)
 
 # Define co2 pointer
 co2_pointer_shadow = Rect(
@@ -292,65 +451,61 @@ co2_pointer = Rect(
 image_group.append(co2_pointer)
 
 # Define watchdog indicator
-watchdog = Rect(x=1, y=1, width=10, height=10, fill=None, outline=YELLOW, stroke=1)
+watchdog = Rect(
+    x=AQI_GAUGE_WIDTH + 1, y=1, width=10, height=10, fill=None, outline=YELLOW, stroke=1
+)
 image_group.append(watchdog)
 
-# Define titles, labels, and values for the image group
-title_label = Label(font_0, text=interpret(TRANSLATE, SCREEN_TITLE), color=CYAN)
-title_label.anchor_point = (0.5, 0)
-title_label.anchored_position = ((WIDTH - 20) // 2, 0)
-image_group.append(title_label)
-
-status_label = Label(font_0, text=" ", color=None)
+# Define status and values for the image group
+status_texts = all_phrases(
+    WARMUP,
+    OVERRANGE,
+    CALIBRATE,
+    NO_SENSOR,
+    TEMPERATURE,
+    LANGUAGE,
+    ENGLISH,
+    ALARM,
+    LOW_BATTERY,
+) + ["8.88 volts"]
+status_label = FixedLabel(font_0, status_texts, " ", color=None)
 status_label.anchor_point = (0.5, 0.5)
 status_label.anchored_position = ((WIDTH - 20) // 2, (HEIGHT // 2) + 27)
 image_group.append(status_label)
 
-co2_alarm_label = Label(
-    font_0, text=interpret(TRANSLATE, CO2_ALARM[2]), color=CO2_ALARM[1]
-)
-co2_alarm_label.anchor_point = (0, 0)
-co2_alarm_label.anchored_position = (5, HEIGHT - 14)
-image_group.append(co2_alarm_label)
-
-co2_alarm_value = Label(
-    font_0, text=str(CO2_ALARM[0]) if co2_sensor_exists else "----", color=CO2_ALARM[1]
+co2_alarm_value = DigitReadout(
+    font_0, 4, CO2_ALARM[0] if co2_sensor.present else None, color=CO2_ALARM[1]
 )
 co2_alarm_value.anchor_point = (0, 0)
-co2_alarm_value.anchored_position = (5, HEIGHT - 28)
+co2_alarm_value.anchored_position = (AQI_GAUGE_WIDTH + 5, HEIGHT - 28)
 image_group.append(co2_alarm_value)
 
-co2_temp_label = Label(font_0, text="°" + TEMP_UNIT, color=CYAN)
-co2_temp_label.anchor_point = (0.5, 0)
-co2_temp_label.anchored_position = ((WIDTH - 20) // 2, HEIGHT - 14)
-image_group.append(co2_temp_label)
+if pm_monitor:
+    aqi_value = FixedLabel(font_0, ("AQI --", "AQI 500"), "AQI --", color=GRAY)
+    aqi_value.anchor_point = (0, 0)
+    aqi_value.anchored_position = (AQI_GAUGE_WIDTH + 5, HEIGHT - 42)
+    image_group.append(aqi_value)
+    aqi_value = CachedLabel(aqi_value)
 
-co2_temp_value = Label(font_0, text=" " if co2_sensor_exists else "--", color=CYAN)
+co2_temp_value = DigitReadout(font_0, 3, color=CYAN)
 co2_temp_value.anchor_point = (0.5, 0)
 co2_temp_value.anchored_position = ((WIDTH - 20) // 2, HEIGHT - 28)
 image_group.append(co2_temp_value)
 
-co2_humid_label = Label(font_0, text="RH", color=CYAN)
-co2_humid_label.anchor_point = (1, 0)
-co2_humid_label.anchored_position = (WIDTH - 40, HEIGHT - 14)
-image_group.append(co2_humid_label)
-
-co2_humid_value = Label(font_0, text=" " if co2_sensor_exists else "--", color=CYAN)
+co2_humid_value = DigitReadout(font_0, 3, color=CYAN)
 co2_humid_value.anchor_point = (1, 0)
 co2_humid_value.anchored_position = (WIDTH - 40, HEIGHT - 28)
 image_group.append(co2_humid_value)
 
-co2_qual_label = Label(font_1, text=" ", color=None)
+co2_qual_label = FixedLabel(
+    font_1, all_phrases(*range(QUALITY, QUALITY + len(CO2_CATEGORIES))), " ", None
+)
 co2_qual_label.anchor_point = (0.5, 0.5)
 co2_qual_label.anchored_position = ((WIDTH - 20) // 2, HEIGHT // 4)
 image_group.append(co2_qual_label)
+co2_qual_label = CachedLabel(co2_qual_label)
 
-co2_label = Label(font_0, text="PPM CO2", color=BLUE)
-co2_label.anchor_point = (0.5, 0)
-co2_label.anchored_position = ((WIDTH - 20) // 2, 4 + (HEIGHT // 2))
-image_group.append(co2_label)
-
-co2_value = Label(font_1, text=" " if co2_sensor_exists else "---", color=WHITE)
+co2_value = DigitReadout(font_1, 4, color=WHITE)
 co2_value.anchor_point = (0.5, 1.0)
 co2_value.anchored_position = ((WIDTH - 20) // 2, HEIGHT // 2)
 image_group.append(co2_value)
@@ -359,81 +514,194 @@ image_group.append(co2_value)
 if panel.button_display_group:
     image_group.append(panel.button_display_group)
 
+boot_profile.lap("display groups")
+
 # ###--- PRIMARY PROCESS SETUP ---###
+sensor_co2_latest = None  # Most recent CO2 reading; None until acquired
+co2_readings = 0  # Number of CO2 readings acquired
+sensor_valid = True
 # Activate display and play welcome tones
 display.show(image_group)
-if co2_sensor_exists:
-    scd.reset()  # Reset sensor and set acquisition interval
-    scd.measurement_interval = SENSOR_INTERVAL
-    # Wait for sensor data and display
-    sensor_valid = update_co2_image_frame(blocking=True)
+if co2_sensor.present:
+    # Wait for the first measurement; the lifecycle's warmup timeout (and
+    # the boot deadline) bound the wait
+    watchdog.fill = RED
+    status_label.color = WHITE
+    status_label.text = ui_text[WARMUP]
+    boot_deadline = hal.monotonic() + sensor_interval + 15
+    while co2_sensor.state in (RESETTING, WARMING) and hal.monotonic() < boot_deadline:
+        sensor_valid = update_co2_image_frame()
+        hal.sleep(0.1)
+    status_label.text = ""
 else:
-    flash_status(interpret(TRANSLATE, "NO CO2 SENSOR"), 2.0)
+    flash_status(ui_text[NO_SENSOR], 2.0)
+boot_profile.lap("first reading")
+boot_profile.report()
 
 play_tone(440, 0.1)  # A4
 play_tone(880, 0.1)  # A5
 
-# ###--- PRIMARY PROCESS LOOP ---###
-t0 = time.monotonic()  # Reset sensor interval timer
-while True:
-    panel.timeout = 1.0  # Set button hold time: long hold
-    button_pressed, hold_time = panel.read_buttons()
-    if button_pressed == "calibrate":  # Recalibrate mode selected
-        if hold_time >= 1.0:  # long press
-            if co2_sensor_exists:
-                flash_status(interpret(TRANSLATE, "CALIBRATE"), 0.5)
-                scd.forced_recalibration_reference = 400
-                print("recal ref:", scd.forced_recalibration_reference)
-            else:
-                flash_status(interpret(TRANSLATE, "NO CO2 SENSOR"), 0.5)
-            play_tone(440, 0.1)  # A4
-    if button_pressed == "temperature":  # Toggle temperature units
-        if hold_time >= 1.0:  # long press
-            flash_status(interpret(TRANSLATE, "TEMPERATURE"), 0.5)
-            if TEMP_UNIT == "F":
-                TEMP_UNIT = "C"
-            else:
-                TEMP_UNIT = "F"
-            co2_temp_label.text = "°" + TEMP_UNIT
-            play_tone(440, 0.1)  # A4
-    if button_pressed == "language":  # Toggle language
-        if hold_time >= 1.0:  # long press
-            flash_status(interpret(TRANSLATE, "LANGUAGE"), 0.5)
-            TRANSLATE = not TRANSLATE
-            title_label.text = interpret(TRANSLATE, SCREEN_TITLE)
-            co2_alarm_label.text = interpret(TRANSLATE, CO2_ALARM[2])
-            play_tone(440, 0.1)  # A4
-            if TRANSLATE:
-                flash_status(interpret(True, "ENGLISH"), 0.5)
-            else:
-                flash_status("ENGLISH", 0.5)
-
-    if time.monotonic() - SENSOR_INTERVAL > t0:
-        # Acquire sensor data and update display
-        sensor_valid = update_co2_image_frame()
-        t0 = time.monotonic()
-    else:
-        watchdog.fill = BLUE
-        watchdog.x = int(((time.monotonic() - t0) / SENSOR_INTERVAL) * 10) - 10
-        watchdog.y = watchdog.x
-
-    # If CO2 alarm threshold is reached, flash NeoPixels, ALARM status, and play alarm tone
-    if co2_sensor_exists:
-        if co2_value.text != " " and float(co2_value.text) >= CO2_ALARM[0]:
-            flash_status(interpret(TRANSLATE, "ALARM"), 0.75)
+
+# ###--- PRIMARY PROCESS TASKS ---###
+async def sensor_task():
+    """Acquire sensor data and update display once a measurement is due,
+    polling until the sensor has it. Then adapt the sensor's measurement
+    interval to the CO2 trend and alarm proximity. While the sensor is
+    missing or recovering, polling drives its detection and reset."""
+    global sensor_valid, sensor_interval, t0
+    if time.monotonic() - t0 < sensor_interval:
+        return
+    readings = co2_readings
+    sensor_valid = update_co2_image_frame()
+    if co2_readings == readings:
+        if co2_sensor.state != STREAMING:
+            watchdog.fill = RED
+            frames.invalidate()
+        return  # Not ready yet; poll again next run
+    t0 = time.monotonic()  # Reset sensor interval timer
+    sensor_interval = co2_sensor.interval = sampler.update(sensor_co2_latest, t0)
+    return
+
+
+async def ui_task():
+    """Animate the watchdog indicator between sensor readings. A cosmetic
+    animation: it runs at a low rate and only asks for a frame when the
+    indicator moves."""
+    if time.monotonic() - t0 <= sensor_interval:
+        x = AQI_GAUGE_WIDTH + int(((time.monotonic() - t0) / sensor_interval) * 10) - 10
+        if x != watchdog.x:
+            watchdog.fill = BLUE
+            watchdog.x = watchdog.y = x
+            frames.invalidate()
+    return
+
+
+async def display_task():
+    """Send the screen changes made since the last frame to the display."""
+    frames.refresh()
+    return
+
+
+async def input_task():
+    """Act on long button presses when the button is released."""
+    global TEMP_UNIT, TRANSLATE, ui_text
+    if panel.poll():  # Button feedback (e.g. highlights) may change the screen
+        frames.invalidate()
+    event = panel.events.get()
+    while event:
+        if event.kind == RELEASE and event.duration >= 1.0:  # long press
+            if event.name == "calibrate":  # Recalibrate mode selected
+                if co2_sensor.recalibrate(400):
+                    await flash_status_async(ui_text[CALIBRATE], 0.5)
+                    print("recal ref:", 400)
+                else:
+                    await flash_status_async(ui_text[NO_SENSOR], 0.5)
+                play_tone(440, 0.1)  # A4
+            if event.name == "temperature":  # Toggle temperature units
+                await flash_status_async(ui_text[TEMPERATURE], 0.5)
+                if TEMP_UNIT == "F":
+                    TEMP_UNIT = "C"
+                else:
+                    TEMP_UNIT = "F"
+                draw_background()
+                play_tone(440, 0.1)  # A4
+            if event.name == "language":  # Toggle language
+                await flash_status_async(ui_text[LANGUAGE], 0.5)
+                TRANSLATE = not TRANSLATE
+                ui_text = translator.phrases(TRANSLATE)
+                draw_background()
+                play_tone(440, 0.1)  # A4
+                # Show the newly selected language name
+                await flash_status_async(ui_text[ENGLISH], 0.5)
+        event = panel.events.get()
+    return
+
+
+async def pm_task():
+    """Read the particulate sensor and update the AQI gauge."""
+    update_pm_frame()
+    return
+
+
+async def alarm_task():
+    """If CO2 alarm threshold is reached, flash NeoPixels, ALARM status, and
+    play alarm tone. Flash OVERRANGE status when the sensor is pinned, and
+    WARMUP or NO CO2 SENSOR status while the sensor is not streaming."""
+    if co2_sensor.state != STREAMING:
+        if co2_sensor.state in (RESETTING, WARMING):
+            await flash_status_async(ui_text[WARMUP], 0.75)
+        else:
+            await flash_status_async(ui_text[NO_SENSOR], 0.75)
+    elif sensor_co2_latest is not None:
+        if sensor_co2_latest >= 6000:
+            await flash_status_async(ui_text[OVERRANGE], 0.75)
+        if sensor_co2_latest >= CO2_ALARM[0]:
+            await flash_status_async(ui_text[ALARM], 0.75)
             if has_neopixel:
                 pixels.fill(RED)
             play_tone(880, 0.015)  # A5
             if has_neopixel:
                 pixels.fill(BLACK)
+    return
 
-    if has_battery_mon:
-        """Warns when battery voltage is low and the sensor data is potentially
-        invalid (measured value is less than 100). The 3.3-volt threshold is an
-        approximation since an individual board's battery monitoring circuitry
-        can vary +/-10% due to internal voltage divider resistor tolerance."""
-        battery_volts = round(battery_mon.value * 6.6 / 0xFFF0, 2)
-        if (not sensor_valid) and battery_volts < 3.3:
-            play_tone(880, 0.030)  # A5
-            flash_status(interpret(TRANSLATE, "LOW BATTERY"), 1)
-            flash_status(str(battery_volts) + " volts", 1)
+
+async def battery_task():
+    """Warns when battery voltage is low and the sensor data is potentially
+    invalid (measured value is less than 100). The 3.3-volt threshold is an
+    approximation since an individual board's battery monitoring circuitry
+    can vary +/-10% due to internal voltage divider resistor tolerance."""
+    battery_volts = read_battery_volts()
+    if (not sensor_valid) and battery_volts < 3.3:
+        play_tone(880, 0.030)  # A5
+        await flash_status_async(ui_text[LOW_BATTERY], 1)
+        await flash_status_async(str(battery_volts) + " volts", 1)
+    return
+
+
+async def report_task():
+    """Print worst-case task latency, avoided label re-layouts, and sensor
+    update stage timing for the last reporting period."""
+    report(tasks)
+    loop_profile.report()
+    pm_profile.report()
+    relayouts, skipped, skipped_per_hour = CachedLabel.stats()
+    print(
+        "labels: %d relayouts, %d skipped (%d/hour)"
+        % (relayouts, skipped, skipped_per_hour)
+    )
+    CachedLabel.reset_stats()
+    frame_count, fps, refresh_ms, max_refresh_ms = frames.stats()
+    print(
+        "display: %d frames (%.1f fps), refresh %.1f ms average, %.1f ms max"
+        % (frame_count, fps, refresh_ms, max_refresh_ms)
+    )
+    frames.reset_stats()
+    return
+
+
+# ###--- PRIMARY PROCESS LOOP ---###
+t0 = time.monotonic()  # Reset sensor interval timer
+panel.timeout = 1.0  # Set button hold time: long hold
+frames.start()  # Display refreshes only from display_task from here on
+tasks = [
+    PeriodicTask("display", 1 / DISPLAY_FPS, display_task),
+    PeriodicTask("sensor", 0.5, sensor_task),
+    PeriodicTask("ui", 0.5, ui_task),
+    PeriodicTask("input", 0.05, input_task),
+    PeriodicTask("alarm", 2.0, alarm_task),
+]
+if has_battery_mon:
+    tasks.append(PeriodicTask("battery", 10.0, battery_task))
+if pm_monitor:
+    tasks.append(PeriodicTask("pm", PM_INTERVAL, pm_task))
+
+
+async def main():
+    await asyncio.gather(
+        *[asyncio.create_task(task.run()) for task in tasks],
+        asyncio.create_task(PeriodicTask("report", 60.0, report_task).run()),
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,134 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Studios
+# SPDX-License-Identifier: MIT
+
+# benchmark_aqi.py
+# 2026-10-18 version 1.0
+
+# Host-side benchmark: the original elif-ladder concentration_to_aqi
+# (copied below from aqi_air_quality.py version 1.0) versus the
+# table-driven concentration_to_aqi (scalar) and concentration_to_aqi_batch
+# (NumPy) on simulated one-minute PM2.5 data. Both new paths are checked
+# against the original for validity, AQI, color, and category.
+# Usage: python3 tools/benchmark_aqi.py [samples]
+
+import sys
+import time
+
+sys.path.insert(0, "bundle")
+
+import numpy as np
+from cedargrove_unit_converter.air_quality.aqi_air_quality import (
+    AQI_CATEGORIES,
+    concentration_to_aqi,
+    concentration_to_aqi_batch,
+)
+
+# ### Reference: aqi_air_quality.py version 1.0 (2021-09-07), verbatim except
+# for the baseline_ prefix on the function names ###
+RED = 0xFF0000
+YELLOW = 0xFFFF00
+BLUE = 0x0000FF
+ORANGE = 0xFFA500
+GREEN = 0x00FF00
+PURPLE = 0x800080
+MAROON = 0x800000
+
+
+def baseline_map_range(x, in_min, in_max, out_min, out_max):
+    """
+    Maps and constrains an input value from one range of values to another.
+    (from adafruit_simpleio)
+    :return: Returns value mapped to new range
+    :rtype: float
+    """
+    in_range = in_max - in_min
+    in_delta = x - in_min
+    if in_range != 0:
+        mapped = in_delta / in_range
+    elif in_delta != 0:
+        mapped = in_delta
+    else:
+        mapped = 0.5
+    mapped *= out_max - out_min
+    mapped += out_min
+    if out_min <= out_max:
+        return max(min(mapped, out_max), out_min)
+    return min(max(mapped, out_max), out_min)
+
+
+def baseline_concentration_to_aqi(pm25_value):
+    """Returns a data valid flag, calculated air quality index (AQI), color,
+    and category.
+    NOTE: The AQI returned by this function should ideally be measured
+    using the 24-hour concentration average. Calculating a AQI without
+    averaging will result in higher AQI values than expected.
+    :param float pm_sensor_reading: Particulate matter sensor value,
+    2.5 particle size.
+    """
+    # Check sensor reading using EPA breakpoints
+    if pm25_value > 500:
+        return True, 500, MAROON, "OVERRANGE"
+    elif pm25_value > 350:
+        aqi_value = int(baseline_map_range(pm25_value, 350, 500, 400, 500))
+        return True, aqi_value, MAROON, "HAZARDOUS"
+    elif pm25_value > 250:
+        aqi_value = int(baseline_map_range(pm25_value, 250, 350, 300, 400))
+        return True, aqi_value, MAROON, "HAZARDOUS"
+    elif pm25_value > 150:
+        aqi_value = int(baseline_map_range(pm25_value, 150, 250, 200, 300))
+        return True, aqi_value, PURPLE, "V UNHEALTHY"
+    elif pm25_value > 55:
+        aqi_value = int(baseline_map_range(pm25_value, 55, 150, 150, 200))
+        return True, aqi_value, RED, "UNHEALTHY"
+    elif pm25_value > 35:
+        aqi_value = int(baseline_map_range(pm25_value, 35, 55, 100, 150))
+        return True, aqi_value, ORANGE, "SENSITIVE"
+    elif pm25_value > 12:
+        aqi_value = int(baseline_map_range(pm25_value, 12, 35, 50, 100))
+        return True, aqi_value, YELLOW, "MODERATE"
+    elif pm25_value > 0:
+        aqi_value = int(baseline_map_range(pm25_value, 0, 12, 0, 50))
+        return True, aqi_value, GREEN, "GOOD"
+    return False, -1, BLUE, "INVALID"
+
+
+SAMPLES = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+
+rng = np.random.default_rng(2021)
+pm25 = rng.lognormal(mean=2.5, sigma=1.0, size=SAMPLES)
+# Band edges, zero, and over-range values, then the random samples
+edges = [-1.0, 0.0, 12.0, 12.05, 35.0, 55.0, 150.0, 250.0, 350.0, 500.0, 500.1]
+pm25 = np.concatenate((np.asarray(edges), pm25))
+
+t0 = time.perf_counter()
+valid, aqi, colors, categories = concentration_to_aqi_batch(pm25)
+batch_time = time.perf_counter() - t0
+print("batch:    %d samples in %.3f s" % (len(pm25), batch_time))
+
+# The scalar paths are timed on a subset and extrapolated to the full count
+subset = pm25[: min(len(pm25), 1_000_000)].tolist()
+scale = len(pm25) / len(subset)
+t0 = time.perf_counter()
+baseline = [baseline_concentration_to_aqi(value) for value in subset]
+baseline_time = (time.perf_counter() - t0) * scale
+print("original: %d samples in %.3f s (extrapolated)" % (len(pm25), baseline_time))
+t0 = time.perf_counter()
+scalar = [concentration_to_aqi(value) for value in subset]
+scalar_time = (time.perf_counter() - t0) * scale
+print("scalar:   %d samples in %.3f s (extrapolated)" % (len(pm25), scalar_time))
+print(
+    "speedup over the original: batch %.1fx, scalar %.1fx"
+    % (baseline_time / batch_time, baseline_time / scalar_time)
+)
+
+assert scalar == baseline, "table-driven scalar and original AQI differ"
+batch = list(
+    zip(
+        (bool(flag) for flag in valid[: len(subset)]),
+        aqi[: len(subset)].tolist(),
+        colors[: len(subset)].tolist(),
+        (AQI_CATEGORIES[index] for index in categories[: len(subset)]),
+    )
+)
+assert batch == baseline, "batch and original AQI differ"
+print("parity: %d samples match the original" % len(subset))
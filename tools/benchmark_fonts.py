@@ -0,0 +1,115 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# benchmark_fonts.py
+# 2026-10-18 version 1.0
+
+# Host-side benchmark: boot-time font loading with bitmap_font (BDF files,
+# glyphs loaded for the UI character set) versus the binary glyph files
+# from build_font_cache.py. Reports load time and Python heap allocated,
+# and checks that both produce identical glyphs. Blinka's displayio.Bitmap
+# writes pixels in Python, which swamps the file parsing on a host, so the
+# loaders are also timed with a plain bytearray bitmap ("parse"). Needs the
+# Blinka displayio and bitmap_font packages. On a device, compare
+# time.monotonic() and gc.mem_free() around the font loading in code.py.
+# Usage: python3 tools/benchmark_fonts.py
+
+import os
+import sys
+import glob
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from build_font_cache import BUNDLE, ui_characters
+from adafruit_bitmap_font import bitmap_font
+import air_monitor_display.glyph_font as glyph_font
+from air_monitor_display.glyph_font import GlyphFont
+
+
+class ByteBitmap:
+    def __init__(self, width, height, value_count):
+        """Minimal bitmap: one byte per pixel, no dirty area tracking."""
+        self.width = width
+        self.height = height
+        self._pixels = bytearray(width * height)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, tuple):
+            index = index[1] * self.width + index[0]
+        self._pixels[index] = value
+
+    def __getitem__(self, index):
+        if isinstance(index, tuple):
+            index = index[1] * self.width + index[0]
+        return self._pixels[index]
+
+
+def measure(load):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    font = load()
+    elapsed = time.perf_counter() - t0
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return font, elapsed, allocated
+
+
+def pixels(glyph):
+    return [glyph.bitmap[x, y] for y in range(glyph.height) for x in range(glyph.width)]
+
+
+characters = sorted(ui_characters())
+for bdf_path in sorted(glob.glob(os.path.join(BUNDLE, "fonts", "*.bdf"))):
+    cache_path = bdf_path[: -len(".bdf")] + ".aqgf"
+
+    def load_bdf(bitmap_class=None):
+        font = bitmap_font.load_font(bdf_path, bitmap_class)
+        font.load_glyphs(characters)
+        return font
+
+    bdf, bdf_time, bdf_memory = measure(load_bdf)
+    cache, cache_time, cache_memory = measure(lambda: GlyphFont(cache_path))
+    print(
+        "%-22s BDF %7.1f ms %6d bytes  glyph file %6.1f ms %6d bytes  %4.1fx faster"
+        % (
+            os.path.basename(bdf_path),
+            bdf_time * 1000,
+            bdf_memory,
+            cache_time * 1000,
+            cache_memory,
+            bdf_time / cache_time,
+        )
+    )
+
+    readinto = glyph_font._bitmap_readinto
+    glyph_font._bitmap_readinto = None  # Needs a displayio.Bitmap
+    _, parse_bdf_time, _ = measure(lambda: load_bdf(ByteBitmap))
+    _, parse_cache_time, _ = measure(lambda: GlyphFont(cache_path, ByteBitmap))
+    glyph_font._bitmap_readinto = readinto
+    print(
+        "%-22s parse %5.1f ms %19.1f ms %21.1fx faster"
+        % (
+            "",
+            parse_bdf_time * 1000,
+            parse_cache_time * 1000,
+            parse_bdf_time / parse_cache_time,
+        )
+    )
+
+    for code_point in characters:
+        expected = bdf.get_glyph(code_point)
+        glyph = cache.get_glyph(code_point)
+        if expected is None:
+            assert glyph is None, "%s: extra glyph %d" % (cache_path, code_point)
+            continue
+        for field in ("width", "height", "dx", "dy", "shift_x", "shift_y"):
+            assert getattr(expected, field) == getattr(
+                glyph, field
+            ), "%s: glyph %d %s differs" % (cache_path, code_point, field)
+        assert pixels(expected) == pixels(glyph), "%s: glyph %d pixels differ" % (
+            cache_path,
+            code_point,
+        )
+    assert bdf.get_bounding_box() == cache.get_bounding_box()
@@ -0,0 +1,131 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# benchmark_i2c.py
+# 2026-10-18 version 1.0
+
+# Host-side benchmark: I2C traffic per SCD-30 sample for the adafruit_scd30
+# value properties (data_available, then CO2, relative_humidity, and
+# temperature) versus BatchSCD30 (data_available, then read_measurement).
+# A fake I2C bus emulates the sensor's data-ready and read-measurement
+# commands and counts bus transfers and bytes; driver sleeps are tallied
+# instead of slept. Needs the adafruit-circuitpython-scd30 and
+# adafruit-circuitpython-busdevice packages.
+# Usage: python3 tools/benchmark_i2c.py [samples]
+
+import os
+import sys
+import time
+import struct
+
+BUNDLE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "bundle")
+sys.path.insert(0, BUNDLE)
+
+import adafruit_scd30
+from air_monitor_hal.scd30_batch import BatchSCD30, crc8
+
+SAMPLES = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+I2C_FREQUENCIES = (25000, 95000)  # i2c_freq range used by the boards
+
+
+class FakeSCD30Bus:
+    def __init__(self, address=0x61):
+        """busio.I2C stand-in with an SCD-30 at address."""
+        self.address = address
+        self.transfers = 0
+        self.bytes = 0
+        self.ready = False
+        self.values = (800.0, 21.5, 45.0)  # CO2, temperature, humidity
+        self._command = 0
+        return
+
+    def try_lock(self):
+        return True
+
+    def unlock(self):
+        return
+
+    def writeto(self, address, buffer, *, start=0, end=None):
+        if address != self.address:
+            raise OSError(19, "No such device")
+        data = bytes(buffer[start:end])
+        self.transfers += 1
+        self.bytes += 1 + len(data)  # Address byte plus data
+        if len(data) >= 2:
+            self._command = data[0] << 8 | data[1]
+        return
+
+    def readfrom_into(self, address, buffer, *, start=0, end=None):
+        end = len(buffer) if end is None else end
+        response = self._response()
+        for i in range(start, end):
+            buffer[i] = response[i - start] if i - start < len(response) else 0
+        self.transfers += 1
+        self.bytes += 1 + end - start
+        return
+
+    def _response(self):
+        if self._command == 0x0202:  # Get data ready status
+            return self._words(struct.pack(">H", int(self.ready)))
+        if self._command == 0x0300:  # Read measurement
+            self.ready = False
+            return self._words(struct.pack(">fff", *self.values))
+        return self._words(b"\x00\x02")  # Configuration reads
+
+    @staticmethod
+    def _words(data):
+        out = bytearray()
+        for i in range(0, len(data), 2):
+            out += data[i : i + 2] + bytes((crc8(data, i, i + 2),))
+        return out
+
+
+slept = [0.0]
+
+
+def fake_sleep(seconds):
+    slept[0] += seconds
+
+
+def measure(read):
+    """Returns transfers, bytes, and driver sleep seconds per sample."""
+    bus.transfers = bus.bytes = 0
+    slept[0] = 0.0
+    for _ in range(SAMPLES):
+        bus.ready = True
+        values = read()
+        assert [round(v, 2) for v in values] == [800.0, 21.5, 45.0], values
+    return bus.transfers / SAMPLES, bus.bytes / SAMPLES, slept[0] / SAMPLES
+
+
+time.sleep = fake_sleep
+bus = FakeSCD30Bus()
+driver = adafruit_scd30.SCD30(bus)
+batch = BatchSCD30(driver)
+
+
+def read_properties():
+    if driver.data_available:
+        return driver.CO2, driver.temperature, driver.relative_humidity
+    return None
+
+
+def read_batch():
+    if batch.data_available:
+        return batch.read_measurement()
+    return None
+
+
+print("%d samples" % SAMPLES)
+for name, read in (("properties", read_properties), ("batch", read_batch)):
+    transfers, data_bytes, sleep = measure(read)
+    # Each byte is 9 clocks (8 bits + ACK); each transfer adds start/stop
+    bus_times = [
+        (data_bytes * 9 + transfers * 2) / frequency * 1000
+        for frequency in I2C_FREQUENCIES
+    ]
+    print(
+        "%-10s %5.1f transfers %5.1f bytes  bus %5.2f ms @25 kHz %5.2f ms @95 kHz"
+        "  driver delays %5.1f ms"
+        % (name, transfers, data_bytes, *bus_times, sleep * 1000)
+    )
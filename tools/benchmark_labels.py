@@ -0,0 +1,65 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# benchmark_labels.py
+# 2026-10-18 version 1.0
+
+# Host-side benchmark: time and heap allocation per update of the big CO2
+# value for adafruit_display_text Label, bitmap_label, FixedLabel, and
+# DigitReadout (set from the integer; the others from str(value)).
+# Allocations are counted with tracemalloc; blocks still held after the
+# updates show what each label leaves on the heap. Blinka bitmaps are pure
+# Python, so compare the labels with each other rather than with device
+# timing; on a board, set PROFILE = True and compare the "labels" stage
+# and gc.mem_free() instead. Needs the Blinka displayio packages (see
+# simulate_monitor.py).
+# Usage: python3 tools/benchmark_labels.py [updates]
+
+import os
+import sys
+import time
+import tracemalloc
+
+BUNDLE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "bundle")
+sys.path.insert(0, BUNDLE)
+
+from adafruit_display_text import label, bitmap_label
+from air_monitor_display.fixed_label import FixedLabel
+from air_monitor_display.digit_readout import DigitReadout
+from air_monitor_display.glyph_font import GlyphFont
+
+UPDATES = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+FONT = os.path.join(BUNDLE, "fonts", "Helvetica-Bold-36.aqgf")
+
+font = GlyphFont(FONT)
+# A meeting room: CO2 rising through three and four digits
+values = [400 + (i * 37) % 1800 for i in range(UPDATES)]
+
+labels = (
+    ("Label", lambda: label.Label(font, text="8888")),
+    ("bitmap_label", lambda: bitmap_label.Label(font, text="8888")),
+    ("FixedLabel", lambda: FixedLabel(font, ("8888", "---"), "8888")),
+    ("DigitReadout", lambda: DigitReadout(font, 4, 8888)),
+)
+
+print("%d updates, %s" % (UPDATES, os.path.basename(FONT)))
+for name, make in labels:
+    test_label = make()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    t0 = time.perf_counter()
+    if isinstance(test_label, DigitReadout):
+        for value in values:
+            test_label.value = value
+    else:
+        for value in values:
+            test_label.text = str(value)
+    elapsed = time.perf_counter() - t0
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    held = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    print(
+        "%-12s %7.3f ms/update  peak %7d bytes  held %+7d bytes"
+        % (name, elapsed / UPDATES * 1000, peak, held)
+    )
@@ -0,0 +1,67 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Studios
+# SPDX-License-Identifier: MIT
+
+# benchmark_temperature.py
+# 2026-10-18 version 1.0
+
+# Host-side benchmark: scalar dew_point/heat_index versus the NumPy
+# dew_point_array/heat_index_array on simulated temperature/RH pairs.
+# The array results are then checked against the scalar functions on
+# sensor-quantized pairs (0.01 degC, 0.1 %RH); quantized inputs land on
+# rounding ties that random floats almost never hit.
+# Usage: python3 tools/benchmark_temperature.py [samples]
+
+import sys
+import time
+
+sys.path.insert(0, "bundle")
+
+import numpy as np
+from cedargrove_unit_converter.temperature import (
+    dew_point,
+    dew_point_array,
+    heat_index,
+    heat_index_array,
+)
+
+SAMPLES = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+
+rng = np.random.default_rng(2021)
+deg_c = rng.uniform(10, 45, SAMPLES)
+humidity = rng.uniform(5, 95, SAMPLES)
+subset = min(SAMPLES, 500_000)  # Scalar runs are extrapolated from a subset
+
+for name, scalar, vector in (
+    ("dew_point", dew_point, dew_point_array),
+    ("heat_index", heat_index, heat_index_array),
+):
+    t0 = time.perf_counter()
+    values, messages = vector(deg_c, humidity, verbose=True)
+    vector_time = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    scalar_values = [
+        scalar(c, r, verbose=True) for c, r in zip(deg_c[:subset], humidity[:subset])
+    ]
+    scalar_time = (time.perf_counter() - t0) * SAMPLES / subset
+
+    print(
+        "%-10s array %.3f s  scalar %.3f s (extrapolated)  speedup %.1fx"
+        % (name, vector_time, scalar_time, scalar_time / vector_time)
+    )
+    expected = [v[0] if isinstance(v, tuple) else v for v in scalar_values]
+    assert expected == values[:subset].tolist(), name + " array and scalar differ"
+
+# Parity on sensor-quantized inputs, -10 to 45 degC
+QUANTIZED = min(SAMPLES, 300_000)
+deg_c = np.round(rng.uniform(-10, 45, QUANTIZED), 2)
+humidity = np.round(rng.uniform(0, 100, QUANTIZED), 1)
+for name, scalar, vector in (
+    ("dew_point", dew_point, dew_point_array),
+    ("heat_index", heat_index, heat_index_array),
+):
+    values = vector(deg_c, humidity)
+    expected = [scalar(c, r) for c, r in zip(deg_c.tolist(), humidity.tolist())]
+    mismatches = np.count_nonzero(values != np.asarray(expected))
+    print("%-10s %d quantized pairs, %d mismatches" % (name, QUANTIZED, mismatches))
+    assert mismatches == 0, name + " array and scalar differ on quantized inputs"
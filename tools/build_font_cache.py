@@ -0,0 +1,133 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# build_font_cache.py
+# 2026-10-18 version 1.0
+
+# Build step: converts the BDF fonts in bundle/fonts to binary glyph files
+# (.aqgf) read by air_monitor_display.glyph_font. Only printable ASCII, the
+# degree sign, and the characters of the translation tables are kept.
+# Re-run after changing a font or adding a language.
+# Usage: python3 tools/build_font_cache.py [font.bdf ...]
+
+import os
+import sys
+import glob
+import json
+import struct
+
+BUNDLE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "bundle")
+sys.path.insert(0, BUNDLE)
+
+from air_monitor_display.glyph_font import (
+    MAGIC,
+    VERSION,
+    HEADER_FORMAT,
+    INDEX_FORMAT,
+)
+
+INTERPRETER = os.path.join(
+    BUNDLE, "cedargrove_unit_converter", "air_quality", "interpreter"
+)
+
+
+def ui_characters():
+    """Returns the set of code points the UI can display."""
+    text = "".join(chr(c) for c in range(0x20, 0x7F)) + "°"
+    for path in glob.glob(os.path.join(INTERPRETER, "english_to_*.json")):
+        with open(path, encoding="utf-8") as data_file:
+            table = json.load(data_file)
+        text += "".join(table) + "".join(table.values())
+    for path in glob.glob(os.path.join(INTERPRETER, "english_to_*.py")):
+        name = os.path.basename(path)[:-3]
+        module = __import__(
+            "cedargrove_unit_converter.air_quality.interpreter." + name,
+            None,
+            None,
+            ["interpret"],
+        )
+        table = getattr(module, "ENG_" + name[len("english_to_") :].upper())
+        text += "".join(table) + "".join(table.values())
+    return set(ord(c) for c in text)
+
+
+def read_bdf(path, code_points):
+    """Returns the font properties and the (code point, BBX, DWIDTH, rows)
+    glyphs of a BDF file that are in code_points."""
+    properties = {}
+    glyphs = []
+    with open(path, encoding="latin-1") as bdf:
+        lines = iter(bdf.read().splitlines())
+    for line in lines:
+        fields = line.split()
+        if not fields:
+            continue
+        if fields[0] in ("FONTBOUNDINGBOX", "FONT_ASCENT", "FONT_DESCENT"):
+            properties[fields[0]] = [int(v) for v in fields[1:]]
+        elif fields[0] == "STARTCHAR":
+            glyph = {}
+            for line in lines:
+                fields = line.split()
+                if fields[0] == "ENCODING":
+                    glyph["code_point"] = int(fields[1])
+                elif fields[0] == "DWIDTH":
+                    glyph["shift_x"] = int(fields[1])
+                elif fields[0] == "BBX":
+                    glyph["bbx"] = [int(v) for v in fields[1:5]]
+                elif fields[0] == "BITMAP":
+                    rows = []
+                    for line in lines:
+                        if line.strip() == "ENDCHAR":
+                            break
+                        rows.append(bytes.fromhex(line.strip()))
+                    glyph["rows"] = rows
+                    break
+            if glyph["code_point"] in code_points:
+                glyphs.append(glyph)
+    return properties, glyphs
+
+
+def build(bdf_path, code_points):
+    """Write the glyph file for a BDF font; returns the output path."""
+    properties, glyphs = read_bdf(bdf_path, code_points)
+    glyphs.sort(key=lambda glyph: glyph["code_point"])
+    index = b""
+    bitmaps = b""
+    for glyph in glyphs:
+        width, height, dx, dy = glyph["bbx"]
+        row_bytes = (width + 7) // 8
+        index += struct.pack(
+            INDEX_FORMAT, glyph["code_point"], width, height, dx, dy, glyph["shift_x"]
+        )
+        for row in glyph["rows"][:height]:
+            bitmaps += row[:row_bytes].ljust(row_bytes, b"\x00")
+    header = struct.pack(
+        HEADER_FORMAT,
+        MAGIC,
+        VERSION,
+        len(glyphs),
+        *properties["FONTBOUNDINGBOX"],
+        properties["FONT_ASCENT"][0],
+        properties["FONT_DESCENT"][0],
+    )
+    out_path = bdf_path[: -len(".bdf")] + ".aqgf"
+    with open(out_path, "wb") as out_file:
+        out_file.write(header + index + bitmaps)
+    print(
+        "%-24s %6d bytes -> %-26s %6d bytes, %3d glyphs"
+        % (
+            os.path.basename(bdf_path),
+            os.path.getsize(bdf_path),
+            os.path.basename(out_path),
+            os.path.getsize(out_path),
+            len(glyphs),
+        )
+    )
+    return out_path
+
+
+if __name__ == "__main__":
+    fonts = sys.argv[1:] or sorted(glob.glob(os.path.join(BUNDLE, "fonts", "*.bdf")))
+    characters = ui_characters()
+    for font in fonts:
+        build(font, characters)
@@ -0,0 +1,124 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# evaluate_sampling.py
+# 2026-10-18 version 1.0
+
+# Host-side evaluation of the adaptive measurement interval against fixed
+# intervals. Runs the monitor's acquisition logic (poll data_available every
+# 0.5 s once a measurement is due, then reprogram the interval) against the
+# simulated SCD-30 on a crowded meeting room CO2 curve, and reports I2C
+# transactions per hour and the delay from the true CO2 level crossing the
+# alarm threshold to the first alarming reading.
+# Usage: python3 tools/evaluate_sampling.py [days] [--alarm ppm]
+
+import os
+import sys
+import argparse
+
+BUNDLE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "bundle")
+sys.path.insert(0, BUNDLE)
+
+import air_monitor_hal.simulated as hal
+from air_monitor_sampling import AdaptiveSampler
+
+POLL_PERIOD = 0.5  # sensor_task period, seconds
+
+parser = argparse.ArgumentParser()
+parser.add_argument("days", type=float, nargs="?", default=7)
+parser.add_argument("--alarm", type=int, default=2500, help="alarm threshold, ppm")
+parser.add_argument("--occupants", type=int, default=10)
+parser.add_argument("--room", type=float, default=40, help="room volume, m3")
+args = parser.parse_args()
+duration = args.days * 86400
+
+
+def room(seed, noise=10):
+    return hal.synthetic_co2(
+        seed, occupants=args.occupants, room_m3=args.room, noise=noise
+    )
+
+
+def alarm_crossings():
+    """Times the noise-free CO2 level rises through the alarm threshold."""
+    source = room(1, noise=0)
+    crossings = []
+    armed = True
+    t = 0.0
+    while t < duration:
+        co2 = source(t)[0]
+        if armed and co2 >= args.alarm:
+            crossings.append(t)
+            armed = False
+        elif co2 < args.alarm - 100:
+            armed = True
+        t += 1.0
+    return crossings
+
+
+def run(sampler=None, interval=10):
+    """Simulate acquisition with a fixed interval, or adaptively when a
+    sampler is given; returns (sensor, reading times, CO2 values)."""
+    hal.clock.now = 0.0
+    scd = hal.FakeSCD30(source=room(1))
+    if sampler:
+        interval = sampler.interval
+    scd.measurement_interval = interval
+    times = []
+    values = []
+    t0 = -interval
+    while hal.clock.now < duration:
+        if hal.clock.now - t0 >= interval and scd.data_available:
+            t0 = hal.clock.now
+            times.append(t0)
+            co2 = scd.read_measurement()[0]
+            values.append(co2)
+            if sampler:
+                new_interval = sampler.update(co2, t0)
+                if new_interval != interval:
+                    interval = scd.measurement_interval = new_interval
+        hal.clock.advance(POLL_PERIOD)
+    return scd, times, values
+
+
+def latencies(crossings, times, values):
+    """Seconds from each true crossing to the first reading at or above the
+    alarm threshold."""
+    delays = []
+    i = 0
+    for crossing in crossings:
+        while i < len(times) and (times[i] < crossing or values[i] < args.alarm):
+            i += 1
+        if i < len(times):
+            delays.append(times[i] - crossing)
+    return delays
+
+
+crossings = alarm_crossings()
+print(
+    "%.1f days, %d alarm crossings at %d ppm (%d occupants, %.0f m3)"
+    % (args.days, len(crossings), args.alarm, args.occupants, args.room)
+)
+print(
+    "%-22s %10s %14s %12s %12s"
+    % ("policy", "readings/h", "I2C trans./h", "mean delay", "max delay")
+)
+policies = [("fixed %d s" % s, None, s) for s in (2, 10, 60, 300)]
+policies += [
+    ("adaptive 2-%d s" % s, AdaptiveSampler(args.alarm, 2, s), None)
+    for s in (60, 300, 1800)
+]
+hours = duration / 3600
+for name, sampler, interval in policies:
+    scd, times, values = run(sampler, interval)
+    delays = latencies(crossings, times, values) or [float("nan")]
+    print(
+        "%-22s %10.1f %14.1f %10.1f s %10.1f s"
+        % (
+            name,
+            len(times) / hours,
+            scd.i2c_transactions / hours,
+            sum(delays) / len(delays),
+            max(delays),
+        )
+    )
@@ -0,0 +1,92 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# profile_report.py
+# 2026-10-18 version 1.0
+
+# Host-side aggregator for the monitor's PROFILE report lines (see
+# bundle/air_monitor_profiler.py) collected from one or more devices: serial
+# console captures or PROFILE_LOG files. Other lines are ignored. Devices
+# are told apart by their unique ID (the CPU UID); for each section, stage,
+# and board type it shows the number of devices and runs, the mean stage
+# time over all runs, the spread of the per-device means, and the worst
+# single run. Reports with no device ID, including those in the older
+# format that had only the board type, are attributed to their file.
+# Usage: python3 tools/profile_report.py capture1.txt [capture2.txt ...]
+
+import sys
+import statistics
+
+
+def read_reports(paths):
+    """Returns {(section, stage, board): {device: [count, total us, max us]}}
+    and the stage keys in first-seen order."""
+    stages = {}
+    order = []
+    for path in paths:
+        with open(path, errors="replace") as capture:
+            for line in capture:
+                fields = line.strip().split(",")
+                if fields[0] != "PROFILE" or len(fields) not in (7, 8):
+                    continue
+                if len(fields) == 7:  # Older format: board type, no device ID
+                    fields.insert(1, "")
+                device = fields[1] or path
+                board = fields[2].split(" with ")[0] or "?"  # Drop the chip name
+                key = (fields[3], fields[4], board)
+                count, total, longest = (int(v) for v in fields[5:])
+                if key not in stages:
+                    stages[key] = {}
+                    order.append(key)
+                stats = stages[key].setdefault(device, [0, 0, 0])
+                stats[0] += count
+                stats[1] += total
+                stats[2] = max(stats[2], longest)
+    return stages, order
+
+
+def print_summary(stages, order):
+    print(
+        "%-6s %-16s %-24s %7s %8s %10s %10s %10s %10s"
+        % (
+            "",
+            "stage",
+            "board",
+            "devices",
+            "runs",
+            "mean ms",
+            "fastest",
+            "slowest",
+            "max ms",
+        )
+    )
+    for key in sorted(order, key=lambda k: (k[0], order.index(k))):
+        devices = stages[key]
+        runs = sum(stats[0] for stats in devices.values())
+        total = sum(stats[1] for stats in devices.values())
+        means = [stats[1] / stats[0] for stats in devices.values()]
+        print(
+            "%-6s %-16s %-24s %7d %8d %10.2f %10.2f %10.2f %10.2f"
+            % (
+                key[0],
+                key[1],
+                key[2][:24],
+                len(devices),
+                runs,
+                total / runs / 1000,
+                min(means) / 1000,
+                max(means) / 1000,
+                max(stats[2] for stats in devices.values()) / 1000,
+            )
+        )
+        if len(devices) > 2:
+            print(
+                "%-6s %-16s %-24s median device mean %.2f ms"
+                % ("", "", "", statistics.median(means) / 1000)
+            )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        sys.exit("Usage: python3 tools/profile_report.py capture.txt [...]")
+    print_summary(*read_reports(sys.argv[1:]))
@@ -0,0 +1,143 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+# simulate_monitor.py
+# 2026-10-18 version 1.0
+
+# Host-side load test: runs the monitor code.py against the simulated
+# hardware backend (air_monitor_hal.simulated) and drives the sensor update
+# path on a simulated clock. Needs the Blinka displayio packages:
+#   pip install adafruit-blinka-displayio adafruit-circuitpython-display-text \
+#       adafruit-circuitpython-display-shapes adafruit-circuitpython-bitmap-font
+# --pm adds the simulated PM2.5 sensor and its AQI gauge and reports the
+# time per display update for each sensor. --board imitates a supported
+# board's features and display size (air_monitor_boards); by default, the
+# first one with the --size display, or the PyPortal. Before the run it
+# checks that a button press schedules a display frame for its feedback.
+# Usage: python3 tools/simulate_monitor.py [hours] [--csv log.csv] [--pm]
+#        [--size WxH] [--board name] [--profile]
+
+import os
+import sys
+import time
+import runpy
+import asyncio
+import argparse
+import cProfile
+import pstats
+
+BUNDLE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "bundle")
+sys.path.insert(0, BUNDLE)
+
+import air_monitor_hal.simulated as hal
+import co2_mon_config
+from air_monitor_boards import BOARD_PROFILES
+
+parser = argparse.ArgumentParser(description=__doc__)
+parser.add_argument("hours", type=float, nargs="?", default=1000)
+parser.add_argument("--csv", help="replay a seconds,co2,rh,temp log")
+parser.add_argument("--size", help="display WxH; default the board's")
+parser.add_argument("--board", help="board to imitate; default by --size")
+parser.add_argument("--pm", action="store_true", help="add a PM2.5 sensor")
+parser.add_argument("--profile", action="store_true")
+args = parser.parse_args()
+
+if args.csv:
+    hal.sensor_source = hal.replay_csv(args.csv)
+width = height = None
+if args.size:
+    width, height = (int(v) for v in args.size.split("x"))
+if args.board is None:  # A supported board with the display size
+    sizes = {
+        (p.width, p.height): p.match
+        for p in reversed(BOARD_PROFILES)
+        if p.match != hal.board_type
+    }
+    args.board = sizes.get((width, height), "PyPortal")
+profile = hal.simulate_board(args.board, width, height)
+print("Imitating %s, %dx%d" % (args.board, profile.width, profile.height))
+if args.pm:
+    co2_mon_config.PM_SENSOR = "i2c"
+
+monitor = runpy.run_path(os.path.join(BUNDLE, "code.py"), run_name="co2_monitor")
+update = monitor["update_co2_image_frame"]
+interval = monitor["SENSOR_INTERVAL"]
+steps = int(args.hours * 3600 / interval)
+update_pm = monitor["update_pm_frame"] if args.pm else None
+pm_interval = monitor["PM_INTERVAL"]
+frames = monitor["frames"]
+frames.start()
+
+# A button press must schedule a frame for its feedback; with auto_refresh
+# off nothing else would show it
+hal.clock.advance(1)
+frames.refresh()
+assert not frames.pending
+pins = monitor["panel"].pins
+pins["calibrate"].press()
+for _ in range(2):  # The second poll is past the debounce time
+    asyncio.run(monitor["input_task"]())
+    hal.clock.advance(0.1)
+assert frames.pending, "button press did not schedule a display frame"
+pins["calibrate"].release()
+for _ in range(2):
+    asyncio.run(monitor["input_task"]())
+    hal.clock.advance(0.1)
+hal.clock.advance(1)
+frames.refresh()
+
+update_time = [0.0, 0.0]  # CO2 and PM2.5 display update seconds
+
+
+def run():
+    for _ in range(steps):
+        if update_pm:
+            # PM2.5 updates between CO2 measurements, as the tasks would
+            for _ in range(max(int(interval / pm_interval), 1)):
+                hal.clock.advance(min(pm_interval, interval))
+                t = time.perf_counter()
+                update_pm()
+                update_time[1] += time.perf_counter() - t
+                frames.refresh()
+        else:
+            hal.clock.advance(interval)
+        t = time.perf_counter()
+        update()
+        update_time[0] += time.perf_counter() - t
+        frames.refresh()
+
+
+t0 = time.perf_counter()
+if args.profile:
+    profiler = cProfile.Profile()
+    profiler.runcall(run)
+else:
+    run()
+elapsed = time.perf_counter() - t0
+
+print(
+    "%.0f simulated hours (%d samples) in %.2f s: %.0f monitor-hours/minute"
+    % (args.hours, steps, elapsed, args.hours / elapsed * 60)
+)
+labels = monitor["CachedLabel"]
+print(
+    "labels: %d relayouts, %d skipped (%.0f skipped/simulated hour)"
+    % (labels.relayouts, labels.skipped, labels.skipped / max(args.hours, 1e-9))
+)
+frame_count, fps, refresh_ms, _ = frames.stats()
+print(
+    "display: %d refreshes (%.2f per simulated minute), auto_refresh %s"
+    % (hal.display.refreshes, fps * 60, hal.display.auto_refresh)
+)
+if args.pm:
+    pm_updates = steps * max(int(interval / pm_interval), 1)
+    print(
+        "update: CO2 %.2f ms, PM2.5 %.2f ms per call (%d PM2.5 calls)"
+        % (
+            update_time[0] / max(steps, 1) * 1000,
+            update_time[1] / max(pm_updates, 1) * 1000,
+            pm_updates,
+        )
+    )
+if args.profile:
+    pstats.Stats(profiler).sort_stats("cumulative").print_stats(20)